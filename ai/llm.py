@@ -1,15 +1,86 @@
 import os
+import getpass
+import hashlib
+import tempfile
+import threading
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # Load .env from project root (parent of ai/)
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
-openai_client = OpenAI(
-    base_url="https://openrouter.ai/api/v1",
-    api_key=os.environ.get("OPENROUTER_API_KEY"),
-    timeout=120.0  # 2 minute timeout for API calls
+LLM_MODEL = os.environ.get("LLM_MODEL", "google/gemini-3-flash-preview")
+
+# Concurrent LLM requests during extraction (1 = one document at a time)
+LLM_CONCURRENCY = int(os.environ.get("LLM_CONCURRENCY", "4"))
+
+# Stream responses so extracted items show up while the LLM is still generating
+LLM_STREAM = os.environ.get("LLM_STREAM", "true").lower() == "true"
+
+# Shared LLM response cache directory (projects default to .tender_state/llm_cache)
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR")
+
+# Provider limits for the API key, enforced across threads and processes
+LLM_REQUESTS_PER_MINUTE = float(os.environ["LLM_REQUESTS_PER_MINUTE"]) if os.environ.get("LLM_REQUESTS_PER_MINUTE") else None
+LLM_TOKENS_PER_MINUTE = float(os.environ["LLM_TOKENS_PER_MINUTE"]) if os.environ.get("LLM_TOKENS_PER_MINUTE") else None
+# Per user, so a file created by another account is never opened read-only
+_USER_ID = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+LLM_RATE_LIMIT_FILE = os.environ.get(
+    "LLM_RATE_LIMIT_FILE", os.path.join(tempfile.gettempdir(), f"tender_llm_rate_limit-{_USER_ID}.sqlite")
 )
 
-LLM_MODEL = os.environ.get("LLM_MODEL", "google/gemini-3-flash-preview")
+_client = None
+_client_lock = threading.Lock()
+
+
+def _client_options() -> dict:
+    return {
+        "base_url": "https://openrouter.ai/api/v1",
+        "api_key": os.environ.get("OPENROUTER_API_KEY"),
+        "timeout": 120.0,  # 2 minute timeout for API calls
+        "max_retries": 0,  # Retried by RequirementExtractor, which honours the shared rate limiter
+    }
+
+
+def get_openai_client():
+    """Create the OpenRouter client on first use (importing openai is slow)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(**_client_options())
+    return _client
+
+
+def create_async_openai_client():
+    """
+    Create an async OpenRouter client.
+
+    Not shared like the sync client: an async client must be used on a
+    single event loop, so callers create one per run and close it.
+    """
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(**_client_options())
+
+
+class _LazyClient:
+    """Stands in for the OpenAI client until an attribute is first used."""
+
+    def __getattr__(self, name):
+        return getattr(get_openai_client(), name)
+
+
+openai_client = _LazyClient()
+
+
+def create_rate_limiter(requests_per_minute=LLM_REQUESTS_PER_MINUTE, tokens_per_minute=LLM_TOKENS_PER_MINUTE):
+    """Rate limiter shared by every process using the same API key on this machine."""
+    from core.rate_limit import RateLimiter, RateLimits
+
+    api_key = os.environ.get("OPENROUTER_API_KEY") or ""
+    return RateLimiter(
+        LLM_RATE_LIMIT_FILE,
+        RateLimits(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute),
+        name=hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    )
@@ -1,25 +1,40 @@
 """Extraction service — wraps core extraction pipeline for web use."""
 
-import os
-import tempfile
+import time
 from datetime import datetime, timezone
 
-from core.document_reader import DocumentReader
+from core.document_reader import get_default_reader
 from core.extractor import RequirementExtractor
+from core.extraction_engine import AsyncExtractionEngine
+from core.llm_cache import LLMCache
+from core.normalize import normalize_document
 from core.logging_config import get_logger
-from ai.llm import openai_client, LLM_MODEL
+from ai.llm import (
+    openai_client, create_async_openai_client, create_rate_limiter,
+    LLM_MODEL, LLM_CONCURRENCY, LLM_STREAM, LLM_CACHE_DIR
+)
 from .graph_service import GraphService
 
 logger = get_logger("extraction_service")
 
+STREAM_UPDATE_INTERVAL = 1.0  # Seconds between job updates for streamed items
+
 
 class ExtractionService:
     """Runs the AI extraction pipeline, writing results to Supabase."""
 
     def __init__(self, supabase_client):
         self.db = supabase_client
-        self.reader = DocumentReader()
-        self.extractor = RequirementExtractor(openai_client, model=LLM_MODEL)
+        # Parse in a subprocess so a malformed file cannot hang or crash the job thread
+        self.reader = get_default_reader(isolated=True)
+        self.llm_cache = LLMCache(LLM_CACHE_DIR) if LLM_CACHE_DIR else None
+        self.extractor = RequirementExtractor(
+            openai_client,
+            model=LLM_MODEL,
+            cache=self.llm_cache,
+            rate_limiter=create_rate_limiter(),
+            stream=LLM_STREAM
+        )
         self.graph_service = GraphService(supabase_client)
 
     def run_extraction(self, project_id: str, job_id: str, force_full: bool = False):
@@ -49,6 +64,9 @@ class ExtractionService:
 
             # Build document ID map (filename -> UUID)
             doc_id_map = {}
+            seen_hashes = {}  # content hash -> filename of the copy that was extracted
+            to_extract = []   # documents for the LLM, extracted concurrently below
+            aliases = []      # (filename, filename of the identical extracted copy)
             processed = 0
             errors = []
 
@@ -56,18 +74,23 @@ class ExtractionService:
                 try:
                     self._update_job(
                         job_id,
-                        current_step=f"Processing: {doc_row['filename']}",
+                        current_step=f"Reading: {doc_row['filename']}",
                         processed_documents=processed,
                         progress=processed / total,
                     )
 
                     # Skip if already processed and not force_full
                     if not force_full and doc_row.get("content_hash"):
+                        if doc_row["content_hash"] in seen_hashes:
+                            logger.debug(f"Skipping identical copy: {doc_row['filename']}")
+                            processed += 1
+                            continue
                         existing_nodes = self.db.table("nodes") \
                             .select("id") \
                             .eq("document_id", doc_row["id"]) \
                             .execute()
                         if existing_nodes.data:
+                            seen_hashes[doc_row["content_hash"]] = doc_row["filename"]
                             processed += 1
                             continue
 
@@ -78,15 +101,23 @@ class ExtractionService:
                         processed += 1
                         continue
 
-                    # Extract requirements using AI
-                    result = self.extractor.extract(content, graph)
+                    import hashlib
+                    text_hash = hashlib.md5(content.text.encode()).hexdigest()
+
+                    if text_hash in seen_hashes:
+                        # Identical to a document being extracted: record it as an alias afterwards
+                        original = seen_hashes[text_hash]
+                        logger.info(f"{doc_row['filename']} is identical to {original}, skipping extraction")
+                        aliases.append((doc_row["filename"], original))
+                        processed += 1
+                    else:
+                        to_extract.append(content)
+                        seen_hashes[text_hash] = doc_row["filename"]
 
                     # Map this document filename to its UUID
                     doc_id_map[doc_row["filename"]] = doc_row["id"]
 
                     # Update content hash
-                    import hashlib
-                    text_hash = hashlib.md5(content.text.encode()).hexdigest()
                     self.db.table("documents") \
                         .update({"content_hash": text_hash, "extracted_text": content.text[:50000]}) \
                         .eq("id", doc_row["id"]) \
@@ -95,10 +126,51 @@ class ExtractionService:
                 except Exception as e:
                     logger.error(f"Error processing {doc_row['filename']}: {e}")
                     errors.append(f"{doc_row['filename']}: {str(e)}")
+                    processed += 1
+
+            # Extract requirements using AI, several documents at a time
+            already_processed = processed
+
+            def progress(current, _total, name):
+                self._update_job(
+                    job_id,
+                    current_step=f"Extracted: {name}",
+                    processed_documents=already_processed + current,
+                    progress=(already_processed + current) / total,
+                )
+
+            streamed = {"items": 0, "updated": 0.0}
+
+            def item_streamed(name, item):
+                # Items arrive while documents are still being generated; show them without
+                # writing the job row for every single one
+                streamed["items"] += 1
+                now = time.monotonic()
+                if now - streamed["updated"] >= STREAM_UPDATE_INTERVAL:
+                    streamed["updated"] = now
+                    self._update_job(
+                        job_id,
+                        current_step=f"Extracting: {name} ({streamed['items']} items so far, "
+                                     f"latest: {item.get('title', '')})",
+                    )
+
+            # A run's engine owns the item callback for this job
+            engine = AsyncExtractionEngine(
+                self.extractor, create_async_openai_client,
+                concurrency=LLM_CONCURRENCY, item_callback=item_streamed
+            )
+            engine.extract_documents(to_extract, graph, progress_callback=progress)
+            if self.llm_cache is not None:
+                self.llm_cache.flush()
 
-                processed += 1
+            for filename, original in aliases:
+                for node in graph.get_nodes_by_document(original):
+                    node_aliases = node.metadata.setdefault("source_aliases", [])
+                    if filename not in node_aliases:
+                        node_aliases.append(filename)
 
             # Resolve cross-document placeholder references
+            self._update_job(job_id, current_step="Resolving placeholder references")
             self.extractor._resolve_placeholders(graph)
 
             # Save the complete graph to DB
@@ -134,21 +206,9 @@ class ExtractionService:
             storage_path = doc_row["storage_path"]
             file_bytes = self.db.storage.from_("documents").download(storage_path)
 
-            # Write to temp file for DocumentReader
-            suffix = os.path.splitext(doc_row["filename"])[1]
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                tmp.write(file_bytes)
-                tmp_path = tmp.name
-
-            try:
-                from core.document_reader import read_document
-                content = read_document(tmp_path)
-                # Override temp path with original filename so nodes get correct source_document
-                content.path = doc_row["filename"]
-                content.filename = doc_row["filename"]
-                return content
-            finally:
-                os.unlink(tmp_path)
+            # Read in memory; the filename becomes the path so nodes get the right source_document
+            content = self.reader.read_bytes(file_bytes, doc_row["filename"])
+            return normalize_document(content)
 
         except Exception as e:
             logger.error(f"Failed to download {doc_row['filename']}: {e}")
@@ -10,7 +10,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from app import create_app
 
-app = create_app()
-
+# Only create the app when run directly: isolated parser workers are spawned
+# processes that re-import this module. WSGI servers use run:create_app().
 if __name__ == "__main__":
+    app = create_app()
     app.run(host="0.0.0.0", port=5001, debug=app.config["DEBUG"])
@@ -0,0 +1,277 @@
+"""
+Synthetic Tender Corpus
+
+Generates reproducible tender bundles for benchmarking document ingestion:
+multi-page PDFs, DOCX forms with tables and checkboxes, XLSX price sheets,
+GAEB DA XML bills of quantities and nested ZIP archives. The same seed and
+scale always produce byte-identical files.
+
+Usage:
+    python benchmarks/corpus.py OUTPUT_DIR [--scale N] [--seed N]
+"""
+
+import io
+import random
+import zipfile
+import argparse
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Fixed timestamp so generated ZIP containers are byte-identical across runs
+ZIP_DATE = (2026, 1, 1, 0, 0, 0)
+
+WORDS = (
+    "Auftragnehmer Auftraggeber Leistung Angebot Nachweis Eignung Referenz Frist "
+    "Vergabestelle Bieter Unterlagen Erklärung Formblatt Nachunternehmer Ausführung "
+    "Gewährleistung Sicherheitsleistung Vertragsstrafe Abnahme Baustelle Termin "
+    "Preisblatt Mindestlohn Tariftreue Versicherung Haftpflicht Zertifikat"
+).split()
+
+VERBS = "ist vorzulegen sind einzureichen wird gefordert muss erfüllen hat nachzuweisen".split(" ")
+
+UNITS = ["m", "m2", "m3", "Stk", "psch", "h", "t", "kg"]
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return f"Der {text} {rng.choice(VERBS)}."
+
+
+def _write_zip(path_or_buffer, members: dict[str, bytes]):
+    with zipfile.ZipFile(path_or_buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+        for name, data in members.items():
+            z.writestr(zipfile.ZipInfo(name, date_time=ZIP_DATE), data, zipfile.ZIP_DEFLATED)
+
+
+# --- PDF -----------------------------------------------------------------
+
+def _pdf_string(text: str) -> str:
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def make_pdf(rng: random.Random, pages: int, lines_per_page: int = 40) -> bytes:
+    """A PDF with a repeated header/footer and body text on every page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages, filled in once the kids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for page_no in range(1, pages + 1):
+        lines = ["Stadt Musterhausen - Vergabeunterlagen - Vergabe-Nr. 2026/0815"]
+        lines.append(f"Abschnitt {page_no}: " + _sentence(rng, 6))
+        lines += [_sentence(rng, rng.randint(8, 16)) for _ in range(lines_per_page)]
+        lines.append(f"Seite {page_no} von {pages}")
+
+        stream = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"{_pdf_string(line)} Tj T*" for line in lines) + " ET"
+        stream_bytes = stream.encode("cp1252", errors="replace")
+        content_id = len(objects) + 2
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        kids.append(f"{len(objects)} 0 R")
+        objects.append(f"<< /Length {len(stream_bytes)} >>\nstream\n".encode() + stream_bytes + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects):
+        offsets.append(out.tell())
+        out.write(f"{i + 1} 0 obj\n".encode() + obj + b"\nendobj\n")
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+# --- DOCX ----------------------------------------------------------------
+
+_W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_W14 = 'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml"'
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+
+
+def _docx_paragraph(text: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def _docx_checkbox(label: str, checked: bool) -> str:
+    glyph = "☒" if checked else "☐"
+    return (
+        '<w:p><w:sdt><w:sdtPr><w14:checkbox>'
+        f'<w14:checked w14:val="{int(checked)}"/>'
+        '<w14:checkedState w14:val="2612" w14:font="MS Gothic"/>'
+        '<w14:uncheckedState w14:val="2610" w14:font="MS Gothic"/>'
+        f'</w14:checkbox></w:sdtPr><w:sdtContent><w:r><w:t>{glyph}</w:t></w:r></w:sdtContent></w:sdt>'
+        f'<w:r><w:t xml:space="preserve"> {escape(label)}</w:t></w:r></w:p>'
+    )
+
+
+def _docx_table(rows: list[list[str]]) -> str:
+    body = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{_docx_paragraph(cell)}</w:tc>" for cell in row) + "</w:tr>"
+        for row in rows
+    )
+    return f"<w:tbl>{body}</w:tbl>"
+
+
+def make_docx(rng: random.Random, sections: int, table_rows: int = 12) -> bytes:
+    """A Formblatt: instructions, a table and checkboxes per section."""
+    body = []
+    for section in range(1, sections + 1):
+        body.append(_docx_paragraph(f"{section}. " + _sentence(rng, 5)))
+        body += [_docx_paragraph(_sentence(rng)) for _ in range(rng.randint(2, 5))]
+        rows = [["Nr.", "Angabe", "Wert", "Nachweis"]]
+        rows += [[str(r), _sentence(rng, 3), f"{rng.randint(1, 9999)}", rng.choice(WORDS)] for r in range(table_rows)]
+        body.append(_docx_table(rows))
+        for _ in range(3):
+            body.append(_docx_checkbox(_sentence(rng, 4), rng.random() < 0.5))
+
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document {_W} {_W14}><w:body>{"".join(body)}</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    _write_zip(buffer, {
+        "[Content_Types].xml": _CONTENT_TYPES.encode(),
+        "_rels/.rels": _RELS.encode(),
+        "word/document.xml": document.encode("utf-8"),
+    })
+    return buffer.getvalue()
+
+
+# --- XLSX ----------------------------------------------------------------
+
+def make_xlsx(rng: random.Random, rows: int, sheets: int = 2) -> bytes:
+    """A price sheet workbook (Preisblatt) written with openpyxl."""
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet_no in range(1, sheets + 1):
+        sheet = workbook.create_sheet(f"Los {sheet_no}")
+        sheet.append(["OZ", "Kurztext", "Menge", "Einheit", "EP", "GP"])
+        for r in range(1, rows + 1):
+            quantity = rng.randint(1, 500)
+            price = round(rng.uniform(1, 900), 2)
+            sheet.append([f"{sheet_no:02d}.{r:04d}", _sentence(rng, 4), quantity, rng.choice(UNITS), price, None])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    # openpyxl stamps the current time into docProps; rewrite with fixed dates
+    source = zipfile.ZipFile(io.BytesIO(buffer.getvalue()))
+    members = {name: source.read(name) for name in source.namelist() if name != "docProps/core.xml"}
+    out = io.BytesIO()
+    _write_zip(out, members)
+    return out.getvalue()
+
+
+# --- GAEB ----------------------------------------------------------------
+
+def make_gaeb(rng: random.Random, categories: int, positions: int) -> bytes:
+    """A GAEB DA XML X83 bill of quantities."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<GAEB xmlns="http://www.gaeb.de/GAEB_DA_XML/DA83/3.2">',
+        '<Award><DP>83</DP><BoQ><BoQInfo><Name>LV Rohbau</Name></BoQInfo><BoQBody>',
+    ]
+    for c in range(1, categories + 1):
+        parts.append(f'<BoQCtgy RNoPart="{c:02d}"><LblTx><p><span>{escape(_sentence(rng, 3))}</span></p></LblTx><BoQBody><Itemlist>')
+        for p in range(1, positions + 1):
+            parts.append(
+                f'<Item RNoPart="{p:04d}"><Qty>{rng.randint(1, 900)}.000</Qty><QU>{rng.choice(UNITS)}</QU>'
+                f'<Description><CompleteText><DetailTxt><Text><p><span>{escape(_sentence(rng))}</span></p>'
+                f'</Text></DetailTxt><OutlineText><OutlTxt><TextOutlTxt><p><span>{escape(_sentence(rng, 4))}</span></p>'
+                f'</TextOutlTxt></OutlTxt></OutlineText></CompleteText></Description></Item>'
+            )
+        parts.append('</Itemlist></BoQBody></BoQCtgy>')
+    parts.append('</BoQBody></BoQ></Award><PrjInfo><NamePrj>Neubau Feuerwache</NamePrj></PrjInfo></GAEB>')
+    return "".join(parts).encode("utf-8")
+
+
+# --- Corpus --------------------------------------------------------------
+
+def generate_corpus(output_dir: str, scale: int = 1, seed: int = 42) -> dict:
+    """
+    Write a synthetic tender bundle.
+
+    At scale 1 the bundle has 6 PDFs (30 pages), 10 DOCX forms (20 sections), 3 XLSX
+    price sheets (2 x 2000 rows), 2 GAEB files (10 x 100 positions) and
+    2 ZIP archives containing further documents and a nested ZIP. Higher
+    scales multiply the number of files, not their size.
+
+    Returns:
+        Manifest with the number of files and bytes per extension
+    """
+    rng = random.Random(seed)
+    root = Path(output_dir)
+    manifest: dict[str, dict] = {}
+
+    def write(relative: str, data: bytes):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        entry = manifest.setdefault(path.suffix.lower(), {"files": 0, "bytes": 0})
+        entry["files"] += 1
+        entry["bytes"] += len(data)
+
+    for i in range(6 * scale):
+        write(f"01_Vergabeunterlagen/Vergabeunterlagen_{i + 1:03d}.pdf", make_pdf(rng, pages=30))
+    for i in range(10 * scale):
+        write(f"02_Formblaetter/Formblatt_{i + 1:03d}.docx", make_docx(rng, sections=20))
+    for i in range(3 * scale):
+        write(f"03_Preisblaetter/Preisblatt_{i + 1:03d}.xlsx", make_xlsx(rng, rows=2000))
+    for i in range(2 * scale):
+        write(f"04_Leistungsverzeichnis/LV_{i + 1:03d}.x83", make_gaeb(rng, categories=10, positions=100))
+
+    for i in range(2 * scale):
+        nested = io.BytesIO()
+        _write_zip(nested, {
+            "Preisblatt_Nachtrag.xlsx": make_xlsx(rng, rows=500, sheets=1),
+            "Formblatt_Nachtrag.docx": make_docx(rng, sections=2),
+        })
+        archive = io.BytesIO()
+        _write_zip(archive, {
+            "Anlagen/Baubeschreibung.pdf": make_pdf(rng, pages=10),
+            "Anlagen/Formblatt_Eignung.docx": make_docx(rng, sections=3),
+            "Anlagen/Nachtraege.zip": nested.getvalue(),
+        })
+        write(f"05_Anlagen/Anlagen_{i + 1:03d}.zip", archive.getvalue())
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic tender corpus")
+    parser.add_argument("output", help="Directory to write the corpus to")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplier for the number of files")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.output, scale=args.scale, seed=args.seed)
+    for extension, entry in sorted(manifest.items()):
+        print(f"{extension:6} {entry['files']:5} files {entry['bytes'] / 1024 / 1024:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+DOCX Reader Benchmark
+
+Compares the streaming DOCX reader (core.docx_text) with the previous
+python-docx based extraction on a generated contract-sized document.
+
+Usage:
+    python benchmarks/docx_reader.py [--paragraphs N] [--tables N] [--runs N]
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.docx_text import read_docx_text
+
+
+def build_document(path: str, paragraphs: int, tables: int, rows: int = 20):
+    """Write a DOCX with paragraphs interleaved with tables."""
+    import docx
+
+    doc = docx.Document()
+    per_table = max(paragraphs // max(tables, 1), 1)
+    table_no = 0
+    for i in range(paragraphs):
+        doc.add_paragraph(
+            f"§ {i} Der Auftragnehmer hat die Leistung nach VOB/B und den "
+            f"Vorgaben dieses Abschnitts auszuführen und nachzuweisen."
+        )
+        if i % per_table == per_table - 1 and table_no < tables:
+            table_no += 1
+            table = doc.add_table(rows=rows, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"T{table_no} Z{r} S{c}"
+    doc.save(path)
+
+
+def read_with_python_docx(path: str) -> str:
+    """The extraction used before the streaming reader (tables appended at the end)."""
+    import docx
+
+    doc = docx.Document(path)
+    text_parts = [para.text for para in doc.paragraphs if para.text.strip()]
+    for table in doc.tables:
+        table_rows = []
+        for row in table.rows:
+            row_text = " | ".join(cell.text.strip() for cell in row.cells)
+            if row_text.strip():
+                table_rows.append(row_text)
+        if table_rows:
+            text_parts.append("\n[TABLE]\n" + "\n".join(table_rows) + "\n[/TABLE]")
+    return "\n\n".join(text_parts)
+
+
+def read_streaming(path: str) -> str:
+    return read_docx_text(path).text
+
+
+def best_of(func, path: str, runs: int) -> tuple[float, str]:
+    """Fastest wall time over several runs, plus the extracted text."""
+    best = float("inf")
+    text = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        text = func(path)
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DOCX text extraction")
+    parser.add_argument("--paragraphs", type=int, default=5000, help="Paragraphs in the generated document")
+    parser.add_argument("--tables", type=int, default=200, help="Tables (20 rows x 4 columns each)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per reader; the fastest is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "contract.docx")
+        build_document(path, args.paragraphs, args.tables)
+        size_mb = Path(path).stat().st_size / 1024 / 1024
+        print(f"Document: {args.paragraphs} paragraphs, {args.tables} tables, {size_mb:.1f} MB")
+
+        old_time, old_text = best_of(read_with_python_docx, path, args.runs)
+        new_time, new_text = best_of(read_streaming, path, args.runs)
+
+    print(f"python-docx: {old_time:.2f}s ({len(old_text)} chars)")
+    print(f"streaming:   {new_time:.2f}s ({len(new_text)} chars)")
+    print(f"Speedup:     {old_time / new_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
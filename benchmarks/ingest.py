@@ -0,0 +1,195 @@
+"""
+Ingestion Benchmark
+
+Measures document ingestion on a synthetic tender corpus (benchmarks/corpus.py):
+files/sec, MB/sec and peak RSS per format, plus whole-corpus runs of
+DocumentReader.read_directory and read_all_documents. Every measurement runs
+in a fresh process so peak RSS is not inherited from earlier runs. Results
+can be saved as JSON and compared against an earlier run.
+
+Usage:
+    python benchmarks/ingest.py [--corpus DIR | --scale N] [--workers 1 4]
+                                [--output results.json] [--compare baseline.json]
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import platform
+import tempfile
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import generate_corpus
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process and its (reaped) children."""
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(task: str, directory: str, extension: str, workers: int) -> dict:
+    """Run one measurement; executed in a fresh worker process."""
+    from core.document_reader import DocumentReader, read_all_documents
+
+    reader = DocumentReader()
+    start = time.perf_counter()
+    if task == "format":
+        paths = sorted(str(p) for p in Path(directory).rglob(f"*{extension}"))
+        if extension == ".zip":
+            documents = [doc for path in paths for doc in reader.read_archive(path, workers=workers)]
+        else:
+            documents = reader.read_many(paths, workers=workers)
+    elif task == "read_directory":
+        documents = reader.read_directory(directory, workers=workers, archives=True)
+    else:
+        documents = read_all_documents(directory, workers=workers)
+    seconds = time.perf_counter() - start
+
+    return {
+        "seconds": seconds,
+        "documents": len(documents),
+        "errors": sum(1 for doc in documents if doc.error),
+        "chars": sum(len(doc.text) for doc in documents),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _measure_to_pipe(conn, *args):
+    try:
+        conn.send(_measure(*args))
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+def run_isolated(task: str, directory: str, extension: str = "", workers: int = 1) -> dict:
+    """Run _measure in a new spawned process (not daemonic, so it may start a pool)."""
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_to_pipe, args=(child_conn, task, directory, extension, workers))
+    process.start()
+    child_conn.close()
+    result = parent_conn.recv()
+    process.join()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def _rates(result: dict, files: int, size: int) -> dict:
+    seconds = max(result["seconds"], 1e-9)
+    return {
+        **result,
+        "files": files,
+        "bytes": size,
+        "files_per_sec": files / seconds,
+        "mb_per_sec": size / 1024 / 1024 / seconds,
+    }
+
+
+def run_benchmark(corpus: str, workers: list[int]) -> dict:
+    """
+    Benchmark every format and both whole-corpus entry points.
+
+    Returns:
+        Dictionary with per-format and per-run measurements
+    """
+    files = [p for p in Path(corpus).rglob("*") if p.is_file()]
+    by_extension: dict[str, list[Path]] = {}
+    for path in files:
+        by_extension.setdefault(path.suffix.lower(), []).append(path)
+    total_bytes = sum(p.stat().st_size for p in files)
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "corpus": {"path": str(corpus), "files": len(files), "bytes": total_bytes},
+        "formats": {},
+        "runs": {},
+    }
+
+    for w in workers:
+        for extension, paths in sorted(by_extension.items()):
+            size = sum(p.stat().st_size for p in paths)
+            result = run_isolated("format", corpus, extension, w)
+            results["formats"][f"{extension}[workers={w}]"] = _rates(result, len(paths), size)
+
+        result = run_isolated("read_directory", corpus, workers=w)
+        results["runs"][f"read_directory[workers={w}]"] = _rates(result, len(files), total_bytes)
+
+        result = run_isolated("read_all_documents", corpus, workers=w)
+        results["runs"][f"read_all_documents[workers={w}]"] = _rates(result, len(files), total_bytes)
+
+    return results
+
+
+def print_results(results: dict, baseline: dict = None):
+    """Print a table, with changes against a baseline run when given."""
+    print(f"Corpus: {results['corpus']['files']} files, {results['corpus']['bytes'] / 1024 / 1024:.1f} MB")
+    header = f"{'':32} {'files/s':>9} {'MB/s':>8} {'peak MB':>8} {'docs':>6} {'errors':>6}"
+    if baseline:
+        header += f" {'time vs base':>13} {'RSS vs base':>12}"
+    print(header)
+
+    for section in ("formats", "runs"):
+        for name, entry in results[section].items():
+            line = (f"{name:32} {entry['files_per_sec']:9.1f} {entry['mb_per_sec']:8.2f} "
+                    f"{entry['peak_rss_mb']:8.0f} {entry['documents']:6} {entry['errors']:6}")
+            previous = (baseline or {}).get(section, {}).get(name)
+            if previous:
+                time_change = entry["seconds"] / max(previous["seconds"], 1e-9) - 1
+                rss_change = entry["peak_rss_mb"] / max(previous["peak_rss_mb"], 1e-9) - 1
+                line += f" {time_change:+12.1%} {rss_change:+12.1%}"
+            elif baseline:
+                line += f" {'n/a':>13} {'n/a':>12}"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark document ingestion")
+    parser.add_argument("--corpus", help="Existing corpus directory (generated into a temp dir if omitted)")
+    parser.add_argument("--scale", type=int, default=1, help="Scale of the generated corpus")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the generated corpus")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1], help="Worker counts to benchmark")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = args.corpus
+        if corpus is None:
+            corpus = str(Path(tmp) / "corpus")
+            generate_corpus(corpus, scale=args.scale, seed=args.seed)
+        results = run_benchmark(corpus, args.workers)
+        if args.corpus is None:
+            results["corpus"].update(scale=args.scale, seed=args.seed)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
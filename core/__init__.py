@@ -1,56 +1,74 @@
-from .logging_config import (
-    setup_logging,
-    get_logger,
-)
-from .graph import (
-    RequirementGraph,
-    Node,
-    Edge,
-    NodeType,
-    EdgeType,
-    CompletionStatus,
-)
-from .document_reader import (
-    DocumentReader,
-    DocumentContent,
-    read_document,
-    read_all_documents,
-)
-from .extractor import (
-    RequirementExtractor,
-    IncrementalExtractor,
-    ExtractionResult,
-)
-from .todo import (
-    TodoGenerator,
-    TodoItem,
-    TodoCategory,
-    Priority,
-)
-
-__all__ = [
+"""
+Core package.
+
+Submodules are imported on first attribute access, so ``from core import X``
+only loads the module that defines X and light CLI commands start quickly.
+"""
+
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Logging
-    "setup_logging",
-    "get_logger",
+    "setup_logging": "logging_config",
+    "get_logger": "logging_config",
     # Graph
-    "RequirementGraph",
-    "Node",
-    "Edge",
-    "NodeType",
-    "EdgeType",
-    "CompletionStatus",
+    "RequirementGraph": "graph",
+    "Node": "graph",
+    "Edge": "graph",
+    "NodeType": "graph",
+    "EdgeType": "graph",
+    "CompletionStatus": "graph",
     # Document Reader
-    "DocumentReader",
-    "DocumentContent",
-    "read_document",
-    "read_all_documents",
+    "DocumentReader": "document_reader",
+    "DocumentContent": "document_reader",
+    "read_document": "document_reader",
+    "get_default_reader": "document_reader",
+    "read_all_documents": "document_reader",
+    "ParseCache": "parse_cache",
+    "ArchiveLimits": "archive_reader",
+    "ArchiveLimitError": "archive_reader",
+    "ArchiveMemberError": "archive_reader",
+    "IsolationLimits": "isolation",
+    "deduplicate_documents": "dedup",
+    "normalize_document": "normalize",
+    "normalize_documents": "normalize",
+    "split_document": "chunking",
+    "merge_extractions": "chunking",
+    "chunk_overlaps": "chunking",
+    # GAEB
+    "parse_gaeb_xml": "gaeb",
+    "add_gaeb_to_graph": "gaeb",
     # Extractor
-    "RequirementExtractor",
-    "IncrementalExtractor",
-    "ExtractionResult",
+    "RequirementExtractor": "extractor",
+    "IncrementalExtractor": "extractor",
+    "ExtractionResult": "extractor",
+    "LLMCache": "llm_cache",
+    "RateLimiter": "rate_limit",
+    "RateLimits": "rate_limit",
+    "JSONArrayStream": "json_stream",
+    "AsyncExtractionEngine": "extraction_engine",
+    # Watcher
+    "DirectoryWatcher": "watcher",
+    "FileChanges": "watcher",
     # Todo
-    "TodoGenerator",
-    "TodoItem",
-    "TodoCategory",
-    "Priority",
-]
+    "TodoGenerator": "todo",
+    "TodoItem": "todo",
+    "TodoCategory": "todo",
+    "Priority": "todo",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,131 @@
+"""
+Archive Reader
+
+Streams members out of ZIP archives in memory, descending into nested
+archives, so tender bundles can be read without extracting anything into
+the tender directory. Size, compression ratio and nesting limits guard
+against zip bombs.
+"""
+
+import io
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional, Union
+
+from .logging_config import get_logger
+
+logger = get_logger("archive_reader")
+
+ARCHIVE_EXTENSIONS = {'.zip'}
+
+
+@dataclass
+class ArchiveLimits:
+    """Limits applied while expanding an archive (including nested archives)."""
+    max_total_bytes: int = 2 * 1024 * 1024 * 1024   # Uncompressed bytes across all members
+    max_member_bytes: int = 512 * 1024 * 1024       # Uncompressed bytes for a single member
+    max_ratio: float = 200.0                        # Uncompressed / compressed size per member
+    ratio_min_bytes: int = 1024 * 1024              # Members smaller than this skip the ratio check
+    max_depth: int = 3                              # Nesting levels below the outer archive
+    max_members: int = 20000                        # Members across all levels
+
+
+class ArchiveLimitError(Exception):
+    """Raised when an archive exceeds one of its ArchiveLimits."""
+
+
+class ArchiveMemberError(Exception):
+    """A single archive member that cannot be decompressed (encrypted or unsupported)."""
+
+
+def is_archive(name: str) -> bool:
+    """Whether a file or member name refers to a supported archive."""
+    return any(name.lower().endswith(ext) for ext in ARCHIVE_EXTENSIONS)
+
+
+def iter_archive_members(
+    source: Union[str, BinaryIO],
+    archive_path: str,
+    limits: Optional[ArchiveLimits] = None
+) -> Iterator[tuple[str, Union[bytes, ArchiveMemberError]]]:
+    """
+    Yield (virtual_path, data) for every file in a ZIP archive.
+
+    Nested archives are expanded recursively; their members get virtual paths
+    like ``bundle.zip/Formblaetter.zip/124.pdf``. Nested archive members are
+    not yielded themselves. A member that cannot be decompressed (password
+    protected, or an unsupported method such as Deflate64) is yielded with an
+    ArchiveMemberError instead of its data, so the rest of the archive is
+    still read.
+
+    Args:
+        source: Path to the archive or a binary file object
+        archive_path: Path used as the prefix for virtual member paths
+        limits: Size and nesting limits (defaults to ArchiveLimits())
+
+    Raises:
+        ArchiveLimitError: If the archive exceeds a limit
+        zipfile.BadZipFile: If the outer archive is not a valid ZIP
+    """
+    limits = limits or ArchiveLimits()
+    budget = {"bytes": 0, "members": 0}
+    yield from _iter_zip(source, archive_path, limits, budget, depth=0)
+
+
+def _iter_zip(
+    source: Union[str, BinaryIO],
+    archive_path: str,
+    limits: ArchiveLimits,
+    budget: dict,
+    depth: int
+) -> Iterator[tuple[str, Union[bytes, ArchiveMemberError]]]:
+    with zipfile.ZipFile(source, 'r') as z:
+        for info in z.infolist():
+            if info.is_dir():
+                continue
+
+            budget["members"] += 1
+            if budget["members"] > limits.max_members:
+                raise ArchiveLimitError(f"More than {limits.max_members} archive members")
+
+            member_path = f"{archive_path}/{info.filename}"
+            _check_declared_size(info, member_path, limits, budget)
+
+            # Read at most one byte past the allowance, so a member whose
+            # header understates its size cannot expand unchecked
+            allowance = min(limits.max_member_bytes, limits.max_total_bytes - budget["bytes"])
+            try:
+                with z.open(info) as f:
+                    data = f.read(allowance + 1)
+            except (RuntimeError, NotImplementedError) as e:
+                # zipfile raises RuntimeError for encrypted members and
+                # NotImplementedError for unsupported compression methods
+                logger.warning(f"Skipping unreadable archive member {member_path}: {e}")
+                yield member_path, ArchiveMemberError(str(e))
+                continue
+            if len(data) > allowance:
+                raise ArchiveLimitError(f"{member_path} expands beyond the size limit")
+            if len(data) > limits.ratio_min_bytes and len(data) / max(info.compress_size, 1) > limits.max_ratio:
+                raise ArchiveLimitError(f"{member_path} exceeds compression ratio {limits.max_ratio}")
+            budget["bytes"] += len(data)
+
+            if is_archive(info.filename):
+                if depth >= limits.max_depth:
+                    raise ArchiveLimitError(f"{member_path} nested deeper than {limits.max_depth} levels")
+                try:
+                    yield from _iter_zip(io.BytesIO(data), member_path, limits, budget, depth + 1)
+                except zipfile.BadZipFile as e:
+                    logger.warning(f"Skipping unreadable nested archive {member_path}: {e}")
+                continue
+
+            yield member_path, data
+
+
+def _check_declared_size(info: zipfile.ZipInfo, member_path: str, limits: ArchiveLimits, budget: dict):
+    """Reject members whose header sizes already break the limits."""
+    if info.file_size > limits.max_member_bytes:
+        raise ArchiveLimitError(f"{member_path} is {info.file_size} bytes uncompressed")
+    if budget["bytes"] + info.file_size > limits.max_total_bytes:
+        raise ArchiveLimitError(f"Archive expands beyond {limits.max_total_bytes} bytes")
+    if info.file_size > limits.ratio_min_bytes and info.file_size / max(info.compress_size, 1) > limits.max_ratio:
+        raise ArchiveLimitError(f"{member_path} exceeds compression ratio {limits.max_ratio}")
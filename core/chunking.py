@@ -0,0 +1,214 @@
+"""
+Document Chunking
+
+Splits long documents into overlapping chunks for LLM extraction, and merges
+the per-chunk extractions back into a single result. Chunks break at page
+markers (PDF) or blank-line section boundaries, so a requirement is only cut
+when a single page or section exceeds the chunk size; the overlap repeats the
+end of the previous chunk so items spanning a boundary are seen whole at
+least once. Items extracted from both copies of an overlap are merged.
+"""
+
+import re
+import dataclasses
+from typing import Optional
+
+from .document_reader import DocumentContent
+from .graph import normalize_title
+from .logging_config import get_logger
+
+logger = get_logger("chunking")
+
+CHUNK_OVERLAP = 2000    # Characters repeated from the end of the previous chunk
+
+_PAGE_MARKER = re.compile(r'^--- Page (\d+) ---$', re.MULTILINE)
+_SECTION_BREAK = re.compile(r'\n\s*\n')
+
+
+def _units(text: str) -> list[str]:
+    """Pages when the text has page markers, else blank-line separated sections."""
+    starts = [m.start() for m in _PAGE_MARKER.finditer(text)]
+    if starts:
+        bounds = ([0] if starts[0] > 0 else []) + starts + [len(text)]
+        return [text[a:b].strip('\n') for a, b in zip(bounds, bounds[1:]) if text[a:b].strip()]
+    return [part for part in _SECTION_BREAK.split(text) if part.strip()]
+
+
+def _split_oversized(unit: str, limit: int) -> list[str]:
+    """Split a page/section longer than limit at line breaks (or hard, for a single huge line)."""
+    pieces = []
+    current = ""
+    for line in unit.split('\n'):
+        while len(line) > limit:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + 1 + len(line) > limit:
+            pieces.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _tail(text: str, overlap: int) -> str:
+    """The last ``overlap`` characters of text, starting at a line boundary where possible."""
+    if overlap <= 0 or not text:
+        return ""
+    if len(text) <= overlap:
+        return text
+    tail = text[-overlap:]
+    newline = tail.find('\n')
+    return tail[newline + 1:] if 0 <= newline < len(tail) - 1 else tail
+
+
+def _split_parts(text: str, max_chars: int, overlap: int) -> list[tuple[str, str]]:
+    """Split text into (repeated prefix, new content) pairs; see split_text."""
+    if len(text) <= max_chars:
+        return [("", text)]
+
+    overlap = min(overlap, max_chars // 4)
+    budget = max_chars - overlap - 2  # Room for new content in each chunk
+    units = []
+    for unit in _units(text):
+        units.extend(_split_oversized(unit, budget) if len(unit) > budget else [unit])
+
+    bodies = []
+    current: list[str] = []
+    size = 0
+    for unit in units:
+        if current and size + 2 + len(unit) > budget:
+            bodies.append('\n\n'.join(current))
+            current, size = [], 0
+        current.append(unit)
+        size += len(unit) + (2 if size else 0)
+    if current:
+        bodies.append('\n\n'.join(current))
+
+    parts = [("", bodies[0])]
+    for previous, body in zip(bodies, bodies[1:]):
+        parts.append((_tail(previous, overlap), body))
+    return parts
+
+
+def _join(prefix: str, body: str) -> str:
+    return f"{prefix}\n\n{body}" if prefix else body
+
+
+def split_text(text: str, max_chars: int, overlap: int = CHUNK_OVERLAP) -> list[str]:
+    """
+    Split text into chunks of at most max_chars characters.
+
+    Args:
+        text: Document text
+        max_chars: Maximum chunk length, including the overlap
+        overlap: Characters of the previous chunk repeated at the start of the next
+
+    Returns:
+        List of chunk texts (a single chunk when the text fits)
+    """
+    return [_join(prefix, body) for prefix, body in _split_parts(text, max_chars, overlap)]
+
+
+def split_document(
+    document: DocumentContent,
+    max_chars: int,
+    overlap: int = CHUNK_OVERLAP
+) -> list[DocumentContent]:
+    """
+    Split a document into overlapping chunks for extraction.
+
+    Each chunk keeps the document's path and filename (so extracted nodes
+    point at the document) and records chunk_index, chunk_count,
+    overlap_chars (length of the text repeated from the previous chunk at
+    its start) and, for paged text, page_start/page_end in its metadata.
+    """
+    parts = _split_parts(document.text, max_chars, overlap)
+    if len(parts) == 1:
+        return [document]
+
+    chunks = []
+    for index, (prefix, body) in enumerate(parts):
+        text = _join(prefix, body)
+        metadata = {
+            **document.metadata,
+            "chunk_index": index,
+            "chunk_count": len(parts),
+            "overlap_chars": len(prefix),
+        }
+        pages = [int(n) for n in _PAGE_MARKER.findall(text)]
+        if pages:
+            metadata["page_start"], metadata["page_end"] = min(pages), max(pages)
+        chunks.append(dataclasses.replace(document, text=text, metadata=metadata))
+
+    logger.debug(f"Split {document.filename} ({len(document.text)} chars) into {len(chunks)} chunks")
+    return chunks
+
+
+def chunk_overlaps(chunks: list[DocumentContent]) -> list[str]:
+    """The text each chunk repeats from the end of the previous one (see split_document)."""
+    return [chunk.text[:chunk.metadata.get("overlap_chars", 0)] for chunk in chunks]
+
+
+def _squash(text: str) -> str:
+    return ' '.join(text.split()).lower()
+
+
+def merge_extractions(extractions: list[Optional[dict]], overlaps: Optional[list[str]] = None) -> dict:
+    """
+    Merge the LLM extractions of a document's chunks into one.
+
+    An item seen whole in the overlap between two chunks is extracted from
+    both. It is merged with the previous chunk's item of the same type and
+    title (ignoring case and punctuation) when both items' source_text lies
+    inside that overlap; the first is kept, with the highest confidence of
+    the copies. Same-titled items elsewhere in the document stay separate.
+    Relationships are de-duplicated by their titles and type.
+
+    Args:
+        extractions: Per-chunk extractions in chunk order (None for a failed chunk)
+        overlaps: Per chunk, the text repeated from the previous chunk (see
+            chunk_overlaps); without it no items are merged
+    """
+    present = [e for e in extractions if e is not None]
+    merged = {
+        "document_summary": next((e.get("document_summary") for e in present if e.get("document_summary")), ""),
+        "document_type": next((e.get("document_type") for e in present if e.get("document_type")), "other"),
+        "items": [],
+        "relationships": [],
+    }
+
+    previous: dict[tuple, list[tuple[dict, str]]] = {}  # key -> (kept item, source) in the last chunk
+    for index, extraction in enumerate(extractions):
+        overlap = _squash(overlaps[index]) if overlaps and extraction is not None else ""
+        current: dict[tuple, list[tuple[dict, str]]] = {}
+        for item in (extraction or {}).get("items", []):
+            key = (item.get("item_type", "requirement"), normalize_title(item.get("title", "")))
+            source = _squash(item.get("source_text") or "")
+            kept = None
+            if source and source in overlap:
+                kept = next((k for k, s in previous.get(key, []) if s and s in overlap), None)
+            if kept is not None:
+                kept["confidence"] = max(kept.get("confidence", 0.8), item.get("confidence", 0.8))
+            else:
+                kept = dict(item)
+                merged["items"].append(kept)
+            current.setdefault(key, []).append((kept, source))
+        previous = current
+
+    relationships = set()
+    for extraction in present:
+        for rel in extraction.get("relationships", []):
+            key = (normalize_title(rel.get("source_title", "")), normalize_title(rel.get("target_title", "")),
+                   rel.get("type", "references"))
+            if key not in relationships:
+                relationships.add(key)
+                merged["relationships"].append(rel)
+
+    total = sum(len(e.get("items", [])) for e in present)
+    logger.debug(f"Merged {len(present)} chunk extractions: {total} items -> {len(merged['items'])}")
+    return merged
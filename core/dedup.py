@@ -0,0 +1,68 @@
+"""
+Document Deduplication
+
+Collapses identical documents in a tender bundle before extraction. The same
+Formblatt often ships in several ZIPs or folders; extracting it once avoids
+paying for duplicate LLM calls and creating duplicate nodes.
+"""
+
+import hashlib
+import dataclasses
+
+from .document_reader import DocumentContent
+from .logging_config import get_logger
+
+logger = get_logger("dedup")
+
+
+def _text_key(doc: DocumentContent) -> str:
+    """Hash of a document's text with surrounding whitespace ignored."""
+    return hashlib.sha256(doc.text.strip().encode('utf-8')).hexdigest()
+
+
+def deduplicate_documents(documents: list[DocumentContent]) -> list[DocumentContent]:
+    """
+    Keep one document per group of identical documents.
+
+    Documents are grouped by the hash of their extracted text, which covers
+    both byte-identical copies and re-exports with identical content. The
+    first document of each group is kept, in original order, with the paths
+    of the others in metadata["aliases"]. Failed reads are passed through
+    untouched.
+
+    Returns:
+        The deduplicated list; input documents are not modified
+    """
+    groups: dict[str, list[DocumentContent]] = {}
+    order: list = []  # Group keys and failed documents, in input order
+
+    for doc in documents:
+        if not doc.is_successful:
+            order.append(doc)
+            continue
+        key = _text_key(doc)
+        if key not in groups:
+            groups[key] = []
+            order.append(key)
+        groups[key].append(doc)
+
+    result = []
+    duplicates = 0
+    for entry in order:
+        if isinstance(entry, DocumentContent):
+            result.append(entry)
+            continue
+
+        first, *others = groups[entry]
+        if not others:
+            result.append(first)
+            continue
+
+        duplicates += len(others)
+        aliases = first.metadata.get("aliases", []) + [doc.path for doc in others]
+        logger.debug(f"{first.filename} has {len(others)} identical copies")
+        result.append(dataclasses.replace(first, metadata={**first.metadata, "aliases": aliases}))
+
+    if duplicates:
+        logger.info(f"Deduplicated {len(documents)} documents to {len(result)} ({duplicates} identical copies)")
+    return result
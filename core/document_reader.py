@@ -5,15 +5,32 @@ Extracts text content from any document format.
 Supports: PDF, DOCX, XLSX, XML, TXT, and more.
 """
 
+import io
 import os
+import hashlib
+import dataclasses
+import re
+import json
+import time
+import codecs
+import fnmatch
+import threading
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from xml.parsers import expat
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 from datetime import datetime
 
 from .logging_config import get_logger
+from .parse_cache import ParseCache, hash_file
+from .isolation import IsolationLimits, IsolatedParserPool, ParseIsolationError
+from .archive_reader import ArchiveLimits, ArchiveLimitError, ArchiveMemberError, iter_archive_members, is_archive
+from .html_text import html_to_text
+from .docx_text import read_docx_text
+from .gaeb import GAEB_XML_EXTENSIONS, NotGaebError, parse_gaeb_xml, gaeb_to_text, looks_like_gaeb
 
 logger = get_logger("document_reader")
 
@@ -29,6 +46,7 @@ class DocumentContent:
     metadata: dict = field(default_factory=dict)
     extraction_method: str = "unknown"
     extraction_time: datetime = field(default_factory=datetime.now)
+    parse_seconds: Optional[float] = None  # Wall time spent in read()
     error: Optional[str] = None
 
     @property
@@ -48,46 +66,48 @@ class DocumentReader:
         '.pdf', '.docx', '.xlsx', '.xml', '.txt', '.csv',
         '.html', '.htm', '.md', '.json', '.x83', '.d83',
         '.xsl', '.aidocdef', '.aidoc', '.aiform',
-    }
-
-    def __init__(self):
+    } | GAEB_XML_EXTENSIONS
+
+    def __init__(
+        self,
+        cache: Optional[ParseCache] = None,
+        xlsx_max_rows: Optional[int] = None,
+        xlsx_sheets: Optional[list[str]] = None,
+        xlsx_delimiter: str = "\t",
+        archive_limits: Optional[ArchiveLimits] = None,
+        isolation: Optional[IsolationLimits] = None
+    ):
+        """
+        Args:
+            cache: Optional ParseCache consulted before parsing
+            xlsx_max_rows: Maximum rows read per worksheet (None = all)
+            xlsx_sheets: Worksheet names or glob patterns to read (None = all)
+            xlsx_delimiter: Cell separator for spreadsheet rows
+            archive_limits: Zip bomb limits for in-memory archive reading
+            isolation: Parse each document in a worker subprocess with these
+                timeout and memory limits (None = parse in this process)
+        """
         logger.debug("Initializing DocumentReader")
-        self._pdf_available = self._check_pdf_support()
-        self._docx_available = self._check_docx_support()
-        self._xlsx_available = self._check_xlsx_support()
-        logger.debug(f"Library support: PDF={self._pdf_available}, DOCX={self._docx_available}, XLSX={self._xlsx_available}")
-
-    def _check_pdf_support(self) -> bool:
-        try:
-            import pypdf
-            logger.debug("pypdf library available")
-            return True
-        except ImportError:
-            try:
-                import PyPDF2
-                logger.debug("PyPDF2 library available")
-                return True
-            except ImportError:
-                logger.warning("No PDF library available (pypdf or PyPDF2)")
-                return False
-
-    def _check_docx_support(self) -> bool:
-        try:
-            import docx
-            logger.debug("python-docx library available")
-            return True
-        except ImportError:
-            logger.warning("python-docx library not available")
-            return False
+        self.cache = cache
+        self.archive_limits = archive_limits or ArchiveLimits()
+        self.isolation = isolation
+        self._isolated_pool: Optional[IsolatedParserPool] = None
+        self._isolated_pool_lock = threading.Lock()
+        self._thread_state = threading.local()  # One reader may be shared across threads
+        # Parser options - forwarded to worker processes and part of the cache key
+        self.options = {
+            "xlsx_max_rows": xlsx_max_rows,
+            "xlsx_sheets": xlsx_sheets,
+            "xlsx_delimiter": xlsx_delimiter,
+        }
 
-    def _check_xlsx_support(self) -> bool:
-        try:
-            import openpyxl
-            logger.debug("openpyxl library available")
-            return True
-        except ImportError:
-            logger.warning("openpyxl library not available")
-            return False
+    @property
+    def _memory_files(self) -> dict[str, bytes]:
+        """Virtual path -> bytes of the files being read by read_bytes() in this thread."""
+        files = getattr(self._thread_state, "memory_files", None)
+        if files is None:
+            files = self._thread_state.memory_files = {}
+        return files
 
     def read(self, path: str) -> DocumentContent:
         """Read a document and extract its text content."""
@@ -97,7 +117,138 @@ class DocumentReader:
 
         logger.debug(f"Reading document: {filename} (extension: {extension})")
 
+        start_time = time.perf_counter()
+
+        if self.cache is not None:
+            cached = self._read_cached(path, filename, extension)
+            if cached is not None:
+                cached.parse_seconds = time.perf_counter() - start_time
+                return cached
+
+        if self.isolation is not None:
+            result = self._read_isolated(path)
+        else:
+            result = self._read_dispatch(path, filename, extension)
+        result.parse_seconds = time.perf_counter() - start_time
+        logger.debug(f"Parsed {filename} in {result.parse_seconds:.3f}s")
+
+        if self.cache is not None:
+            self._store_cached(result)
+        return result
+
+    def read_bytes(self, data: bytes, path: str) -> DocumentContent:
+        """
+        Read a document held in memory.
+
+        Args:
+            data: The file contents
+            path: Path reported on the result (e.g. an archive member path);
+                its extension selects the reader
+
+        Returns:
+            DocumentContent for the in-memory file
+        """
+        filename = os.path.basename(path)
+        extension = os.path.splitext(filename)[1].lower()
+        logger.debug(f"Reading in-memory document: {path} ({len(data)} bytes)")
+
+        start_time = time.perf_counter()
+        if self.isolation is not None:
+            result = self._read_isolated(path, data)
+        else:
+            self._memory_files[path] = data
+            try:
+                result = self._read_dispatch(path, filename, extension)
+            finally:
+                del self._memory_files[path]
+        result.parse_seconds = time.perf_counter() - start_time
+        return result
+
+    def _read_isolated(self, path: str, data: Optional[bytes] = None) -> DocumentContent:
+        """Parse a document in a worker subprocess under self.isolation limits."""
+        pool = self._isolated_pool
+        if pool is None:
+            # read_archive and read_many call this from several threads
+            with self._isolated_pool_lock:
+                if self._isolated_pool is None:
+                    self._isolated_pool = IsolatedParserPool(self.options, self.isolation)
+                pool = self._isolated_pool
+
+        try:
+            return pool.read(path, data)
+        except ParseIsolationError as e:
+            filename = os.path.basename(path)
+            logger.error(f"Isolated parse of {filename} failed: {e}")
+            return DocumentContent(
+                path=path,
+                filename=filename,
+                extension=os.path.splitext(filename)[1].lower(),
+                text="",
+                error=str(e)
+            )
+
+    def close(self):
+        """Stop isolated parser processes, if any were started."""
+        with self._isolated_pool_lock:
+            if self._isolated_pool is not None:
+                self._isolated_pool.close()
+                self._isolated_pool = None
+
+    def _open_binary(self, path: str) -> BinaryIO:
+        """Open a document for binary reading, whether on disk or in memory."""
+        data = self._memory_files.get(path)
+        if data is not None:
+            return io.BytesIO(data)
+        return open(path, 'rb')
+
+    def _read_cached(self, path: str, filename: str, extension: str) -> Optional[DocumentContent]:
+        """Return a DocumentContent from the parse cache, or None on a miss."""
         if not os.path.exists(path):
+            return None
+
+        try:
+            entry = self.cache.get(path, extension, variant=self._cache_variant())
+        except OSError as e:
+            logger.warning(f"Parse cache lookup failed for {filename}: {e}")
+            return None
+        if entry is None:
+            return None
+
+        logger.debug(f"Parse cache hit: {filename}")
+        return self._cached_document(path, filename, extension, entry)
+
+    def _cached_document(self, path: str, filename: str, extension: str, entry: dict) -> DocumentContent:
+        """DocumentContent for a parse cache entry."""
+        return DocumentContent(
+            path=path,
+            filename=filename,
+            extension=extension,
+            text=entry["text"],
+            metadata=entry["metadata"],
+            extraction_method=entry["extraction_method"],
+        )
+
+    def _cache_variant(self) -> str:
+        """Cache key suffix for non-default parser options."""
+        if self.options["xlsx_max_rows"] is None and self.options["xlsx_sheets"] is None \
+                and self.options["xlsx_delimiter"] == "\t":
+            return ""
+        return json.dumps(self.options, sort_keys=True)
+
+    def _store_cached(self, result: DocumentContent):
+        """Store a successful read in the parse cache."""
+        if not result.is_successful:
+            return
+        try:
+            self.cache.put(result.path, result.extension, result.text,
+                           result.metadata, result.extraction_method,
+                           variant=self._cache_variant())
+        except OSError as e:
+            logger.warning(f"Could not write parse cache entry for {result.filename}: {e}")
+
+    def _read_dispatch(self, path: str, filename: str, extension: str) -> DocumentContent:
+        """Pick the reader for a file and run it, converting failures to errors."""
+        if path not in self._memory_files and not os.path.exists(path):
             logger.error(f"File not found: {path}")
             return DocumentContent(
                 path=path,
@@ -108,24 +259,42 @@ class DocumentReader:
             )
 
         try:
-            if extension == '.pdf':
+            detected_type = self._sniff_type(path)
+            read_as = self._dispatch_extension(extension, detected_type)
+
+            if read_as is None:
+                logger.warning(f"Rejecting {filename}: content looks like {detected_type}")
+                return DocumentContent(
+                    path=path,
+                    filename=filename,
+                    extension=extension,
+                    text="",
+                    metadata={"detected_type": detected_type},
+                    error=self.REJECTED_TYPE_ERRORS[detected_type]
+                )
+            if read_as != extension:
+                logger.info(f"{filename} contains {detected_type} data, reading as {read_as}")
+
+            if read_as == '.pdf':
                 result = self._read_pdf(path)
-            elif extension == '.docx':
+            elif read_as == '.docx':
                 result = self._read_docx(path)
-            elif extension == '.xlsx':
+            elif read_as == '.xlsx':
                 result = self._read_xlsx(path)
-            elif extension in ('.xml', '.xsl', '.aidocdef', '.aidoc', '.aiform'):
+            elif read_as in ('.xml', '.xsl', '.aidocdef', '.aidoc', '.aiform'):
                 result = self._read_xml(path)
-            elif extension in ('.txt', '.md', '.csv', '.json'):
+            elif read_as in ('.txt', '.md', '.csv', '.json'):
                 result = self._read_text(path)
-            elif extension in ('.html', '.htm'):
+            elif read_as in ('.html', '.htm'):
                 result = self._read_html(path)
-            elif extension in ('.x83', '.d83'):
+            elif read_as in GAEB_XML_EXTENSIONS or read_as == '.d83':
                 result = self._read_gaeb(path)
             else:
                 logger.debug(f"Unknown extension {extension}, attempting generic read")
                 result = self._read_unknown(path)
 
+            result.metadata["detected_type"] = detected_type
+
             if result.is_successful:
                 logger.info(f"Successfully read {filename}: {len(result.text)} chars via {result.extraction_method}")
             else:
@@ -143,176 +312,292 @@ class DocumentReader:
                 error=f"Error reading file: {str(e)}"
             )
 
-    def _read_pdf(self, path: str) -> DocumentContent:
-        """Extract text from PDF."""
-        filename = os.path.basename(path)
-        extension = '.pdf'
-        logger.debug(f"Attempting PDF extraction for {filename}")
+    SNIFF_SIZE = 8 * 1024
+
+    # Extensions whose reader matches each sniffed content type
+    TYPE_EXTENSIONS = {
+        'pdf': {'.pdf'},
+        'docx': {'.docx'},
+        'xlsx': {'.xlsx'},
+        'html': {'.html', '.htm'},
+    }
+
+    REJECTED_TYPE_ERRORS = {
+        'binary': "Binary content is not a readable document",
+        'ole': "Legacy Office format (.doc/.xls) is not supported",
+        'zip': "File is a ZIP archive; read it with read_archive",
+    }
 
+    def _sniff_type(self, path: str) -> str:
+        """
+        Classify a file from its first bytes.
+
+        Returns one of 'pdf', 'docx', 'xlsx', 'zip', 'ole' (legacy .doc/.xls),
+        'xml', 'html', 'text', 'binary' or 'empty'. Only ZIP containers are
+        looked into further, via their central directory.
+        """
+        with self._open_binary(path) as f:
+            head = f.read(self.SNIFF_SIZE)
+
+        if not head:
+            return 'empty'
+        if head.startswith(b'%PDF-') or b'%PDF-' in head[:1024]:
+            return 'pdf'
+        if head.startswith(b'PK\x03\x04'):
+            try:
+                with self._open_binary(path) as f, zipfile.ZipFile(f) as z:
+                    names = set(z.namelist())
+            except zipfile.BadZipFile:
+                return 'binary'
+            if 'word/document.xml' in names:
+                return 'docx'
+            if 'xl/workbook.xml' in names:
+                return 'xlsx'
+            return 'zip'
+        if head.startswith(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'):
+            return 'ole'
+
+        encoding = self._detect_encoding(head)
+        if encoding in ('utf-16', 'utf-32', 'utf-16-le', 'utf-16-be'):
+            sample = head.decode(encoding, errors='ignore').encode('utf-8')
+        else:
+            sample = head
+            # NUL bytes or many control characters mean this is not text
+            control = sum(1 for b in head if b < 9 or 13 < b < 32)
+            if b'\x00' in head or control > len(head) * 0.1:
+                return 'binary'
+
+        start = sample.lstrip(b'\xef\xbb\xbf \t\r\n')[:1024].lower()
+        if start.startswith(b'<!doctype html') or start.startswith(b'<html') or b'<html' in start:
+            return 'html'
+        if start.startswith(b'<?xml') or (start.startswith(b'<') and not start.startswith(b'<!doctype')):
+            return 'xml'
+        return 'text'
+
+    def _dispatch_extension(self, extension: str, detected_type: str) -> Optional[str]:
+        """
+        Decide which extension's reader to use for a file.
+
+        The file's own extension wins unless its content clearly belongs to a
+        different format (a PDF saved as .dat, a DOCX without extension) or is
+        not readable at all. Returns None to reject the file.
+        """
+        binary_extensions = ('.pdf', '.docx', '.xlsx')
+
+        expected = self.TYPE_EXTENSIONS.get(detected_type)
+        if expected and extension not in expected \
+                and (extension not in self.SUPPORTED_EXTENSIONS or extension in binary_extensions):
+            return sorted(expected)[0]
+
+        if detected_type == 'binary':
+            # Let the binary format parsers judge their own files
+            return extension if extension in binary_extensions else None
+        if detected_type == 'zip':
+            return extension if extension in ('.docx', '.xlsx') else None
+        if detected_type == 'ole':
+            return None
+
+        if detected_type == 'xml' and extension not in self.SUPPORTED_EXTENSIONS:
+            return '.xml'
+        if detected_type in ('text', 'xml') and extension in binary_extensions:
+            # A text export saved under a binary extension
+            return '.txt'
+        return extension
+
+    def _pdf_library(self):
+        """Return the available PDF module (pypdf preferred, PyPDF2 fallback)."""
         try:
             import pypdf
-            logger.debug("Using pypdf for extraction")
-            reader = pypdf.PdfReader(path)
-            text_parts = []
-            for i, page in enumerate(reader.pages):
-                page_text = page.extract_text() or ""
-                if page_text.strip():
-                    text_parts.append(f"--- Page {i+1} ---\n{page_text}")
-                logger.debug(f"Page {i+1}: extracted {len(page_text)} chars")
-
-            return DocumentContent(
-                path=path,
-                filename=filename,
-                extension=extension,
-                text="\n\n".join(text_parts),
-                extraction_method="pypdf",
-                metadata={"page_count": len(reader.pages)}
-            )
+            return pypdf
         except ImportError:
             logger.debug("pypdf not available, trying PyPDF2")
 
+        import PyPDF2
+        return PyPDF2
+
+    def iter_pages(self, path: str) -> Iterator[tuple[int, str]]:
+        """
+        Yield (page_number, text) for each page of a PDF, one page at a time.
+
+        The file is read lazily through an open handle, so only the current
+        page's text is held in memory. Page numbers start at 1.
+
+        Raises:
+            ImportError: If neither pypdf nor PyPDF2 is installed
+        """
+        pdf_library = self._pdf_library()
+        with self._open_binary(path) as f:
+            reader = pdf_library.PdfReader(f)
+            for i, page in enumerate(reader.pages):
+                yield i + 1, page.extract_text() or ""
+
+    def iter_chunks(self, path: str, max_chars: int = 50000) -> Iterator[DocumentContent]:
+        """
+        Yield a document as a sequence of DocumentContent chunks of at most
+        max_chars (a single oversized page still forms its own chunk).
+
+        PDFs are split on page boundaries and streamed page by page; other
+        formats are read in full and yielded as one chunk. Each chunk's
+        metadata records its chunk_index and, for PDFs, page_start/page_end.
+        A PDF that cannot be parsed yields an error DocumentContent, as read()
+        returns one.
+        """
+        path = os.path.abspath(path)
+        filename = os.path.basename(path)
+        extension = os.path.splitext(filename)[1].lower()
+
+        if extension != '.pdf':
+            yield self.read(path)
+            return
+
         try:
-            import PyPDF2
-            logger.debug("Using PyPDF2 for extraction")
-            with open(path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                text_parts = []
-                for i, page in enumerate(reader.pages):
-                    page_text = page.extract_text() or ""
-                    if page_text.strip():
-                        text_parts.append(f"--- Page {i+1} ---\n{page_text}")
+            pages = self.iter_pages(path)
+            chunk_index = 0
+            parts: list[str] = []
+            size = 0
+            page_start = None
+            page_end = None
+
+            for page_number, page_text in pages:
+                if not page_text.strip():
+                    continue
+                part = f"--- Page {page_number} ---\n{page_text}"
+                if parts and size + len(part) > max_chars:
+                    yield self._pdf_chunk(path, parts, chunk_index, page_start, page_end)
+                    chunk_index += 1
+                    parts, size, page_start = [], 0, None
+                if page_start is None:
+                    page_start = page_number
+                page_end = page_number
+                parts.append(part)
+                size += len(part) + 2
+
+            if parts:
+                yield self._pdf_chunk(path, parts, chunk_index, page_start, page_end)
 
-                return DocumentContent(
-                    path=path,
-                    filename=filename,
-                    extension=extension,
-                    text="\n\n".join(text_parts),
-                    extraction_method="PyPDF2",
-                    metadata={"page_count": len(reader.pages)}
-                )
         except ImportError:
-            logger.error("No PDF library available")
+            yield self._read_pdf(path)
+        except Exception as e:
+            # Corrupt or unreadable PDF: report it like read() does; chunks
+            # yielded before the failure stand
+            logger.exception(f"Unexpected error reading {filename}")
+            yield DocumentContent(
+                path=path,
+                filename=filename,
+                extension=extension,
+                text="",
+                error=f"Error reading file: {str(e)}"
+            )
 
+    def _pdf_chunk(
+        self,
+        path: str,
+        parts: list[str],
+        chunk_index: int,
+        page_start: int,
+        page_end: int
+    ) -> DocumentContent:
+        """Build a DocumentContent for a run of PDF pages."""
+        logger.debug(f"PDF chunk {chunk_index}: pages {page_start}-{page_end}")
         return DocumentContent(
             path=path,
-            filename=filename,
-            extension=extension,
-            text="",
-            error="No PDF library available. Install pypdf: pip install pypdf"
+            filename=os.path.basename(path),
+            extension='.pdf',
+            text="\n\n".join(parts),
+            extraction_method="pdf-stream",
+            metadata={"chunk_index": chunk_index, "page_start": page_start, "page_end": page_end},
         )
 
-    def _read_docx(self, path: str) -> DocumentContent:
-        """Extract text from DOCX."""
+    def _read_pdf(self, path: str) -> DocumentContent:
+        """Extract text from PDF."""
         filename = os.path.basename(path)
-        extension = '.docx'
-        logger.debug(f"Attempting DOCX extraction for {filename}")
+        extension = '.pdf'
+        logger.debug(f"Attempting PDF extraction for {filename}")
 
         try:
-            import docx
-            logger.debug("Using python-docx for extraction")
-            doc = docx.Document(path)
-            text_parts = []
-
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
-
-            # Also extract text from tables
-            table_count = len(doc.tables)
-            logger.debug(f"Found {len(doc.paragraphs)} paragraphs and {table_count} tables")
-
-            for table in doc.tables:
-                table_rows = []
-                for row in table.rows:
-                    row_text = " | ".join(cell.text.strip() for cell in row.cells)
-                    if row_text.strip():
-                        table_rows.append(row_text)
-                if table_rows:
-                    text_parts.append("\n[TABLE]\n" + "\n".join(table_rows) + "\n[/TABLE]")
-
+            pdf_library = self._pdf_library()
+        except ImportError:
+            logger.error("No PDF library available")
             return DocumentContent(
                 path=path,
                 filename=filename,
                 extension=extension,
-                text="\n\n".join(text_parts),
-                extraction_method="python-docx",
+                text="",
+                error="No PDF library available. Install pypdf: pip install pypdf"
             )
-        except ImportError:
-            logger.debug("python-docx not available, trying ZIP fallback")
-            return self._read_docx_as_zip(path)
 
-    def _read_docx_as_zip(self, path: str) -> DocumentContent:
-        """Extract text from DOCX by treating it as a ZIP file."""
+        text_parts = []
+        page_count = 0
+        for page_number, page_text in self.iter_pages(path):
+            page_count = page_number
+            if page_text.strip():
+                text_parts.append(f"--- Page {page_number} ---\n{page_text}")
+
+        logger.debug(f"Extracted {page_count} pages from {filename}")
+
+        return DocumentContent(
+            path=path,
+            filename=filename,
+            extension=extension,
+            text="\n\n".join(text_parts),
+            extraction_method=pdf_library.__name__,
+            metadata={"page_count": page_count}
+        )
+
+    def _read_docx(self, path: str) -> DocumentContent:
+        """
+        Extract text from DOCX.
+
+        Streams word/document.xml once, keeping paragraphs and tables in
+        document order; checkbox controls are rendered as ☐ / ☒.
+        """
         filename = os.path.basename(path)
         extension = '.docx'
-        logger.debug(f"Using ZIP fallback for DOCX: {filename}")
+        logger.debug(f"Attempting DOCX extraction for {filename}")
 
         try:
-            with zipfile.ZipFile(path, 'r') as z:
-                with z.open('word/document.xml') as f:
-                    tree = ET.parse(f)
-                    root = tree.getroot()
-
-                    text_parts = []
-                    for elem in root.iter():
-                        if elem.tag.endswith('}t'):
-                            if elem.text:
-                                text_parts.append(elem.text)
-
-                    return DocumentContent(
-                        path=path,
-                        filename=filename,
-                        extension=extension,
-                        text=" ".join(text_parts),
-                        extraction_method="docx-as-zip",
-                    )
-        except Exception as e:
-            logger.error(f"ZIP fallback failed for {filename}: {e}")
+            with self._open_binary(path) as f:
+                body = read_docx_text(f)
+        except (KeyError, zipfile.BadZipFile, expat.ExpatError) as e:
+            logger.error(f"Could not read DOCX {filename}: {e}")
             return DocumentContent(
                 path=path,
                 filename=filename,
                 extension=extension,
                 text="",
-                error=f"Could not read DOCX: {str(e)}. Install python-docx: pip install python-docx"
+                error=f"Could not read DOCX: {str(e)}"
             )
 
+        logger.debug(f"Found {body.paragraph_count} paragraphs, {body.table_count} tables "
+                     f"and {body.checkbox_count} checkboxes")
+        return DocumentContent(
+            path=path,
+            filename=filename,
+            extension=extension,
+            text=body.text,
+            metadata={
+                "paragraph_count": body.paragraph_count,
+                "table_count": body.table_count,
+                "checkbox_count": body.checkbox_count,
+            },
+            extraction_method="docx-stream",
+        )
+
     def _read_xlsx(self, path: str) -> DocumentContent:
-        """Extract text from XLSX."""
+        """
+        Extract text from XLSX.
+
+        Uses openpyxl's read-only mode and iterates plain cell values, so
+        memory stays flat regardless of sheet size. Each row becomes one line
+        of delimiter-separated values with trailing empty cells dropped.
+        Honors the xlsx_sheets filter and xlsx_max_rows cap.
+        """
         filename = os.path.basename(path)
         extension = '.xlsx'
         logger.debug(f"Attempting XLSX extraction for {filename}")
 
         try:
             import openpyxl
-            logger.debug("Using openpyxl for extraction")
-            wb = openpyxl.load_workbook(path, data_only=True)
-            text_parts = []
-
-            logger.debug(f"Workbook has {len(wb.sheetnames)} sheets: {wb.sheetnames}")
-
-            for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                sheet_text = [f"=== Sheet: {sheet_name} ==="]
-
-                for row in sheet.iter_rows():
-                    row_values = []
-                    for cell in row:
-                        if cell.value is not None:
-                            row_values.append(str(cell.value))
-                    if row_values:
-                        sheet_text.append(" | ".join(row_values))
-
-                if len(sheet_text) > 1:
-                    text_parts.append("\n".join(sheet_text))
-
-            return DocumentContent(
-                path=path,
-                filename=filename,
-                extension=extension,
-                text="\n\n".join(text_parts),
-                extraction_method="openpyxl",
-                metadata={"sheet_count": len(wb.sheetnames)}
-            )
         except ImportError:
             logger.error("openpyxl not available")
             return DocumentContent(
@@ -323,68 +608,265 @@ class DocumentReader:
                 error="No XLSX library available. Install openpyxl: pip install openpyxl"
             )
 
-    def _read_xml(self, path: str) -> DocumentContent:
-        """Extract text from XML."""
-        filename = os.path.basename(path)
-        extension = '.xml'
-        logger.debug(f"Attempting XML extraction for {filename}")
+        max_rows = self.options["xlsx_max_rows"]
+        sheet_patterns = self.options["xlsx_sheets"]
+        delimiter = self.options["xlsx_delimiter"]
+
+        with self._open_binary(path) as source:
+            wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
+            try:
+                logger.debug(f"Workbook has {len(wb.sheetnames)} sheets: {wb.sheetnames}")
+
+                text_parts = []
+                sheets_read = []
+                truncated_sheets = []
+                rows_read = 0
+
+                for sheet_name in wb.sheetnames:
+                    if sheet_patterns and not any(
+                        fnmatch.fnmatch(sheet_name.lower(), pattern.lower()) for pattern in sheet_patterns
+                    ):
+                        logger.debug(f"Skipping sheet not matching filter: {sheet_name}")
+                        continue
+
+                    sheet = wb[sheet_name]
+                    sheets_read.append(sheet_name)
+                    sheet_text = [f"=== Sheet: {sheet_name} ==="]
+                    sheet_rows = 0
+
+                    for row in sheet.iter_rows(values_only=True):
+                        values = ["" if v is None else str(v) for v in row]
+                        while values and not values[-1].strip():
+                            values.pop()
+                        if not values:
+                            continue
+
+                        if max_rows is not None and sheet_rows >= max_rows:
+                            sheet_text.append(f"[... truncated after {max_rows} rows ...]")
+                            truncated_sheets.append(sheet_name)
+                            break
+
+                        sheet_text.append(delimiter.join(values))
+                        sheet_rows += 1
+
+                    rows_read += sheet_rows
+                    if len(sheet_text) > 1:
+                        text_parts.append("\n".join(sheet_text))
+
+                metadata = {
+                    "sheet_count": len(wb.sheetnames),
+                    "sheets_read": sheets_read,
+                    "row_count": rows_read,
+                }
+                if truncated_sheets:
+                    metadata["truncated_sheets"] = truncated_sheets
+
+                return DocumentContent(
+                    path=path,
+                    filename=filename,
+                    extension=extension,
+                    text="\n\n".join(text_parts),
+                    extraction_method="openpyxl-readonly",
+                    metadata=metadata
+                )
+            finally:
+                wb.close()
+
+    XML_CHUNK_SIZE = 1024 * 1024
+    ENCODING_SAMPLE_SIZE = 64 * 1024
+
+    def _detect_encoding(self, sample: bytes, declared: Optional[str] = None) -> str:
+        """
+        Pick an encoding from the first bytes of a file.
+
+        A byte order mark wins, then UTF-16 recognized by its NUL bytes
+        (Windows exports without a BOM), then a declared encoding (e.g. from
+        an XML declaration) unless it claims UTF-8. Otherwise the sample is
+        checked for valid UTF-8, falling back to cp1252, which covers the
+        Windows exports common in German tenders.
+        """
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if sample.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+            return 'utf-32'
+        if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        utf16 = self._detect_utf16(sample)
+        if utf16:
+            return utf16
+
+        if declared:
+            try:
+                if codecs.lookup(declared).name != 'utf-8':
+                    return declared.lower()
+            except LookupError:
+                logger.debug(f"Ignoring unknown declared encoding: {declared}")
 
         try:
-            # Try different encodings
-            content = None
-            used_encoding = None
-            for encoding in ['utf-8', 'latin-1', 'cp1252']:
-                try:
-                    with open(path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    used_encoding = encoding
-                    break
-                except UnicodeDecodeError:
-                    continue
+            sample.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of the sample is fine
+            if e.start < len(sample) - 3:
+                return 'cp1252'
+        return 'utf-8'
+
+    def _detect_utf16(self, sample: bytes) -> Optional[str]:
+        """
+        'utf-16-le' or 'utf-16-be' for BOM-less UTF-16 text, else None.
+
+        Latin text in UTF-16 has a NUL in every other byte: the high byte of
+        each character. The sample must also decode to mostly printable text,
+        so binary formats with 16-bit fields are not mistaken for it.
+        """
+        sample = sample[:4096]
+        sample = sample[:len(sample) - len(sample) % 2]
+        pairs = len(sample) // 2
+        if pairs < 2:
+            return None
+
+        even_nuls = sample[0::2].count(0)
+        odd_nuls = sample[1::2].count(0)
+        if odd_nuls >= pairs * 0.3 and even_nuls <= pairs * 0.05:
+            encoding = 'utf-16-le'
+        elif even_nuls >= pairs * 0.3 and odd_nuls <= pairs * 0.05:
+            encoding = 'utf-16-be'
+        else:
+            return None
 
-            if content is None:
-                with open(path, 'rb') as f:
-                    content = f.read().decode('utf-8', errors='replace')
-                used_encoding = 'utf-8-fallback'
+        try:
+            text = sample.decode(encoding)
+        except UnicodeDecodeError:
+            return None  # E.g. a surrogate pair cut at the end of the sample is not worth guessing on
+        control = sum(1 for c in text if c < ' ' and c not in '\t\r\n')
+        return encoding if control <= len(text) * 0.1 else None
 
-            logger.debug(f"Read XML with encoding: {used_encoding}")
+    def _decode_file(self, path: str) -> tuple[str, str]:
+        """
+        Read a file once and decode it with a detected encoding.
 
-            tree = ET.fromstring(content)
+        Newlines are normalized to LF. If bytes beyond the detection sample
+        turn out not to be UTF-8, the buffer is decoded again as cp1252
+        instead of re-reading the file.
 
-            def extract_text(elem, depth=0):
-                text_parts = []
-                tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+        Returns:
+            Tuple of (text, encoding used)
+        """
+        with self._open_binary(path) as f:
+            data = f.read()
 
-                if elem.text and elem.text.strip():
-                    text_parts.append(f"{tag_name}: {elem.text.strip()}")
+        encoding = self._detect_encoding(data[:self.ENCODING_SAMPLE_SIZE])
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError:
+            logger.debug(f"Invalid {encoding} beyond sample, decoding as cp1252")
+            encoding = 'cp1252'
+            text = data.decode(encoding, errors='replace')
+
+        logger.debug(f"Decoded {os.path.basename(path)} as {encoding}")
+        return text.replace('\r\n', '\n').replace('\r', '\n'), encoding
+
+    def _sniff_xml_encoding(self, head: bytes) -> str:
+        """Determine an XML file's encoding from its BOM or XML declaration."""
+        match = re.match(rb'\s*<\?xml[^>]*?encoding=["\']([A-Za-z0-9._-]+)["\']', head)
+        declared = match.group(1).decode('ascii') if match else None
+        return self._detect_encoding(head, declared)
+
+    def _iter_xml_lines(self, path: str, encoding: str) -> Iterator[str]:
+        """
+        Stream an XML file and yield 'tag: text' / 'tag@attr: value' lines in
+        document order.
+
+        Built on expat's incremental parser: no element tree is kept, so memory
+        is bounded by the chunk size rather than the document size, and deep
+        nesting cannot hit the recursion limit.
+
+        Raises:
+            xml.parsers.expat.ExpatError: If the document is not well-formed
+        """
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.buffer_text = True
+        lines: list[str] = []
+        # The innermost element whose text is still being collected:
+        # [tag_name, attrs, text_parts]. Its text ends when a child starts.
+        current: list = []
+
+        def flush_current():
+            tag_name, attrs, text_parts = current
+            text = "".join(text_parts).strip()
+            if text:
+                lines.append(f"{tag_name}: {text}")
+            for attr, value in attrs.items():
+                # Match ElementTree's {namespace}name form for qualified attributes
+                if '}' in attr:
+                    attr = '{' + attr
+                lines.append(f"{tag_name}@{attr}: {value}")
+            current.clear()
+
+        def start_element(name, attrs):
+            if current:
+                flush_current()
+            current.extend((name.rsplit('}', 1)[-1], attrs, []))
+
+        def end_element(name):
+            if current:
+                flush_current()
+
+        def character_data(data):
+            if current:
+                current[2].append(data)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        with self._open_binary(path) as f:
+            while True:
+                block = f.read(self.XML_CHUNK_SIZE)
+                # Feeding decoded text makes expat ignore the declared encoding
+                parser.Parse(decoder.decode(block, final=not block), not block)
+                yield from lines
+                lines.clear()
+                if not block:
+                    break
 
-                for attr, value in elem.attrib.items():
-                    text_parts.append(f"{tag_name}@{attr}: {value}")
+    def _read_xml(self, path: str, detect_gaeb: bool = True) -> DocumentContent:
+        """Extract text from XML using an incremental parser."""
+        filename = os.path.basename(path)
+        extension = '.xml'
+        logger.debug(f"Attempting XML extraction for {filename}")
 
-                for child in elem:
-                    text_parts.extend(extract_text(child, depth + 1))
+        with self._open_binary(path) as f:
+            head = f.read(self.ENCODING_SAMPLE_SIZE)
 
-                return text_parts
+        if detect_gaeb and looks_like_gaeb(head):
+            logger.debug(f"Detected GAEB DA XML content in {filename}")
+            return self._read_gaeb(path)
 
-            text = "\n".join(extract_text(tree))
+        encoding = self._sniff_xml_encoding(head)
+        logger.debug(f"Reading XML with encoding: {encoding}")
 
+        try:
+            text = "\n".join(self._iter_xml_lines(path, encoding))
             return DocumentContent(
                 path=path,
                 filename=filename,
                 extension=extension,
                 text=text,
                 extraction_method="xml-parser",
+                metadata={"encoding": encoding},
             )
 
-        except ET.ParseError as e:
+        except expat.ExpatError as e:
             logger.warning(f"XML parsing failed for {filename}: {e}, falling back to raw text")
-            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            with self._open_binary(path) as f:
                 return DocumentContent(
                     path=path,
                     filename=filename,
                     extension=extension,
-                    text=f.read(),
+                    text=f.read().decode(encoding, errors='replace'),
                     extraction_method="raw-text",
+                    metadata={"encoding": encoding},
                 )
 
     def _read_text(self, path: str) -> DocumentContent:
@@ -393,105 +875,170 @@ class DocumentReader:
         extension = os.path.splitext(filename)[1].lower()
         logger.debug(f"Attempting text extraction for {filename}")
 
-        for encoding in ['utf-8', 'latin-1', 'cp1252']:
-            try:
-                with open(path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                logger.debug(f"Read text file with encoding: {encoding}")
-                return DocumentContent(
-                    path=path,
-                    filename=filename,
-                    extension=extension,
-                    text=content,
-                    extraction_method=f"text-{encoding}",
-                )
-            except UnicodeDecodeError:
-                continue
+        text, encoding = self._decode_file(path)
+        return DocumentContent(
+            path=path,
+            filename=filename,
+            extension=extension,
+            text=text,
+            extraction_method=f"text-{encoding}",
+            metadata={"encoding": encoding},
+        )
 
-        logger.debug("Falling back to utf-8 with error replacement")
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            return DocumentContent(
-                path=path,
-                filename=filename,
-                extension=extension,
-                text=f.read(),
-                extraction_method="text-fallback",
-            )
+    def _sniff_html_charset(self, head: bytes) -> Optional[str]:
+        """Find the charset declared in an HTML <meta> tag."""
+        match = re.search(rb'<meta[^>]+charset\s*=\s*["\']?([A-Za-z0-9._-]+)', head[:4096], re.IGNORECASE)
+        if not match:
+            return None
+        charset = match.group(1).decode('ascii')
+        # Browsers read Latin-1 declarations as windows-1252, and so do portal exports
+        if charset.lower() in ('iso-8859-1', 'latin-1', 'latin1', 'us-ascii'):
+            return 'cp1252'
+        return charset
+
+    def _iter_decoded(self, f: BinaryIO, head: bytes, encoding: str, errors: str = 'strict') -> Iterator[str]:
+        """Decode an already opened file chunk by chunk, starting with head."""
+        decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        yield decoder.decode(head)
+        for block in iter(lambda: f.read(self.XML_CHUNK_SIZE), b''):
+            yield decoder.decode(block)
+        yield decoder.decode(b'', final=True)
 
     def _read_html(self, path: str) -> DocumentContent:
-        """Extract text from HTML."""
+        """
+        Extract text from HTML in a single streaming pass.
+
+        Script and style content is skipped and block elements (paragraphs,
+        headings, list items, table rows) become line breaks; table cells are
+        separated by tabs.
+        """
         filename = os.path.basename(path)
         extension = os.path.splitext(filename)[1].lower()
         logger.debug(f"Attempting HTML extraction for {filename}")
 
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-
-        import re
-        content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<[^>]+>', ' ', content)
-        content = re.sub(r'\s+', ' ', content)
+        with self._open_binary(path) as f:
+            head = f.read(self.ENCODING_SAMPLE_SIZE)
+            encoding = self._detect_encoding(head, self._sniff_html_charset(head))
+            try:
+                text = html_to_text(self._iter_decoded(f, head, encoding))
+            except UnicodeDecodeError:
+                logger.debug(f"Invalid {encoding} beyond sample, decoding as cp1252")
+                f.seek(0)
+                encoding = 'cp1252'
+                text = html_to_text(self._iter_decoded(f, b'', encoding, errors='replace'))
 
         return DocumentContent(
             path=path,
             filename=filename,
             extension=extension,
-            text=content.strip(),
-            extraction_method="html-strip",
+            text=text,
+            extraction_method="html-parser",
+            metadata={"encoding": encoding},
         )
 
     def _read_gaeb(self, path: str) -> DocumentContent:
-        """Read GAEB files (German construction tendering format)."""
-        logger.debug(f"Reading GAEB file as XML: {os.path.basename(path)}")
-        return self._read_xml(path)
+        """
+        Read GAEB files (German construction tendering format).
+
+        GAEB DA XML is parsed structurally: the positions and categories are
+        kept in metadata["gaeb"] so the extractor can build graph nodes without
+        an LLM call. Other GAEB variants fall back to the generic XML reader.
+        """
+        filename = os.path.basename(path)
+        extension = os.path.splitext(filename)[1].lower()
+        logger.debug(f"Attempting GAEB extraction for {filename}")
+
+        try:
+            with self._open_binary(path) as f:
+                boq = parse_gaeb_xml(f)
+        except (NotGaebError, ET.ParseError) as e:
+            logger.debug(f"Not a GAEB DA XML file ({e}), reading as XML: {filename}")
+            return self._read_xml(path, detect_gaeb=False)
+
+        return DocumentContent(
+            path=path,
+            filename=filename,
+            extension=extension,
+            text=gaeb_to_text(boq),
+            extraction_method="gaeb-xml",
+            metadata={"gaeb": boq, "position_count": len(boq["positions"])},
+        )
 
     def _read_unknown(self, path: str) -> DocumentContent:
-        """Attempt to read an unknown file format."""
+        """Attempt to read an unknown file format as text."""
         filename = os.path.basename(path)
         extension = os.path.splitext(filename)[1].lower()
         logger.debug(f"Attempting generic read for unknown format: {extension}")
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            text, encoding = self._decode_file(path)
+        except (OSError, LookupError) as e:
+            logger.warning(f"Unable to extract text from {extension} file: {filename}")
             return DocumentContent(
                 path=path,
                 filename=filename,
                 extension=extension,
-                text=content,
-                extraction_method="text-attempt",
+                text="",
+                error=f"Unable to extract text from {extension} file: {e}"
             )
-        except UnicodeDecodeError:
-            pass
-
-        for encoding in ['latin-1', 'cp1252']:
-            try:
-                with open(path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                logger.debug(f"Read unknown format with encoding: {encoding}")
-                return DocumentContent(
-                    path=path,
-                    filename=filename,
-                    extension=extension,
-                    text=content,
-                    extraction_method=f"text-{encoding}",
-                )
-            except:
-                continue
 
-        logger.warning(f"Unable to extract text from {extension} file: {filename}")
         return DocumentContent(
             path=path,
             filename=filename,
             extension=extension,
-            text="",
-            error=f"Unable to extract text from {extension} file"
+            text=text,
+            extraction_method=f"text-{encoding}",
+            metadata={"encoding": encoding},
         )
 
-    def read_directory(self, directory: str, recursive: bool = True) -> list[DocumentContent]:
-        """Read all documents in a directory."""
-        documents = []
+    def _skip_reason(self, name: str) -> Optional[str]:
+        """Return why a file should not be read (a skipped-counter key), or None."""
+        basename = name.replace('\\', '/').rsplit('/', 1)[-1]
+        suffix = os.path.splitext(basename)[1].lower()
+        if basename.startswith('.') or '/__MACOSX/' in f"/{name}":
+            return "hidden"
+        if suffix in ('.zip', '.rar', '.7z', '.tar', '.gz'):
+            return "archive"
+        if suffix in ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico'):
+            return "image"
+        # Skip state directory files (logs, saved graphs, etc.)
+        if '.tender_state' in name:
+            return "state"
+        return None
+
+    def should_read(self, path: str, archives: bool = False) -> bool:
+        """
+        Whether read_directory would read a file (archives only when
+        archives=True and not already extracted next to the archive).
+        """
+        reason = self._skip_reason(path)
+        if reason == "archive" and archives and is_archive(path):
+            return not Path(path).with_suffix('').is_dir()
+        return reason is None
+
+    def read_directory(
+        self,
+        directory: str,
+        recursive: bool = True,
+        workers: Optional[int] = 1,
+        archives: bool = False
+    ) -> list[DocumentContent]:
+        """
+        Read all documents in a directory.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to descend into subdirectories
+            workers: Number of parser processes. 1 reads sequentially in this
+                process, None uses one process per CPU core.
+            archives: Read ZIP archives in memory (see read_archive) instead of
+                skipping them. Archives that already have an extracted sibling
+                directory are still skipped.
+
+        Returns:
+            List of DocumentContent objects in directory scan order, followed
+            by archive members
+        """
         directory = Path(directory)
 
         logger.info(f"Scanning directory: {directory} (recursive={recursive})")
@@ -504,27 +1051,283 @@ class DocumentReader:
         logger.debug(f"Found {len(files)} total files")
 
         skipped = {"hidden": 0, "archive": 0, "image": 0, "state": 0}
+        paths = []
+        archive_paths = []
 
         for file_path in files:
             if file_path.is_file():
-                if file_path.name.startswith('.'):
-                    skipped["hidden"] += 1
+                if not self.should_read(str(file_path), archives=archives):
+                    skipped[self._skip_reason(str(file_path))] += 1
                     continue
-                if file_path.suffix.lower() in ('.zip', '.rar', '.7z', '.tar', '.gz'):
-                    skipped["archive"] += 1
+                if is_archive(file_path.name):
+                    archive_paths.append(str(file_path))
                     continue
-                if file_path.suffix.lower() in ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico'):
-                    skipped["image"] += 1
-                    continue
-                # Skip state directory files (logs, saved graphs, etc.)
-                if '.tender_state' in str(file_path):
-                    skipped["state"] += 1
+
+                paths.append(str(file_path))
+
+        start_time = time.perf_counter()
+        documents = self.read_many(paths, workers=workers)
+        for archive_path in archive_paths:
+            documents.extend(self.read_archive(archive_path, workers=workers))
+        elapsed = time.perf_counter() - start_time
+
+        logger.info(f"Read {len(documents)} documents in {elapsed:.1f}s, skipped: {skipped}")
+        return documents
+
+    ARCHIVE_IN_FLIGHT = 2  # Archive members queued or parsing per worker
+
+    def read_archive(self, path: str, workers: Optional[int] = 1) -> list[DocumentContent]:
+        """
+        Read every document inside a ZIP archive without extracting it.
+
+        Members are parsed as they are streamed out of the archive: each one
+        is handed to a process pool (when workers > 1) as soon as it has
+        been decompressed and hashed, with at most ARCHIVE_IN_FLIGHT members
+        per worker waiting or being parsed, so memory stays bounded by a few
+        members rather than the whole decompressed archive. Nested archives
+        are expanded and byte-identical members are parsed once. Nothing is
+        written to disk. Member results use virtual paths such as
+        ``bundle.zip/Formblaetter/124.pdf`` and record the archive in
+        metadata["archive"].
+
+        If the archive breaks self.archive_limits, members read so far are
+        kept and an error DocumentContent for the archive is appended.
+        Members that cannot be decompressed (encrypted, or an unsupported
+        compression method) get an error DocumentContent of their own.
+        """
+        path = os.path.abspath(path)
+        filename = os.path.basename(path)
+        logger.info(f"Reading archive in memory: {filename}")
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        member_paths = []
+        canonical = []  # Index of the first byte-identical member, per member
+        first_by_hash: dict[tuple, int] = {}
+        parsed = []     # Per distinct member: DocumentContent or Future
+        in_flight = set()
+        pool = None
+        error = None
+        try:
+            try:
+                for member_path, data in iter_archive_members(path, path, self.archive_limits):
+                    if self._skip_reason(member_path[len(path):]):
+                        continue
+                    index = len(member_paths)
+                    member_paths.append(member_path)
+                    if isinstance(data, ArchiveMemberError):
+                        canonical.append(index)
+                        member_name = os.path.basename(member_path)
+                        parsed.append(DocumentContent(
+                            path=member_path,
+                            filename=member_name,
+                            extension=os.path.splitext(member_name)[1].lower(),
+                            text="",
+                            error=f"Could not decompress archive member: {data}",
+                        ))
+                        continue
+                    key = (hashlib.sha256(data).hexdigest(), os.path.splitext(member_path)[1].lower())
+                    canonical.append(first_by_hash.setdefault(key, index))
+                    if canonical[index] != index:
+                        continue
+
+                    if workers <= 1:
+                        parsed.append(self.read_bytes(data, member_path))
+                        continue
+
+                    if pool is None:
+                        logger.info(f"Reading archive members with {workers} worker processes")
+                        pool = self._executor(workers)
+                    if len(in_flight) >= workers * self.ARCHIVE_IN_FLIGHT:
+                        _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    if self.isolation is not None:
+                        future = pool.submit(self._read_isolated, member_path, data)
+                    else:
+                        future = pool.submit(_read_bytes_in_worker, (member_path, data))
+                    del data  # Only the pool holds the bytes now, until the member is parsed
+                    in_flight.add(future)
+                    parsed.append(future)
+            except ArchiveLimitError as e:
+                logger.error(f"Archive {filename} exceeds limits: {e}")
+                error = f"Archive exceeds limits: {e}"
+            except (zipfile.BadZipFile, OSError, RuntimeError, NotImplementedError) as e:
+                logger.error(f"Could not read archive {filename}: {e}")
+                error = f"Could not read archive: {e}"
+
+            documents = [item.result() if isinstance(item, Future) else item for item in parsed]
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        documents = self._expand_duplicates(member_paths, canonical, documents)
+        for doc in documents:
+            doc.metadata["archive"] = path
+
+        if error:
+            documents.append(DocumentContent(
+                path=path,
+                filename=filename,
+                extension=os.path.splitext(filename)[1].lower(),
+                text="",
+                error=error,
+            ))
+
+        logger.info(f"Read {len(documents)} members from {filename}")
+        return documents
+
+    def read_many(self, paths: list[str], workers: Optional[int] = 1) -> list[DocumentContent]:
+        """
+        Read a list of documents, optionally spread across a process pool.
+
+        Results are returned in the same order as ``paths``. Each document
+        carries its own ``parse_seconds`` so slow files can be spotted.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # Byte-identical copies (same Formblatt in several folders) are parsed once
+        canonical = self._find_identical_files(paths)
+        unique_paths = [path for i, path in enumerate(paths) if canonical[i] == i]
+
+        if workers <= 1 or len(unique_paths) <= 1:
+            unique_documents = [self.read(path) for path in unique_paths]
+        else:
+            unique_documents = self._read_parallel(unique_paths, workers)
+
+        if self.cache is not None:
+            self.cache.flush()
+        return self._expand_duplicates(paths, canonical, unique_documents)
+
+    def _find_identical_files(self, paths: list[str]) -> list[int]:
+        """
+        Map each path to the index of the first byte-identical path.
+
+        Files are only hashed when another file has the same size and
+        extension, so bundles without duplicates pay no extra I/O.
+        """
+        canonical = list(range(len(paths)))
+        by_size: dict[tuple, list[int]] = {}
+        for i, path in enumerate(paths):
+            try:
+                key = (os.path.getsize(path), os.path.splitext(path)[1].lower())
+            except OSError:
+                continue
+            by_size.setdefault(key, []).append(i)
+
+        for indices in by_size.values():
+            if len(indices) < 2:
+                continue
+            first_by_hash: dict[str, int] = {}
+            for i in indices:
+                try:
+                    digest = hashlib.sha256()
+                    with open(paths[i], 'rb') as f:
+                        for block in iter(lambda: f.read(1024 * 1024), b''):
+                            digest.update(block)
+                except OSError:
                     continue
+                canonical[i] = first_by_hash.setdefault(digest.hexdigest(), i)
+
+        duplicates = sum(1 for i, c in enumerate(canonical) if i != c)
+        if duplicates:
+            logger.info(f"Skipping parse of {duplicates} byte-identical duplicate files")
+        return canonical
+
+    def _expand_duplicates(
+        self,
+        paths: list[str],
+        canonical: list[int],
+        unique_documents: list[DocumentContent]
+    ) -> list[DocumentContent]:
+        """Rebuild the full result list, copying parse results to duplicates."""
+        by_index = {}
+        unique_iter = iter(unique_documents)
+        documents = []
+        for i, path in enumerate(paths):
+            if canonical[i] == i:
+                doc = next(unique_iter)
+                by_index[i] = doc
+            else:
+                original = by_index[canonical[i]]
+                doc = dataclasses.replace(
+                    original,
+                    path=os.path.abspath(path),
+                    filename=os.path.basename(path),
+                    metadata={**original.metadata, "duplicate_of": original.path},
+                    parse_seconds=0.0,
+                )
+            documents.append(doc)
+        return documents
 
-                doc = self.read(str(file_path))
-                documents.append(doc)
+    def _executor(self, workers: int):
+        """
+        Pool for parallel parsing: worker processes, or with isolation threads
+        that each drive their own isolated parser process.
+        """
+        if self.isolation is not None:
+            from concurrent.futures import ThreadPoolExecutor
+            return ThreadPoolExecutor(max_workers=workers)
+
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.options, str(self.cache.cache_dir) if self.cache is not None else None)
+        )
+
+    def _read_parallel(self, paths: list[str], workers: int) -> list[DocumentContent]:
+        """
+        Read documents in a process pool.
+
+        Cache hits for files whose fingerprint is already in the path index
+        are served in this process. Other files are hashed by the workers
+        while they read them, so a cold cache does not hash every file here
+        before the pool starts.
+        """
+        documents: list[Optional[DocumentContent]] = [None] * len(paths)
+        pending = []  # (position, path) of files for the workers
+
+        for i, path in enumerate(paths):
+            path = os.path.abspath(path)
+            cached = None
+            content_hash = self.cache.known_fingerprint(path) if self.cache is not None else None
+            if content_hash is not None:
+                start_time = time.perf_counter()
+                filename = os.path.basename(path)
+                extension = os.path.splitext(filename)[1].lower()
+                entry = self.cache.get_by_hash(content_hash, extension, self._cache_variant())
+                if entry is not None:
+                    self.cache.record(hit=True)
+                    logger.debug(f"Parse cache hit: {filename}")
+                    cached = self._cached_document(path, filename, extension, entry)
+                    cached.parse_seconds = time.perf_counter() - start_time
+            if cached is not None:
+                documents[i] = cached
+            else:
+                pending.append((i, path))
+
+        if pending:
+            workers = min(workers, len(pending))
+            logger.info(f"Reading {len(pending)} documents with {workers} worker processes")
+            # Small chunks keep workers busy when file sizes are very uneven
+            chunksize = max(1, len(pending) // (workers * 8))
+            with self._executor(workers) as pool:
+                if self.isolation is not None:
+                    results = pool.map(self._read_isolated, [p for _, p in pending])
+                    results = ((result, None, False) for result in results)
+                else:
+                    results = pool.map(_read_in_worker, [p for _, p in pending], chunksize=chunksize)
+                for (i, path), (result, fingerprint, hit) in zip(pending, results):
+                    documents[i] = result
+                    if self.cache is None:
+                        continue
+                    if fingerprint is not None:
+                        self.cache.remember(path, fingerprint)
+                    self.cache.record(hit)
+                    if not hit:
+                        self._store_cached(result)
 
-        logger.info(f"Read {len(documents)} documents, skipped: {skipped}")
         return documents
 
     def extract_archives(self, directory: str) -> list[str]:
@@ -564,17 +1367,94 @@ class DocumentReader:
         return extracted
 
 
+_worker_reader: Optional[DocumentReader] = None
+_worker_cache: Optional[ParseCache] = None
+
+
+def _init_worker(options: dict, cache_dir: Optional[str] = None):
+    """Process pool initializer - builds one DocumentReader per worker process."""
+    global _worker_reader, _worker_cache
+    _worker_reader = DocumentReader(**options)
+    _worker_cache = ParseCache(cache_dir, load_index=False) if cache_dir else None
+
+
+def _read_in_worker(path: str) -> tuple[DocumentContent, Optional[dict], bool]:
+    """
+    Process pool entry point - reads one document with the worker's reader.
+
+    With a parse cache, the worker hashes the file and serves cache hits
+    itself, so hashing runs in parallel too.
+
+    Returns:
+        Tuple of (document, fingerprint for the parent's path index or None,
+        whether the document came from the parse cache)
+    """
+    if _worker_cache is None:
+        return _worker_reader.read(path), None, False
+
+    start_time = time.perf_counter()
+    fingerprint = hash_file(path)
+    if fingerprint is not None:
+        filename = os.path.basename(path)
+        extension = os.path.splitext(filename)[1].lower()
+        entry = _worker_cache.get_by_hash(fingerprint["sha256"], extension, _worker_reader._cache_variant())
+        if entry is not None:
+            document = _worker_reader._cached_document(path, filename, extension, entry)
+            document.parse_seconds = time.perf_counter() - start_time
+            return document, fingerprint, True
+    return _worker_reader.read(path), fingerprint, False
+
+
+def _read_bytes_in_worker(member: tuple[str, bytes]) -> DocumentContent:
+    """Process pool entry point - reads one in-memory archive member."""
+    member_path, data = member
+    return _worker_reader.read_bytes(data, member_path)
+
+
+_default_readers: dict[bool, DocumentReader] = {}
+
+
+def get_default_reader(isolated: bool = False) -> DocumentReader:
+    """
+    The DocumentReader with default options shared within this process.
+
+    Args:
+        isolated: Return the shared reader that parses in worker
+            subprocesses with the default IsolationLimits
+    """
+    if isolated not in _default_readers:
+        _default_readers[isolated] = DocumentReader(isolation=IsolationLimits() if isolated else None)
+    return _default_readers[isolated]
+
+
 def read_document(path: str) -> DocumentContent:
-    """Read a single document."""
-    reader = DocumentReader()
-    return reader.read(path)
+    """Read a single document with the shared default reader."""
+    return get_default_reader().read(path)
 
 
-def read_all_documents(directory: str, extract_archives: bool = True) -> list[DocumentContent]:
-    """Read all documents in a directory, optionally extracting archives first."""
-    reader = DocumentReader()
+def read_all_documents(
+    directory: str,
+    extract_archives: bool = False,
+    workers: Optional[int] = 1,
+    cache: Optional[ParseCache] = None
+) -> list[DocumentContent]:
+    """
+    Read all documents in a directory, including the members of ZIP archives.
+
+    Args:
+        directory: Directory to scan
+        extract_archives: Extract archives into sibling directories first,
+            as older versions did, instead of reading them in memory
+        workers: Number of parser processes (None = one per CPU core)
+        cache: Optional ParseCache consulted before parsing
+
+    Returns:
+        List of DocumentContent objects
+    """
+    reader = DocumentReader(cache=cache)
 
     if extract_archives:
         reader.extract_archives(directory)
+        return reader.read_directory(directory, workers=workers)
 
-    return reader.read_directory(directory)
+    return reader.read_directory(directory, workers=workers, archives=True)
@@ -0,0 +1,217 @@
+"""
+DOCX Text Extraction
+
+Streams ``word/document.xml`` out of a DOCX file through expat and emits
+paragraphs and tables in document order, so form instructions stay next to
+the tables they describe. Checkbox content controls (w14:checkbox) and
+legacy checkbox form fields are rendered as ☐ / ☒.
+"""
+
+import zipfile
+from dataclasses import dataclass, field
+from typing import BinaryIO, Optional, Union
+from xml.parsers import expat
+
+DOCUMENT_PART = 'word/document.xml'
+CHUNK_SIZE = 1024 * 1024
+
+CHECKED = '☒'
+UNCHECKED = '☐'
+
+# Same table markup as the earlier python-docx based reader
+TABLE_START = '[TABLE]'
+TABLE_END = '[/TABLE]'
+CELL_SEPARATOR = ' | '
+
+_TRUE_VALUES = {'1', 'true', 'on'}
+
+
+def _local(name: str) -> str:
+    return name.rsplit('}', 1)[-1]
+
+
+def _val(attrs: dict) -> Optional[str]:
+    """The w:val / w14:val attribute, whatever its namespace."""
+    for name, value in attrs.items():
+        if _local(name) == 'val':
+            return value
+    return None
+
+
+@dataclass
+class _Table:
+    rows: list[list[str]] = field(default_factory=list)
+    cell: Optional[list[str]] = None   # Paragraphs of the open cell
+
+
+@dataclass
+class DocxText:
+    """Text of a DOCX body plus counts for DocumentContent metadata."""
+    blocks: list[str] = field(default_factory=list)
+    paragraph_count: int = 0
+    table_count: int = 0
+    checkbox_count: int = 0
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(self.blocks)
+
+
+class _BodyHandler:
+    """expat callbacks that turn WordprocessingML into text blocks."""
+
+    def __init__(self):
+        self.result = DocxText()
+        self.paragraphs: list[list[str]] = []  # Open paragraphs (text boxes nest them)
+        self.tables: list[_Table] = []
+        self.in_text = False
+        self.fallback_depth = 0     # Inside mc:Fallback, which duplicates mc:Choice
+        self.checkbox: Optional[dict] = None  # Open checkbox content control
+        self.sdt_depth = 0
+        self.form_checkbox: Optional[dict] = None  # Legacy w:ffData/w:checkBox
+        self.pending_glyph = ""     # Checkbox of a block-level control, before its paragraph
+        self.in_paragraph_properties = False
+
+    def start(self, name, attrs):
+        local = _local(name)
+        if self.fallback_depth:
+            if local == 'Fallback':
+                self.fallback_depth += 1
+            return
+
+        if local == 'Fallback':
+            self.fallback_depth = 1
+        elif local == 't' and not self.checkbox_content:
+            self.in_text = True
+        elif local == 'p':
+            self.paragraphs.append([self.pending_glyph] if self.pending_glyph else [])
+            self.pending_glyph = ""
+        elif local == 'pPr':
+            # Holds <w:tabs><w:tab/></w:tabs> tab stops, which are not text
+            self.in_paragraph_properties = True
+        elif local in ('tab', 'ptab') and self.paragraphs and not self.in_paragraph_properties:
+            self.paragraphs[-1].append('\t')
+        elif local in ('br', 'cr') and self.paragraphs:
+            self.paragraphs[-1].append('\n')
+        elif local == 'noBreakHyphen' and self.paragraphs:
+            self.paragraphs[-1].append('-')
+        elif local == 'tbl':
+            self.tables.append(_Table())
+        elif local == 'tr' and self.tables:
+            self.tables[-1].rows.append([])
+        elif local == 'tc' and self.tables:
+            self.tables[-1].cell = []
+        elif local == 'sdt':
+            self.sdt_depth += 1
+        elif local == 'checkbox':
+            # w14:checkbox in the properties of the innermost content control
+            self.checkbox = {"depth": self.sdt_depth, "checked": False, "in_content": False}
+        elif local == 'checked' and self.checkbox is not None:
+            self.checkbox["checked"] = (_val(attrs) or '1').lower() in _TRUE_VALUES
+        elif local == 'sdtContent' and self.checkbox is not None and self.checkbox["depth"] == self.sdt_depth:
+            self.checkbox["in_content"] = True
+            self._emit_checkbox(self.checkbox["checked"])
+        elif local == 'checkBox':
+            self.form_checkbox = {"default": False, "checked": None}
+        elif local in ('default', 'checked') and self.form_checkbox is not None:
+            value = (_val(attrs) or '1').lower() in _TRUE_VALUES
+            self.form_checkbox["default" if local == 'default' else "checked"] = value
+
+    def end(self, name):
+        local = _local(name)
+        if self.fallback_depth:
+            if local == 'Fallback':
+                self.fallback_depth -= 1
+            return
+
+        if local == 't':
+            self.in_text = False
+        elif local == 'pPr':
+            self.in_paragraph_properties = False
+        elif local == 'checkBox' and self.form_checkbox is not None:
+            checked = self.form_checkbox["checked"]
+            self._emit_checkbox(self.form_checkbox["default"] if checked is None else checked)
+            self.form_checkbox = None
+        elif local == 'p' and self.paragraphs:
+            self._end_paragraph("".join(self.paragraphs.pop()))
+        elif local == 'tc' and self.tables:
+            table = self.tables[-1]
+            if table.rows and table.cell is not None:
+                table.rows[-1].append("\n".join(table.cell).strip())
+            table.cell = None
+        elif local == 'tbl' and self.tables:
+            self._end_table(self.tables.pop())
+        elif local == 'sdt':
+            if self.checkbox is not None and self.checkbox["depth"] == self.sdt_depth:
+                self.checkbox = None
+            self.sdt_depth -= 1
+
+    def data(self, text):
+        if self.in_text and self.paragraphs and not self.fallback_depth:
+            self.paragraphs[-1].append(text)
+
+    @property
+    def checkbox_content(self) -> bool:
+        """Inside a checkbox's content, whose glyph is replaced by its state."""
+        return self.checkbox is not None and self.checkbox["in_content"]
+
+    def _emit_checkbox(self, checked: bool):
+        glyph = CHECKED if checked else UNCHECKED
+        if self.paragraphs:
+            self.paragraphs[-1].append(glyph)
+        else:
+            self.pending_glyph += glyph
+        self.result.checkbox_count += 1
+
+    def _end_paragraph(self, text: str):
+        self.result.paragraph_count += 1
+        if self.paragraphs:
+            # A text box paragraph: keep it in the anchoring paragraph
+            if text.strip():
+                self.paragraphs[-1].append(" " + text)
+        elif self.tables and self.tables[-1].cell is not None:
+            self.tables[-1].cell.append(text)
+        elif text.strip():
+            self.result.blocks.append(text)
+
+    def _end_table(self, table: _Table):
+        self.result.table_count += 1
+        rows = [CELL_SEPARATOR.join(cells) for cells in table.rows]
+        rows = [row for row in rows if row.replace('|', '').strip()]
+        if not rows:
+            return
+        if self.tables and self.tables[-1].cell is not None:
+            # Nested table: flatten into the enclosing cell
+            self.tables[-1].cell.extend(rows)
+        else:
+            self.result.blocks.append(f"\n{TABLE_START}\n" + "\n".join(rows) + f"\n{TABLE_END}")
+
+
+def read_docx_text(source: Union[str, BinaryIO]) -> DocxText:
+    """
+    Extract the body text of a DOCX file (path or binary file object).
+
+    The document part is parsed incrementally, so memory is bounded by the
+    chunk size plus the extracted text.
+
+    Raises:
+        KeyError: If the file has no word/document.xml part
+        zipfile.BadZipFile: If the file is not a ZIP container
+        xml.parsers.expat.ExpatError: If the document part is malformed
+    """
+    handler = _BodyHandler()
+    parser = expat.ParserCreate(namespace_separator='}')
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start
+    parser.EndElementHandler = handler.end
+    parser.CharacterDataHandler = handler.data
+
+    with zipfile.ZipFile(source, 'r') as z:
+        with z.open(DOCUMENT_PART) as f:
+            while True:
+                block = f.read(CHUNK_SIZE)
+                parser.Parse(block, not block)
+                if not block:
+                    break
+
+    return handler.result
@@ -0,0 +1,211 @@
+"""
+Concurrent Extraction Engine
+
+Runs the LLM calls for many documents concurrently on an async
+OpenAI-compatible client. A tender's documents are independent until they
+are merged into the requirement graph, so only the API calls overlap; the
+responses are merged one document at a time in input order, which gives
+the same graph as RequirementExtractor.process_directory regardless of
+which call finishes first. Small documents are packed into shared requests
+the same way as in RequirementExtractor.extract_documents.
+
+When the extractor streams, items are reported through item_callback as
+soon as they arrive, before their document is merged.
+"""
+
+import time
+import asyncio
+from typing import Callable, Optional
+
+from .graph import RequirementGraph
+from .document_reader import DocumentContent
+from .extractor import RequirementExtractor, ExtractionResult, PACKED_EXTRACTION_SCHEMA
+from .logging_config import get_logger
+
+logger = get_logger("extraction_engine")
+
+
+class _ItemStream:
+    """
+    Reports the items of a streamed response to item_callback(document_name, item).
+
+    Reported items cannot be taken back, so after reset() a retried call
+    only reports the items past those an earlier attempt already reported.
+    """
+
+    def __init__(self, callback: Callable, document: DocumentContent):
+        self.callback = callback
+        self.document = document
+        self.reported = 0  # Items reported across all attempts
+        self.position = 0  # Items seen in the current attempt
+
+    def item(self, item: dict, document_type: Optional[str]):
+        self.position += 1
+        if self.position > self.reported:
+            self.reported = self.position
+            self.callback(self.document.filename, item)
+
+    def reset(self):
+        self.position = 0  # Nothing was added to the graph yet
+
+
+class AsyncExtractionEngine:
+    """
+    Extracts documents with up to ``concurrency`` LLM requests in flight.
+
+    ``client_factory`` creates the async client (e.g. openai.AsyncOpenAI).
+    A new client is created for every run and closed afterwards, because an
+    async client's connection pool is bound to the event loop it was used on.
+    """
+
+    def __init__(
+        self,
+        extractor: RequirementExtractor,
+        client_factory: Callable,
+        concurrency: int = 4,
+        max_content_length: int = 50000,
+        item_callback: Optional[Callable] = None
+    ):
+        self.extractor = extractor
+        self.client_factory = client_factory
+        self.concurrency = max(1, concurrency)
+        self.max_content_length = max_content_length
+        self.item_callback = item_callback  # item_callback(document_name, item) for streamed items
+        logger.debug(f"Initialized AsyncExtractionEngine (concurrency={self.concurrency})")
+
+    async def extract_documents_async(
+        self,
+        documents: list[DocumentContent],
+        graph: RequirementGraph,
+        progress_callback: Optional[callable] = None
+    ) -> list[ExtractionResult]:
+        """
+        Extract documents concurrently and merge them into the graph in order.
+
+        Args:
+            documents: Documents to extract
+            graph: Graph to add to
+            progress_callback: Optional callback(current, total, document_name),
+                called as each document's LLM call finishes
+
+        Returns:
+            Extraction results in the same order as ``documents``
+        """
+        total = len(documents)
+        completed = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+        client = self.client_factory()
+
+        async def call(chunk: DocumentContent, sink=None):
+            async with semaphore:
+                prompt = self.extractor._build_prompt(chunk, self.max_content_length)
+                return await self.extractor._call_llm_async(client, chunk, prompt, sink=sink)
+
+        async def fetch(document: DocumentContent):
+            if not self.extractor._needs_llm(document):
+                return None
+            logger.info(f"Extracting requirements from: {document.filename}")
+            # Long documents are split into chunks, which share the concurrency limit
+            chunks = self.extractor._split(document, self.max_content_length)
+            if len(chunks) == 1 and self.extractor.stream and self.item_callback:
+                outcomes = [await call(document, _ItemStream(self.item_callback, document))]
+            else:
+                outcomes = await asyncio.gather(*(call(chunk) for chunk in chunks))
+            return chunks, outcomes
+
+        async def fetch_packed(batch_documents: list[DocumentContent]):
+            async with semaphore:
+                prompt = self.extractor._build_packed_prompt(batch_documents)
+                label = self.extractor._pack_label(batch_documents)
+                return await self.extractor._call_llm_async(client, label, prompt, PACKED_EXTRACTION_SCHEMA)
+
+        async def fetch_batch(batch_documents: list[DocumentContent]):
+            nonlocal completed
+            if len(batch_documents) == 1:
+                outcome = await fetch(batch_documents[0])
+            else:
+                outcome = await fetch_packed(batch_documents)
+            for document in batch_documents:
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, document.filename)
+            return outcome
+
+        batches = self.extractor._plan_batches(documents)
+        tasks = [asyncio.create_task(fetch_batch([documents[i] for i in batch])) for batch in batches]
+        results: list[Optional[ExtractionResult]] = [None] * total
+        try:
+            # Awaiting in batch order keeps the merge order deterministic
+            for batch, task in zip(batches, tasks):
+                batch_documents = [documents[i] for i in batch]
+                outcome = await task
+                if len(batch) == 1:
+                    batch_results = [self._merge(batch_documents[0], graph, outcome)]
+                else:
+                    batch_results = self.extractor._apply_packed(batch_documents, graph, outcome)
+                for i, result in zip(batch, batch_results):
+                    results[i] = result
+        finally:
+            for task in tasks:
+                task.cancel()
+            close = getattr(client, "close", None)
+            if close is not None:
+                await close()
+        return results
+
+    def _merge(self, document: DocumentContent, graph: RequirementGraph, outcome) -> ExtractionResult:
+        """Add one document's LLM outcome (its chunks and their outcomes) to the graph."""
+        if outcome is None:
+            # Unreadable or GAEB document: extract() handles it without the LLM
+            return self.extractor.extract(document, graph)
+
+        chunks, outcomes = outcome
+        return self.extractor._apply_outcomes(document, graph, outcomes, chunks=chunks)
+
+    def extract_documents(
+        self,
+        documents: list[DocumentContent],
+        graph: RequirementGraph,
+        progress_callback: Optional[callable] = None
+    ) -> list[ExtractionResult]:
+        """Synchronous wrapper for extract_documents_async (runs its own event loop)."""
+        return asyncio.run(self.extract_documents_async(documents, graph, progress_callback))
+
+    def process_directory(
+        self,
+        documents: list[DocumentContent],
+        graph: Optional[RequirementGraph] = None,
+        progress_callback: Optional[callable] = None
+    ) -> tuple[RequirementGraph, list[ExtractionResult]]:
+        """
+        Concurrent counterpart of RequirementExtractor.process_directory.
+
+        Args:
+            documents: List of DocumentContent objects to process
+            graph: Existing graph to add to, or None to create new
+            progress_callback: Optional callback(current, total, document_name)
+
+        Returns:
+            Tuple of (graph, list of extraction results)
+        """
+        if graph is None:
+            graph = RequirementGraph()
+
+        total = len(documents)
+        logger.info(f"Processing {total} documents ({self.concurrency} concurrent requests)...")
+        start_time = time.time()
+
+        results = self.extract_documents(documents, graph, progress_callback)
+        for result in results:
+            if result.error:
+                logger.warning(f"  Error in {result.document_path}: {result.error}")
+
+        logger.debug("Resolving placeholder references...")
+        self.extractor._resolve_placeholders(graph)
+
+        elapsed = time.time() - start_time
+        successful = len([r for r in results if not r.error])
+        logger.info(f"Processing complete: {successful}/{total} documents in {elapsed:.1f}s")
+        logger.info(f"Graph now has {len(graph.nodes)} nodes and {len(graph.edges)} edges")
+
+        return graph, results
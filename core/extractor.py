@@ -5,17 +5,39 @@ Uses the LLM to analyze documents and extract requirements, conditions,
 checkboxes, signatures, etc. into the requirement graph.
 """
 
+import copy
 import json
+import math
 import time
-from typing import Optional
+import asyncio
+from pathlib import Path
+from typing import Iterable, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
-from .graph import RequirementGraph, NodeType, EdgeType, CompletionStatus
+from .graph import RequirementGraph, Node, NodeType, EdgeType, CompletionStatus, normalize_title, title_tokens
 from .document_reader import DocumentContent
+from .gaeb import add_gaeb_to_graph
+from .chunking import CHUNK_OVERLAP, split_document, chunk_overlaps, merge_extractions
+from .llm_cache import LLMCache
+from .rate_limit import RateLimiter, estimate_tokens, retry_after_seconds
+from .packing import SMALL_DOCUMENT_CHARS, document_id, plan_batches, split_packed_extraction
+from .json_stream import JSONArrayStream
 from .logging_config import get_logger
 
 logger = get_logger("extractor")
 
+MAX_RETRIES = 3
+RETRY_DELAY = 2.0  # Seconds before the first retry, doubled for each further one
+RETRYABLE_STATUS = {400, 408, 409, 429, 500, 502, 503, 504}
+# Fallback for errors without an HTTP status (connection errors, other clients)
+RETRYABLE_ERRORS = [
+    'rate limit', 'timeout', 'connection', 'temporary',
+    '400', '429', '500', '502', '503', '504', 'overloaded'
+]
+MAX_CHUNK_WORKERS = 8  # Concurrent LLM calls for the chunks of one document
+PLACEHOLDER_MATCH = 0.6  # Title word overlap for a placeholder to match a document
+
 
 @dataclass
 class ExtractionResult:
@@ -27,6 +49,9 @@ class ExtractionResult:
     error: Optional[str] = None
 
 
+# Bump when EXTRACTION_SCHEMA or the handling of responses changes; part of the LLM cache key
+EXTRACTION_SCHEMA_VERSION = "1"
+
 # JSON Schema for structured response - Flattened to avoid nesting depth limits
 EXTRACTION_SCHEMA = {
     "name": "tender_extraction",
@@ -196,6 +221,84 @@ RELATIONSHIPS ARE CRITICAL - identify as many as possible:
 """
 
 
+def _packed_schema() -> dict:
+    """EXTRACTION_SCHEMA for several documents: items and relationships carry a document_id."""
+    schema = copy.deepcopy(EXTRACTION_SCHEMA)
+    schema["name"] = "tender_packed_extraction"
+    body = schema["schema"]
+    id_property = {
+        "type": "string",
+        "description": "Id of the document (D1, D2, ...) this entry was extracted from"
+    }
+    for key in ("items", "relationships"):
+        entry = body["properties"][key]["items"]
+        entry["properties"] = {"document_id": id_property, **entry["properties"]}
+        entry["required"] = ["document_id"] + entry["required"]
+
+    body["properties"] = {
+        "documents": {
+            "type": "array",
+            "description": "One entry per document",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "document_id": id_property,
+                    "document_summary": body["properties"]["document_summary"],
+                    "document_type": body["properties"]["document_type"],
+                },
+                "required": ["document_id", "document_summary", "document_type"],
+                "additionalProperties": False
+            }
+        },
+        "items": body["properties"]["items"],
+        "relationships": body["properties"]["relationships"],
+    }
+    body["required"] = ["documents", "items", "relationships"]
+    return schema
+
+
+# Several small documents in one request (see core.packing)
+PACKED_EXTRACTION_SCHEMA = _packed_schema()
+
+PACKED_EXTRACTION_PROMPT = """You are analyzing several short German tender (Vergabe/Ausschreibung) documents to extract all requirements, conditions, and actions needed for submission.
+
+Each document starts with a line "=== DOCUMENT <id>: <name> ===".
+
+{documents}
+
+---
+""" + EXTRACTION_PROMPT.split("\n---\n", 1)[1] + """
+SEVERAL DOCUMENTS:
+- The documents are independent: extract each one completely, as if it were the only one
+- Set document_id on every item to the id of the document it was extracted from
+- Set document_id on every relationship to the document of its source item
+- Return one entry in "documents" for every document id
+"""
+
+
+class _NodeStream:
+    """
+    Adds the items of a streamed response to the graph as they complete.
+
+    Nodes from an attempt that fails are removed again by reset(), so a
+    retried call does not leave duplicates behind.
+    """
+
+    def __init__(self, extractor: "RequirementExtractor", document: DocumentContent, graph: RequirementGraph):
+        self.extractor = extractor
+        self.document = document
+        self.graph = graph
+        self.nodes: list[Node] = []
+
+    def item(self, item: dict, document_type: Optional[str]):
+        self.nodes.append(self.extractor._create_node(self.document, self.graph, item, document_type))
+
+    def reset(self):
+        for node in self.nodes:
+            self.graph.remove_node(node.id)
+        self.nodes = []
+
+
 class RequirementExtractor:
     """
     Extracts requirements from documents using AI.
@@ -205,10 +308,30 @@ class RequirementExtractor:
     and across documents.
     """
 
-    def __init__(self, openai_client, model: str = None):
+    def __init__(
+        self,
+        openai_client,
+        model: str = None,
+        chunked: bool = True,
+        chunk_overlap: int = CHUNK_OVERLAP,
+        cache: Optional[LLMCache] = None,
+        pack: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        stream: bool = False,
+        node_callback: Optional[callable] = None,
+        root: Optional[str] = None
+    ):
         import os
         self.client = openai_client
         self.model = model or os.environ.get("LLM_MODEL", "google/gemini-3-flash-preview")
+        self.chunked = chunked  # Split long documents instead of truncating them
+        self.chunk_overlap = chunk_overlap
+        self.cache = cache  # Responses of identical requests are reused
+        self.pack = pack  # Extract several small documents per request
+        self.rate_limiter = rate_limiter  # Shared with other threads/processes using the API key
+        self.stream = stream  # Create nodes while the response is still being generated
+        self.node_callback = node_callback  # Called with every node as it is added to the graph
+        self.root = Path(root) if root else None  # Prompts show document paths relative to this
         self.processed_documents: set[str] = set()
         logger.info(f"Initialized RequirementExtractor with model: {model}")
 
@@ -218,7 +341,18 @@ class RequirementExtractor:
         graph: RequirementGraph,
         max_content_length: int = 50000
     ) -> ExtractionResult:
-        """Extract requirements from a document and add to the graph."""
+        """
+        Extract requirements from a document and add to the graph.
+
+        Documents longer than max_content_length are split into overlapping
+        chunks that are extracted in parallel and merged (see core.chunking),
+        or truncated when the extractor was created with chunked=False.
+
+        With stream=True, a document extracted in a single request gets its
+        nodes added to the graph (and passed to node_callback) as each item
+        of the response completes, instead of after the whole response. If
+        the attempt then fails, those nodes are removed again before the retry.
+        """
         logger.info(f"Extracting requirements from: {document.filename}")
 
         if document.error or not document.is_successful:
@@ -231,174 +365,534 @@ class RequirementExtractor:
                 error=document.error or "No content extracted"
             )
 
-        # Truncate very long documents
+        # Structured GAEB bills of quantities need no LLM
+        if "gaeb" in document.metadata:
+            return self._extract_gaeb(document, graph)
+
+        chunks = self._split(document, max_content_length)
+        if len(chunks) == 1 and self.stream:
+            nodes = _NodeStream(self, document, graph)
+            outcome = self._call_llm(document, self._build_prompt(document, max_content_length), sink=nodes)
+            return self._apply_outcomes(document, graph, [outcome], nodes.nodes)
+        if len(chunks) == 1:
+            outcomes = [self._call_llm(document, self._build_prompt(document, max_content_length))]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CHUNK_WORKERS)) as pool:
+                outcomes = list(pool.map(
+                    lambda chunk: self._call_llm(chunk, self._build_prompt(chunk, max_content_length)),
+                    chunks
+                ))
+        return self._apply_outcomes(document, graph, outcomes, chunks=chunks)
+
+    def _needs_llm(self, document: DocumentContent) -> bool:
+        """Whether extract() would call the LLM for this document."""
+        return document.error is None and document.is_successful and "gaeb" not in document.metadata
+
+    def _split(self, document: DocumentContent, max_content_length: int) -> list[DocumentContent]:
+        """The chunks to extract a document in (the document itself unless chunking applies)."""
+        if not self.chunked or len(document.text) <= max_content_length:
+            return [document]
+        chunks = split_document(document, max_content_length, self.chunk_overlap)
+        logger.info(f"Extracting {document.filename} in {len(chunks)} chunks")
+        return chunks
+
+    def _prompt_path(self, document: DocumentContent) -> str:
+        """
+        The document path shown in prompts: relative to root when it lies
+        inside it, so the same tender in another checkout (or directory) makes
+        identical requests and shares LLM cache entries.
+        """
+        if self.root is not None:
+            try:
+                return Path(document.path).relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return document.path
+
+    def _build_prompt(self, document: DocumentContent, max_content_length: int = 50000) -> str:
+        """Build the extraction prompt, truncating very long documents."""
+        document_name = document.filename
+        if "chunk_count" in document.metadata:
+            document_name += f" (part {document.metadata['chunk_index'] + 1} of {document.metadata['chunk_count']}"
+            if "page_start" in document.metadata:
+                document_name += f", pages {document.metadata['page_start']}-{document.metadata['page_end']}"
+            document_name += ")"
+
         content = document.text
         original_length = len(content)
         if len(content) > max_content_length:
             content = content[:max_content_length] + "\n\n[... content truncated ...]"
             logger.debug(f"Truncated content from {original_length} to {max_content_length} chars")
 
-        # Build the prompt
         prompt = EXTRACTION_PROMPT.format(
-            document_path=document.path,
-            document_name=document.filename,
+            document_path=self._prompt_path(document),
+            document_name=document_name,
             document_content=content
         )
         logger.debug(f"Built prompt with {len(prompt)} chars")
+        return prompt
+
+    def _packable(self, document: DocumentContent) -> bool:
+        return self._needs_llm(document) and len(document.text) <= SMALL_DOCUMENT_CHARS
+
+    def _plan_batches(self, documents: list[DocumentContent]) -> list[list[int]]:
+        """Indexes of the documents to extract together (single documents unless packing)."""
+        if not self.pack:
+            return [[i] for i in range(len(documents))]
+        return plan_batches(documents, self._packable)
+
+    def _build_packed_prompt(self, documents: list[DocumentContent]) -> str:
+        """Build the extraction prompt for several small documents."""
+        blocks = [
+            f"=== DOCUMENT {document_id(i)}: {doc.filename} ===\nPATH: {self._prompt_path(doc)}\n\n{doc.text}"
+            for i, doc in enumerate(documents)
+        ]
+        prompt = PACKED_EXTRACTION_PROMPT.format(documents="\n\n".join(blocks))
+        logger.debug(f"Built packed prompt for {len(documents)} documents with {len(prompt)} chars")
+        return prompt
+
+    def _pack_label(self, documents: list[DocumentContent]) -> DocumentContent:
+        """Stand-in document naming a pack in log messages."""
+        return DocumentContent(
+            path=documents[0].path,
+            filename=f"{documents[0].filename} and {len(documents) - 1} more",
+            extension="",
+            text="",
+        )
+
+    def _request(self, prompt: str, schema: dict = EXTRACTION_SCHEMA) -> dict:
+        """Keyword arguments for chat.completions.create (structured JSON response)."""
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": schema
+            },
+        }
+
+    def _stream_request(self, request: dict) -> dict:
+        """The request as a streamed completion that reports its token usage at the end."""
+        return {**request, "stream": True, "stream_options": {"include_usage": True}}
+
+    def _stream_chunk(self, chunk, stream: JSONArrayStream, sink) -> Optional[object]:
+        """
+        Feed one chunk of a streamed completion to the scanner and the sink.
+
+        Returns:
+            The chunk's token usage (only sent with the last chunk), if any
+        """
+        choices = getattr(chunk, "choices", None)
+        if choices:
+            content = choices[0].delta.content
+            if content:
+                for item in stream.feed(content):
+                    sink.item(item, stream.values.get("document_type"))
+        return getattr(chunk, "usage", None)
+
+    def _streamed_text(self, stream: JSONArrayStream) -> str:
+        """Full text of a streamed response; raises ValueError if it is empty."""
+        if not stream.text:
+            raise ValueError("API stream returned no content")
+        logger.debug(f"Streamed response: {len(stream.text)} chars, {stream.count} items")
+        return stream.text
+
+    def _response_text(self, response) -> str:
+        """Content of an API response; raises ValueError if it is empty."""
+        if response is None:
+            raise ValueError("API returned None response")
+        if not hasattr(response, 'choices') or response.choices is None:
+            raise ValueError("API response has no choices")
+        if len(response.choices) == 0:
+            raise ValueError("API response has empty choices list")
+        if response.choices[0].message is None:
+            raise ValueError("API response message is None")
+        if response.choices[0].message.content is None:
+            raise ValueError("API response content is None")
+
+        response_text = response.choices[0].message.content
+        logger.debug(f"Response length: {len(response_text)} chars")
+        return response_text
+
+    def _cached_extraction(self, request: dict, document: DocumentContent) -> Optional[dict]:
+        """Parsed response for an identical earlier request, if cached."""
+        if self.cache is None:
+            return None
+        response_text = self.cache.get(request, EXTRACTION_SCHEMA_VERSION)
+        if response_text is None:
+            return None
+        logger.debug(f"Using cached LLM response for {document.filename}")
+        try:
+            return self._parse_json(response_text)
+        except json.JSONDecodeError:
+            return None
+
+    def _parse_json(self, response_text: str) -> dict:
+        """Parse the LLM response, with fallback to fix invalid Unicode escapes."""
+        try:
+            extraction = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Fix invalid Unicode escapes that some LLMs produce
+            import re
+            cleaned = re.sub(r'\\u(?![0-9a-fA-F]{4})', r'\\\\u', response_text)
+            extraction = json.loads(cleaned)
+        logger.debug(f"Parsed {len(extraction.get('items', []))} items from response")
+        return extraction
+
+    def _failed(self, document: DocumentContent, error: str, raw_extraction: Optional[dict] = None) -> ExtractionResult:
+        return ExtractionResult(
+            document_path=document.path,
+            nodes_created=[],
+            edges_created=[],
+            raw_extraction=raw_extraction or {},
+            error=error
+        )
+
+    def _attempt_failed(
+        self,
+        document: DocumentContent,
+        error: Exception,
+        attempt: int,
+        response_text: Optional[str]
+    ) -> Optional[ExtractionResult]:
+        """
+        Handle a failed LLM attempt (called from an except block).
+
+        Returns:
+            The failed ExtractionResult when giving up, or None to retry
+        """
+        if isinstance(error, json.JSONDecodeError):
+            last_error = f"Failed to parse LLM response as JSON: {error}"
+            logger.warning(f"JSON parse error (attempt {attempt + 1}): {error}")
+            if attempt == MAX_RETRIES - 1:
+                logger.error(last_error)
+                return self._failed(document, last_error, {"raw_response": response_text or ""})
+            return None
+
+        if isinstance(error, ValueError):
+            # Empty response - retry
+            last_error = f"Empty API response: {error}"
+            logger.warning(f"Empty response (attempt {attempt + 1}): {error}")
+            if attempt == MAX_RETRIES - 1:
+                logger.error(f"LLM API returned empty response after {MAX_RETRIES} attempts")
+                return self._failed(document, last_error)
+            return None
+
+        # Check if it's a retryable error
+        status = getattr(error, "status_code", None)
+        if status is not None:
+            retryable = status in RETRYABLE_STATUS
+        else:
+            error_str = str(error).lower()
+            retryable = any(x in error_str for x in RETRYABLE_ERRORS)
+        if retryable and attempt < MAX_RETRIES - 1:
+            logger.warning(f"Retryable error (attempt {attempt + 1}): {error}")
+            return None
+
+        logger.exception(f"LLM API error for {document.filename}")
+        return self._failed(document, f"LLM API error: {error}")
+
+    def _call_llm(
+        self,
+        document: DocumentContent,
+        prompt: str,
+        schema: dict = EXTRACTION_SCHEMA,
+        sink=None
+    ) -> tuple[Optional[dict], Optional[ExtractionResult]]:
+        """
+        Call the LLM with retries and exponential backoff.
 
-        # Retry logic with exponential backoff
-        max_retries = 3
-        retry_delay = 2.0
-        last_error = None
-        response_text = None
+        Args:
+            document: Document (or chunk) being extracted, for log messages
+            prompt: Extraction prompt
+            schema: Response schema
+            sink: Optional receiver of the items of a streamed response, with
+                item(item, document_type) called as each item completes and
+                reset() before a retry; None requests the complete response
 
-        for attempt in range(max_retries):
+        Returns:
+            Tuple of (parsed extraction, None) on success or (None, failed result)
+        """
+        request = self._request(prompt, schema)
+        cached = self._cached_extraction(request, document)
+        if cached is not None:
+            return cached, None
+
+        tokens = estimate_tokens(prompt)
+        retry_after = None
+        for attempt in range(MAX_RETRIES):
+            response_text = None
             try:
                 if attempt > 0:
-                    logger.info(f"Retry attempt {attempt + 1}/{max_retries} for {document.filename}")
-                    time.sleep(retry_delay * (2 ** (attempt - 1)))  # Exponential backoff
+                    logger.info(f"Retry attempt {attempt + 1}/{MAX_RETRIES} for {document.filename}")
+                    time.sleep(self._retry_delay(attempt, retry_after))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(tokens)
 
                 logger.debug(f"Calling LLM API ({self.model})...")
                 start_time = time.time()
+                completions = self.client.chat.completions
+                raw_api = getattr(completions, "with_raw_response", None)
+                call = request if sink is None else self._stream_request(request)
+                if self.rate_limiter is not None and raw_api is not None:
+                    # The raw response carries the rate-limit headers
+                    raw = raw_api.create(**call)
+                    self.rate_limiter.update_from_headers(raw.headers)
+                    response = raw.parse()
+                else:
+                    response = completions.create(**call)
+
+                if sink is None:
+                    usage = getattr(response, "usage", None)
+                    response_text = self._response_text(response)
+                else:
+                    stream = JSONArrayStream("items")
+                    usage = None
+                    for chunk in response:
+                        usage = self._stream_chunk(chunk, stream, sink) or usage
+                    response_text = self._streamed_text(stream)
+                logger.debug(f"LLM API call completed in {time.time() - start_time:.2f}s")
+                self._record_success(usage, tokens)
+
+                extraction = self._parse_json(response_text)
+                if self.cache is not None:
+                    self.cache.put(request, response_text, EXTRACTION_SCHEMA_VERSION)
+                return extraction, None
+            except Exception as e:
+                if sink is not None:
+                    sink.reset()
+                retry_after = self._record_failure(e)
+                failure = self._attempt_failed(document, e, attempt, response_text)
+                if failure is not None:
+                    return None, failure
+
+    async def _call_llm_async(
+        self,
+        client,
+        document: DocumentContent,
+        prompt: str,
+        schema: dict = EXTRACTION_SCHEMA,
+        sink=None
+    ) -> tuple[Optional[dict], Optional[ExtractionResult]]:
+        """_call_llm for an async OpenAI-compatible client."""
+        request = self._request(prompt, schema)
+        cached = self._cached_extraction(request, document)
+        if cached is not None:
+            return cached, None
+
+        tokens = estimate_tokens(prompt)
+        retry_after = None
+        for attempt in range(MAX_RETRIES):
+            response_text = None
+            try:
+                if attempt > 0:
+                    logger.info(f"Retry attempt {attempt + 1}/{MAX_RETRIES} for {document.filename}")
+                    await asyncio.sleep(self._retry_delay(attempt, retry_after))
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(tokens)
 
-                # Use structured response with JSON schema
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    response_format={
-                        "type": "json_schema",
-                        "json_schema": EXTRACTION_SCHEMA
-                    }
-                )
+                logger.debug(f"Calling LLM API ({self.model}) for {document.filename}...")
+                start_time = time.time()
+                completions = client.chat.completions
+                raw_api = getattr(completions, "with_raw_response", None)
+                call = request if sink is None else self._stream_request(request)
+                if self.rate_limiter is not None and raw_api is not None:
+                    raw = await raw_api.create(**call)
+                    self.rate_limiter.update_from_headers(raw.headers)
+                    response = await raw.parse()
+                else:
+                    response = await completions.create(**call)
+
+                if sink is None:
+                    usage = getattr(response, "usage", None)
+                    response_text = self._response_text(response)
+                else:
+                    stream = JSONArrayStream("items")
+                    usage = None
+                    async for chunk in response:
+                        usage = self._stream_chunk(chunk, stream, sink) or usage
+                    response_text = self._streamed_text(stream)
+                logger.debug(f"LLM API call for {document.filename} completed in {time.time() - start_time:.2f}s")
+                self._record_success(usage, tokens)
+
+                extraction = self._parse_json(response_text)
+                if self.cache is not None:
+                    self.cache.put(request, response_text, EXTRACTION_SCHEMA_VERSION)
+                return extraction, None
+            except Exception as e:
+                if sink is not None:
+                    sink.reset()
+                retry_after = self._record_failure(e)
+                failure = self._attempt_failed(document, e, attempt, response_text)
+                if failure is not None:
+                    return None, failure
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Exponential backoff, or the server's Retry-After if that is longer."""
+        return max(RETRY_DELAY * (2 ** (attempt - 1)), retry_after or 0.0)
+
+    def _record_success(self, usage, estimated_tokens: int):
+        """Report a completed call and its token usage to the rate limiter."""
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.record_usage(estimated_tokens, getattr(usage, "total_tokens", None))
+        self.rate_limiter.on_success()
+
+    def _record_failure(self, error: Exception) -> Optional[float]:
+        """
+        Report a failed call to the rate limiter.
 
-                elapsed = time.time() - start_time
-                logger.debug(f"LLM API call completed in {elapsed:.2f}s")
-
-                # Check for empty/None response
-                if response is None:
-                    raise ValueError("API returned None response")
-                if not hasattr(response, 'choices') or response.choices is None:
-                    raise ValueError("API response has no choices")
-                if len(response.choices) == 0:
-                    raise ValueError("API response has empty choices list")
-                if response.choices[0].message is None:
-                    raise ValueError("API response message is None")
-                if response.choices[0].message.content is None:
-                    raise ValueError("API response content is None")
-
-                response_text = response.choices[0].message.content
-                logger.debug(f"Response length: {len(response_text)} chars")
-
-                # Try parsing, with fallback to fix invalid Unicode escapes
-                try:
-                    extraction = json.loads(response_text)
-                except json.JSONDecodeError:
-                    # Fix invalid Unicode escapes that some LLMs produce
-                    import re
-                    cleaned = re.sub(r'\\u(?![0-9a-fA-F]{4})', r'\\\\u', response_text)
-                    extraction = json.loads(cleaned)
-                logger.debug(f"Parsed {len(extraction.get('items', []))} items from response")
-
-                # Success - break out of retry loop
-                break
-
-            except json.JSONDecodeError as e:
-                last_error = f"Failed to parse LLM response as JSON: {e}"
-                logger.warning(f"JSON parse error (attempt {attempt + 1}): {e}")
-                if attempt == max_retries - 1:
-                    logger.error(last_error)
-                    return ExtractionResult(
-                        document_path=document.path,
-                        nodes_created=[],
-                        edges_created=[],
-                        raw_extraction={"raw_response": response_text or ""},
-                        error=last_error
-                    )
-
-            except ValueError as e:
-                # Empty response - retry
-                last_error = f"Empty API response: {e}"
-                logger.warning(f"Empty response (attempt {attempt + 1}): {e}")
-                if attempt == max_retries - 1:
-                    logger.error(f"LLM API returned empty response after {max_retries} attempts")
-                    return ExtractionResult(
-                        document_path=document.path,
-                        nodes_created=[],
-                        edges_created=[],
-                        raw_extraction={},
-                        error=last_error
-                    )
+        Returns:
+            The Retry-After of the error response in seconds, if any
+        """
+        response = getattr(error, "response", None)
+        retry_after = retry_after_seconds(getattr(response, "headers", None))
+        if self.rate_limiter is not None and getattr(error, "status_code", None) == 429:
+            self.rate_limiter.on_rate_limited(retry_after)
+        return retry_after
 
-            except Exception as e:
-                last_error = f"LLM API error: {e}"
-                error_str = str(e).lower()
+    def extract_packed(
+        self,
+        documents: list[DocumentContent],
+        graph: RequirementGraph
+    ) -> list[ExtractionResult]:
+        """Extract several small documents in one LLM request."""
+        logger.info(f"Extracting {len(documents)} packed documents: {', '.join(d.filename for d in documents)}")
+        prompt = self._build_packed_prompt(documents)
+        outcome = self._call_llm(self._pack_label(documents), prompt, PACKED_EXTRACTION_SCHEMA)
+        return self._apply_packed(documents, graph, outcome)
 
-                # Check if it's a retryable error
-                retryable = any(x in error_str for x in [
-                    'rate limit', 'timeout', 'connection', 'temporary',
-                    '400', '429', '500', '502', '503', '504', 'overloaded'
-                ])
+    def _apply_packed(
+        self,
+        documents: list[DocumentContent],
+        graph: RequirementGraph,
+        outcome: tuple[Optional[dict], Optional[ExtractionResult]]
+    ) -> list[ExtractionResult]:
+        """Split a packed LLM outcome and add each document's part to the graph."""
+        extraction, failure = outcome
+        if failure is not None:
+            return [self._failed(doc, failure.error, failure.raw_extraction) for doc in documents]
 
-                if retryable and attempt < max_retries - 1:
-                    logger.warning(f"Retryable error (attempt {attempt + 1}): {e}")
-                    continue
+        results = []
+        for document, part in zip(documents, split_packed_extraction(extraction, len(documents))):
+            result = self._apply_extraction(document, graph, part)
+            result.raw_extraction["packed_with"] = len(documents)
+            results.append(result)
+        return results
 
-                logger.exception(f"LLM API error for {document.filename}")
-                return ExtractionResult(
-                    document_path=document.path,
-                    nodes_created=[],
-                    edges_created=[],
-                    raw_extraction={},
-                    error=last_error
-                )
+    def _apply_outcomes(
+        self,
+        document: DocumentContent,
+        graph: RequirementGraph,
+        outcomes: list[tuple[Optional[dict], Optional[ExtractionResult]]],
+        streamed: Optional[list] = None,
+        chunks: Optional[list[DocumentContent]] = None
+    ) -> ExtractionResult:
+        """
+        Add the LLM outcomes of a document's chunks to the graph.
+
+        Failed chunks are skipped (and listed in raw_extraction["chunk_errors"]);
+        the document only fails when every chunk failed. ``streamed`` are the
+        nodes already created from the items of a single streamed outcome;
+        ``chunks`` (in outcome order) tell merge_extractions where they overlap.
+        """
+        extractions = [extraction for extraction, failure in outcomes if failure is None]
+        failures = [failure for _, failure in outcomes if failure is not None]
+        if not extractions:
+            return failures[0]
+        if len(outcomes) == 1:
+            return self._apply_extraction(document, graph, extractions[0], streamed)
+
+        merged = merge_extractions(
+            [extraction if failure is None else None for extraction, failure in outcomes],
+            chunk_overlaps(chunks) if chunks else None
+        )
+        result = self._apply_extraction(document, graph, merged)
+        result.raw_extraction["chunk_count"] = len(outcomes)
+        if failures:
+            logger.warning(f"{len(failures)} of {len(outcomes)} chunks of {document.filename} failed")
+            result.raw_extraction["chunk_errors"] = [failure.error for failure in failures]
+        return result
+
+    def _create_node(
+        self,
+        document: DocumentContent,
+        graph: RequirementGraph,
+        item: dict,
+        document_type: Optional[str]
+    ) -> Node:
+        """Add the node for one extracted item to the graph (and report it to node_callback)."""
+        # Use item_type from flattened schema
+        node_type = self._map_item_type(item.get("item_type", "requirement"))
+
+        # Parse tags from CSV string
+        tags_csv = item.get("tags_csv", "")
+        tags = [t.strip() for t in tags_csv.split(",") if t.strip()] if tags_csv else []
+
+        node = graph.create_node(
+            type=node_type,
+            title=item.get("title", "Untitled"),
+            description=item.get("description", ""),
+            source_document=document.path,
+            source_location=item.get("source_location"),
+            source_text=item.get("source_text"),
+            confidence=item.get("confidence", 0.8),
+            tags=tags,
+            metadata={
+                "is_required": item.get("is_required", True),
+                "document_type": document_type,
+            }
+        )
+
+        # Handle checkbox state (is_checked is boolean in flattened schema)
+        if node_type == NodeType.CHECKBOX:
+            is_checked = item.get("is_checked", False)
+            node.checkbox_state = is_checked
+            if is_checked:
+                node.status = CompletionStatus.COMPLETED
+
+        # Handle deadline (deadline_date is string in flattened schema)
+        deadline_str = item.get("deadline_date", "")
+        if deadline_str and deadline_str.strip():
+            try:
+                from datetime import datetime
+                node.deadline = datetime.fromisoformat(deadline_str)
+            except:
+                node.metadata["deadline_raw"] = deadline_str
+
+        if self.node_callback:
+            self.node_callback(node)
+        return node
+
+    def _apply_extraction(
+        self,
+        document: DocumentContent,
+        graph: RequirementGraph,
+        extraction: dict,
+        streamed: Optional[list] = None
+    ) -> ExtractionResult:
+        """
+        Add the items and relationships of a parsed LLM response to the graph.
 
-        # Process extraction into graph
+        ``streamed`` are nodes already created for the first items while the
+        response was streamed; only the remaining items get new nodes.
+        """
         nodes_created = []
         edges_created = []
         title_to_node: dict[str, str] = {}  # Map titles to node IDs for relationship linking
+        streamed = streamed or []
 
         # Create nodes for each extracted item
-        for item in extraction.get("items", []):
-            # Use item_type from flattened schema
-            node_type = self._map_item_type(item.get("item_type", "requirement"))
-
-            # Parse tags from CSV string
-            tags_csv = item.get("tags_csv", "")
-            tags = [t.strip() for t in tags_csv.split(",") if t.strip()] if tags_csv else []
-
-            node = graph.create_node(
-                type=node_type,
-                title=item.get("title", "Untitled"),
-                description=item.get("description", ""),
-                source_document=document.path,
-                source_location=item.get("source_location"),
-                source_text=item.get("source_text"),
-                confidence=item.get("confidence", 0.8),
-                tags=tags,
-                metadata={
-                    "is_required": item.get("is_required", True),
-                    "document_type": extraction.get("document_type"),
-                }
-            )
-
-            # Handle checkbox state (is_checked is boolean in flattened schema)
-            if node_type == NodeType.CHECKBOX:
-                is_checked = item.get("is_checked", False)
-                node.checkbox_state = is_checked
-                if is_checked:
-                    node.status = CompletionStatus.COMPLETED
-
-            # Handle deadline (deadline_date is string in flattened schema)
-            deadline_str = item.get("deadline_date", "")
-            if deadline_str and deadline_str.strip():
-                try:
-                    from datetime import datetime
-                    node.deadline = datetime.fromisoformat(deadline_str)
-                except:
-                    node.metadata["deadline_raw"] = deadline_str
+        for index, item in enumerate(extraction.get("items", [])):
+            if index < len(streamed):
+                node = streamed[index]
+                # document_type may only have been known once the response was complete
+                node.metadata["document_type"] = extraction.get("document_type")
+            else:
+                node = self._create_node(document, graph, item, extraction.get("document_type"))
 
             nodes_created.append(node.id)
-            title_to_node[item.get("title", "").lower()] = node.id
+            title_to_node[normalize_title(item.get("title", ""))] = node.id
 
         # Create edges from top-level relationships array
         for rel in extraction.get("relationships", []):
@@ -409,23 +903,8 @@ class RequirementExtractor:
 
             rel_type = self._map_relationship_type(rel.get("type", "references"))
 
-            # Resolve source
-            source_id = title_to_node.get(source_title_raw.lower())
-            if not source_id:
-                existing = graph.find_nodes(source_title_raw)
-                if existing:
-                    source_id = existing[0].id
-            if not source_id:
-                source_id = self._fuzzy_find_node(source_title_raw, title_to_node, graph)
-
-            # Resolve target
-            target_id = title_to_node.get(target_title_raw.lower())
-            if not target_id:
-                existing = graph.find_nodes(target_title_raw)
-                if existing:
-                    target_id = existing[0].id
-            if not target_id:
-                target_id = self._fuzzy_find_node(target_title_raw, title_to_node, graph)
+            source_id = self._resolve_title(source_title_raw, title_to_node, graph)
+            target_id = self._resolve_title(target_title_raw, title_to_node, graph)
 
             if source_id and target_id and source_id != target_id:
                 edge = graph.connect(
@@ -436,6 +915,7 @@ class RequirementExtractor:
                 )
                 edges_created.append(edge.id)
 
+        self._record_aliases(document, graph, nodes_created)
         self.processed_documents.add(document.path)
 
         logger.info(f"Extracted from {document.filename}: {len(nodes_created)} nodes, {len(edges_created)} edges")
@@ -447,6 +927,78 @@ class RequirementExtractor:
             raw_extraction=extraction,
         )
 
+    def _extract_gaeb(self, document: DocumentContent, graph: RequirementGraph) -> ExtractionResult:
+        """Add a parsed GAEB bill of quantities to the graph deterministically."""
+        boq = document.metadata["gaeb"]
+        start_time = time.time()
+        nodes_created, edges_created = add_gaeb_to_graph(boq, graph, document.path)
+        self._record_aliases(document, graph, nodes_created)
+        self.processed_documents.add(document.path)
+
+        logger.info(f"Imported GAEB {document.filename}: {len(boq['positions'])} positions, "
+                    f"{len(boq['categories'])} categories in {time.time() - start_time:.3f}s")
+
+        return ExtractionResult(
+            document_path=document.path,
+            nodes_created=nodes_created,
+            edges_created=edges_created,
+            raw_extraction={
+                "document_type": "gaeb",
+                "position_count": len(boq["positions"]),
+                "category_count": len(boq["categories"]),
+            },
+        )
+
+    def _record_aliases(self, document: DocumentContent, graph: RequirementGraph, node_ids: list[str]):
+        """Record the paths of identical copies of a document on its nodes."""
+        aliases = document.metadata.get("aliases")
+        if not aliases:
+            return
+        for node_id in node_ids:
+            graph.nodes[node_id].metadata["source_aliases"] = list(aliases)
+        self.processed_documents.update(aliases)
+
+    def extract_chunks(
+        self,
+        chunks: Iterable[DocumentContent],
+        graph: RequirementGraph
+    ) -> ExtractionResult:
+        """
+        Extract requirements from a document delivered as a stream of chunks.
+
+        Chunks are consumed one at a time (e.g. from DocumentReader.iter_chunks),
+        so only the current chunk is held in memory. Results are combined into
+        a single ExtractionResult for the whole document.
+        """
+        document_path = None
+        nodes_created = []
+        edges_created = []
+        raw_chunks = []
+        errors = []
+
+        for chunk in chunks:
+            document_path = chunk.path
+            logger.debug(f"Extracting chunk {chunk.metadata.get('chunk_index', 0)} of {chunk.filename}")
+            result = self.extract(chunk, graph)
+            nodes_created.extend(result.nodes_created)
+            edges_created.extend(result.edges_created)
+            raw_chunks.append(result.raw_extraction)
+            if result.error:
+                errors.append(result.error)
+
+        # Only report an error if no chunk produced anything
+        error = None
+        if errors and len(errors) == len(raw_chunks):
+            error = errors[0]
+
+        return ExtractionResult(
+            document_path=document_path or "",
+            nodes_created=nodes_created,
+            edges_created=edges_created,
+            raw_extraction={"chunks": raw_chunks},
+            error=error,
+        )
+
     def _map_item_type(self, type_str: str) -> NodeType:
         """Map string type to NodeType enum."""
         mapping = {
@@ -475,6 +1027,46 @@ class RequirementExtractor:
         }
         return mapping.get(type_str.lower(), EdgeType.REFERENCES)
 
+    def extract_documents(
+        self,
+        documents: list[DocumentContent],
+        graph: RequirementGraph,
+        progress_callback: Optional[callable] = None
+    ) -> list[ExtractionResult]:
+        """
+        Extract documents one request at a time, packing small ones together.
+
+        Args:
+            documents: Documents to extract
+            graph: Graph to add to
+            progress_callback: Optional callback(current, total, document_name)
+
+        Returns:
+            Extraction results in the same order as ``documents``
+        """
+        results: list[Optional[ExtractionResult]] = [None] * len(documents)
+        total = len(documents)
+        current = 0
+
+        for batch in self._plan_batches(documents):
+            batch_documents = [documents[i] for i in batch]
+            for doc in batch_documents:
+                current += 1
+                logger.info(f"[{current}/{total}] Processing: {doc.filename}")
+                if progress_callback:
+                    progress_callback(current, total, doc.filename)
+
+            if len(batch) == 1:
+                batch_results = [self.extract(batch_documents[0], graph)]
+            else:
+                batch_results = self.extract_packed(batch_documents, graph)
+
+            for i, result in zip(batch, batch_results):
+                results[i] = result
+                logger.debug(f"  {documents[i].filename}: {len(result.nodes_created)} nodes, "
+                             f"{len(result.edges_created)} edges")
+        return results
+
     def process_directory(
         self,
         documents: list[DocumentContent],
@@ -496,24 +1088,15 @@ class RequirementExtractor:
             graph = RequirementGraph()
             logger.debug("Created new RequirementGraph")
 
-        results = []
         total = len(documents)
         logger.info(f"Processing {total} documents...")
 
         start_time = time.time()
 
-        for i, doc in enumerate(documents):
-            logger.info(f"[{i+1}/{total}] Processing: {doc.filename}")
-            if progress_callback:
-                progress_callback(i + 1, total, doc.filename)
-
-            result = self.extract(doc, graph)
-            results.append(result)
-
+        results = self.extract_documents(documents, graph, progress_callback)
+        for result in results:
             if result.error:
-                logger.warning(f"  Error: {result.error}")
-            else:
-                logger.debug(f"  Created {len(result.nodes_created)} nodes, {len(result.edges_created)} edges")
+                logger.warning(f"  Error in {result.document_path}: {result.error}")
 
         # After processing all documents, try to resolve placeholder references
         logger.debug("Resolving placeholder references...")
@@ -526,58 +1109,89 @@ class RequirementExtractor:
 
         return graph, results
 
-    def _resolve_placeholders(self, graph: RequirementGraph):
+    def _resolve_placeholders(self, graph: RequirementGraph) -> int:
         """
-        Try to match placeholder document nodes with actual document nodes.
+        Match placeholder document nodes with actual document nodes and merge them.
+
+        A placeholder matches the first document whose title contains all of
+        its words, whose words all appear in the placeholder's title, or that
+        shares PLACEHOLDER_MATCH of the words of both (Jaccard). Documents are
+        indexed by title word, so each placeholder is only compared with the
+        few documents that can match it, and all matches are merged in a
+        single pass.
+
+        Returns:
+            Number of placeholders merged
         """
+        start_time = time.time()
         placeholders = [n for n in graph.nodes.values() if "placeholder" in n.tags]
         real_docs = [n for n in graph.nodes.values()
                      if n.type == NodeType.DOCUMENT and "placeholder" not in n.tags]
 
+        doc_words = [frozenset(title_tokens(doc.title)) for doc in real_docs]
+        word_index: dict[str, list[int]] = {}  # title word -> positions in real_docs
+        for position, words in enumerate(doc_words):
+            for word in words:
+                word_index.setdefault(word, []).append(position)
+        # Each document also under its rarest word: a document whose words all
+        # appear in a placeholder is found through that one word
+        by_rarest: dict[str, list[int]] = {}
+        for position, words in enumerate(doc_words):
+            if words:
+                rarest = min(words, key=lambda word: (len(word_index[word]), word))
+                by_rarest.setdefault(rarest, []).append(position)
+
+        merges = {}
         for placeholder in placeholders:
-            # Try to find a matching real document
-            placeholder_name = placeholder.title.lower()
-
-            for doc in real_docs:
-                doc_name = doc.title.lower()
-                # Check for partial matches
-                if (placeholder_name in doc_name or
-                    doc_name in placeholder_name or
-                    self._fuzzy_match(placeholder_name, doc_name)):
-                    # Merge the nodes
-                    graph.merge_duplicate_nodes(doc.id, placeholder.id)
+            words = frozenset(title_tokens(placeholder.title))
+            if not words:
+                continue
+            # Containing or similar documents share one of the placeholder's rarest
+            # words (prefix filter for the Jaccard threshold)
+            ranked = sorted(words, key=lambda word: len(word_index.get(word, ())))
+            prefix = len(words) - math.ceil(PLACEHOLDER_MATCH * len(words) - 1e-9) + 1
+            candidates = {p for word in ranked[:prefix] for p in word_index.get(word, ())}
+            candidates.update(p for word in words for p in by_rarest.get(word, ()))
+
+            # Candidates in graph order, so the first matching document wins
+            for position in sorted(candidates):
+                other = doc_words[position]
+                if (words <= other or other <= words or
+                        len(words & other) / len(words | other) >= PLACEHOLDER_MATCH):
+                    merges[placeholder.id] = real_docs[position].id
                     break
 
-    def _fuzzy_find_node(self, target_title: str, title_to_node: dict, graph: RequirementGraph) -> Optional[str]:
-        """Try to fuzzy-match a target title against known nodes."""
-        target_lower = target_title.lower()
-
-        # Check current document titles
-        for title, node_id in title_to_node.items():
-            if self._fuzzy_match(target_lower, title, 0.5):
-                return node_id
+        merged = graph.merge_nodes(merges)
+        logger.info(f"Resolved {merged} of {len(placeholders)} placeholders against "
+                    f"{len(real_docs)} documents in {time.time() - start_time:.3f}s")
+        return merged
 
-        # Check all graph nodes
-        for node in graph.nodes.values():
-            if self._fuzzy_match(target_lower, node.title.lower(), 0.5):
-                return node.id
-
-        return None
+    def _resolve_title(self, title: str, title_to_node: dict, graph: RequirementGraph) -> Optional[str]:
+        """
+        Find the node a relationship title refers to, using the graph's title index.
 
-    def _fuzzy_match(self, str1: str, str2: str, threshold: float = 0.6) -> bool:
-        """Simple fuzzy string matching."""
-        # Normalize
-        s1 = set(str1.lower().split())
-        s2 = set(str2.lower().split())
+        Tries, in order: a title of the current document, any node with the
+        same title, the first node whose title contains all its words, and
+        finally the most similar title (word overlap of at least 0.5),
+        preferring the current document's nodes.
+        """
+        node_id = title_to_node.get(normalize_title(title))
+        if node_id:
+            return node_id
 
-        if not s1 or not s2:
-            return False
+        node = graph.find_by_title(title)
+        if node is not None:
+            return node.id
 
-        # Jaccard similarity
-        intersection = len(s1 & s2)
-        union = len(s1 | s2)
+        containing = graph.find_titles_containing(title)
+        if containing:
+            return containing[0].id
 
-        return (intersection / union) >= threshold
+        similar = graph.find_similar_titles(title, 0.5)
+        if not similar:
+            return None
+        local = set(title_to_node.values())
+        return next((node.id for _, node in similar if node.id in local), similar[0][1].id)
 
 
 class IncrementalExtractor:
@@ -601,14 +1215,25 @@ class IncrementalExtractor:
     def process_new_or_changed(
         self,
         documents: list[DocumentContent],
-        graph: RequirementGraph
+        graph: RequirementGraph,
+        replace_existing: bool = False,
+        engine=None
     ) -> list[ExtractionResult]:
         """
         Process only new or changed documents.
 
+        Args:
+            documents: Documents to check
+            graph: Graph to update
+            replace_existing: Also treat documents not seen by this extractor
+                as changed when the graph already has nodes from them (e.g.
+                from a graph loaded from disk), replacing those nodes
+            engine: Optional AsyncExtractionEngine to extract the new and
+                changed documents concurrently
+
         Returns list of extraction results for processed documents.
         """
-        results = []
+        pending = []
         skipped = 0
         changed = 0
         new = 0
@@ -627,22 +1252,40 @@ class IncrementalExtractor:
 
                 # Document changed - remove old nodes and reprocess
                 logger.info(f"Document changed: {doc.filename}")
-                old_nodes = graph.get_nodes_by_document(doc.path)
-                logger.debug(f"Removing {len(old_nodes)} old nodes from changed document")
-                for node in old_nodes:
-                    del graph.nodes[node.id]
+                self.remove_document(doc.path, graph)
+                changed += 1
+            elif replace_existing and self.remove_document(doc.path, graph):
+                logger.info(f"Document changed: {doc.filename}")
                 changed += 1
             else:
                 logger.debug(f"New document: {doc.filename}")
                 new += 1
 
-            # Process the document
-            result = self.extractor.extract(doc, graph)
-            results.append(result)
+            pending.append((doc, content_hash))
+
+        # Process the documents
+        if engine is not None:
+            results = engine.extract_documents([doc for doc, _ in pending], graph)
+        else:
+            results = self.extractor.extract_documents([doc for doc, _ in pending], graph)
 
-            # Update hash
+        for doc, content_hash in pending:
             self.document_hashes[doc.path] = content_hash
 
         logger.info(f"Incremental processing: {new} new, {changed} changed, {skipped} unchanged")
 
         return results
+
+    def remove_document(self, document_path: str, graph: RequirementGraph) -> int:
+        """
+        Remove the nodes (and their edges) extracted from a document.
+
+        Returns:
+            Number of nodes removed
+        """
+        old_nodes = graph.get_nodes_by_document(document_path)
+        logger.debug(f"Removing {len(old_nodes)} old nodes from {document_path}")
+        for node in old_nodes:
+            graph.remove_node(node.id)
+        self.document_hashes.pop(document_path, None)
+        return len(old_nodes)
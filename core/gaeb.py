@@ -0,0 +1,244 @@
+"""
+GAEB DA XML Reader
+
+Deterministic parser for GAEB DA XML bills of quantities (Leistungsverzeichnisse).
+GAEB files are fully structured, so positions and their categories (Lose,
+Titel) are turned straight into requirement graph nodes without an LLM call.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Optional, Union
+
+from .graph import RequirementGraph, NodeType, EdgeType
+from .logging_config import get_logger
+
+logger = get_logger("gaeb")
+
+# GAEB DA XML exchange phases (X81-X86, X31)
+GAEB_XML_EXTENSIONS = {'.x81', '.x82', '.x83', '.x84', '.x85', '.x86', '.x31'}
+
+
+class NotGaebError(ValueError):
+    """Raised when an XML file is not a GAEB DA XML document."""
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text_of(elem: Optional[ET.Element]) -> str:
+    """Flatten GAEB formatted text (<p><span>...</span></p>) to plain text."""
+    if elem is None:
+        return ""
+    paragraphs = []
+    for p in elem.iter():
+        if _local(p.tag) == 'p':
+            text = " ".join("".join(p.itertext()).split())
+            if text:
+                paragraphs.append(text)
+    if not paragraphs:
+        # Some exporters put plain text directly in the element
+        text = " ".join("".join(elem.itertext()).split())
+        if text:
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+def _find(elem: ET.Element, *path: str) -> Optional[ET.Element]:
+    """Find a descendant by local names, ignoring namespaces."""
+    current = elem
+    for name in path:
+        current = next((c for c in current if _local(c.tag) == name), None)
+        if current is None:
+            return None
+    return current
+
+
+def parse_gaeb_xml(source: Union[str, BinaryIO]) -> dict:
+    """
+    Parse a GAEB DA XML file (path or binary file object) into a plain dict
+    of categories and positions.
+
+    The file is parsed incrementally and each position is discarded once read,
+    so very large LVs do not need to fit in memory as a tree.
+
+    Returns:
+        {"project", "boq_name", "phase", "categories": [...], "positions": [...]}
+        where categories have oz/title/parent and positions have
+        oz/short_text/long_text/quantity/unit/category.
+
+    Raises:
+        NotGaebError: If the root element is not <GAEB>
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    boq = {
+        "project": "",
+        "boq_name": "",
+        "phase": "",
+        "categories": [],
+        "positions": [],
+    }
+    names: list[str] = []         # Local names of open elements
+    ctgy_stack: list[dict] = []   # Open BoQCtgy records
+
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        name = _local(elem.tag)
+
+        if event == 'start':
+            if not names and name != 'GAEB':
+                raise NotGaebError(f"Root element is <{name}>, not <GAEB>")
+            names.append(name)
+            if name == 'BoQCtgy':
+                parent = ctgy_stack[-1]["oz"] if ctgy_stack else None
+                rno = elem.get('RNoPart', '').strip()
+                ctgy = {
+                    "oz": f"{parent}.{rno}" if parent else rno,
+                    "title": "",
+                    "parent": parent,
+                }
+                ctgy_stack.append(ctgy)
+                boq["categories"].append(ctgy)
+            continue
+
+        names.pop()
+        parent_name = names[-1] if names else None
+
+        if name == 'Item':
+            rno = elem.get('RNoPart', '').strip()
+            category = ctgy_stack[-1]["oz"] if ctgy_stack else None
+            complete_text = _find(elem, 'Description', 'CompleteText')
+            qty = _find(elem, 'Qty')
+            unit = _find(elem, 'QU')
+            boq["positions"].append({
+                "oz": f"{category}.{rno}" if category else rno,
+                "short_text": _text_of(_find(complete_text, 'OutlineText')) if complete_text is not None else "",
+                "long_text": _text_of(_find(complete_text, 'DetailTxt')) if complete_text is not None else "",
+                "quantity": (qty.text or "").strip() if qty is not None else "",
+                "unit": (unit.text or "").strip() if unit is not None else "",
+                "category": category,
+            })
+            elem.clear()
+
+        elif name == 'LblTx' and parent_name == 'BoQCtgy':
+            ctgy_stack[-1]["title"] = _text_of(elem)
+
+        elif name == 'BoQCtgy':
+            ctgy_stack.pop()
+            elem.clear()
+
+        elif name == 'NamePrj' and parent_name == 'PrjInfo':
+            boq["project"] = (elem.text or "").strip()
+
+        elif name in ('Name', 'LblTx') and parent_name == 'BoQInfo' and not boq["boq_name"]:
+            boq["boq_name"] = _text_of(elem)
+
+        elif name == 'DP' and parent_name == 'Award':
+            boq["phase"] = (elem.text or "").strip()
+
+    logger.debug(f"Parsed GAEB: {len(boq['categories'])} categories, {len(boq['positions'])} positions")
+    return boq
+
+
+def gaeb_to_text(boq: dict) -> str:
+    """Render a parsed GAEB bill of quantities as compact readable text."""
+    lines = []
+    if boq["project"]:
+        lines.append(f"Projekt: {boq['project']}")
+    if boq["boq_name"]:
+        lines.append(f"Leistungsverzeichnis: {boq['boq_name']}")
+    if boq["phase"]:
+        lines.append(f"GAEB DA {boq['phase']}")
+
+    positions_by_category: dict[Optional[str], list[dict]] = {}
+    for position in boq["positions"]:
+        positions_by_category.setdefault(position["category"], []).append(position)
+
+    def render_positions(category):
+        for position in positions_by_category.get(category, []):
+            quantity = f" | {position['quantity']} {position['unit']}".rstrip() if position["quantity"] else ""
+            lines.append(f"{position['oz']} {position['short_text']}{quantity}")
+            if position["long_text"]:
+                lines.append("  " + position["long_text"].replace("\n", "\n  "))
+
+    render_positions(None)
+    for category in boq["categories"]:
+        lines.append("")
+        lines.append(f"== {category['oz']} {category['title']} ==")
+        render_positions(category["oz"])
+
+    return "\n".join(lines).strip()
+
+
+def add_gaeb_to_graph(
+    boq: dict,
+    graph: RequirementGraph,
+    source_document: str
+) -> tuple[list[str], list[str]]:
+    """
+    Add a parsed bill of quantities to the graph.
+
+    Creates a DOCUMENT node for the LV, a REQUIREMENT node per category (Los,
+    Titel) and a FIELD node per position (each needs a unit price), linked
+    with PART_OF edges following the LV hierarchy.
+
+    Returns:
+        Tuple of (node IDs created, edge IDs created)
+    """
+    nodes_created = []
+    edges_created = []
+
+    title = boq["boq_name"] or boq["project"] or "Leistungsverzeichnis"
+    root = graph.create_node(
+        type=NodeType.DOCUMENT,
+        title=f"Leistungsverzeichnis: {title}",
+        description=f"GAEB bill of quantities with {len(boq['positions'])} positions to price",
+        source_document=source_document,
+        tags=["gaeb", "leistungsverzeichnis"],
+        metadata={"is_required": True, "gaeb_phase": boq["phase"], "project": boq["project"]},
+    )
+    nodes_created.append(root.id)
+
+    oz_to_node = {}
+    for category in boq["categories"]:
+        node = graph.create_node(
+            type=NodeType.REQUIREMENT,
+            title=f"{category['oz']} {category['title']}".strip(),
+            description=category["title"],
+            source_document=source_document,
+            source_location=f"OZ {category['oz']}",
+            tags=["gaeb", "gaeb-category"],
+            metadata={"is_required": True, "oz": category["oz"]},
+        )
+        nodes_created.append(node.id)
+        oz_to_node[category["oz"]] = node.id
+        parent_id = oz_to_node.get(category["parent"], root.id)
+        edges_created.append(graph.connect(node.id, parent_id, EdgeType.PART_OF).id)
+
+    for position in boq["positions"]:
+        short_text = position["short_text"] or position["long_text"].split("\n", 1)[0]
+        node = graph.create_node(
+            type=NodeType.FIELD,
+            title=f"{position['oz']} {short_text}".strip(),
+            description=position["long_text"] or short_text,
+            source_document=source_document,
+            source_location=f"OZ {position['oz']}",
+            source_text=short_text,
+            tags=["gaeb", "gaeb-position"],
+            metadata={
+                "is_required": True,
+                "oz": position["oz"],
+                "quantity": position["quantity"],
+                "unit": position["unit"],
+            },
+        )
+        nodes_created.append(node.id)
+        parent_id = oz_to_node.get(position["category"], root.id)
+        edges_created.append(graph.connect(node.id, parent_id, EdgeType.PART_OF).id)
+
+    return nodes_created, edges_created
+
+
+def looks_like_gaeb(head: bytes) -> bool:
+    """Cheap check on the first bytes of an XML file for a GAEB root element."""
+    return re.search(rb'<(?:\w+:)?GAEB[\s>]', head) is not None
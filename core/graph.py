@@ -10,9 +10,23 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 from datetime import datetime
+import re
+import math
 import uuid
 import json
 
+_WORD = re.compile(r'\w+')
+
+
+def title_tokens(title: str) -> list[str]:
+    """The words of a title, case-folded, for title matching."""
+    return _WORD.findall(title.casefold())
+
+
+def normalize_title(title: str) -> str:
+    """A title ignoring case, punctuation and spacing."""
+    return ' '.join(title_tokens(title))
+
 
 class NodeType(Enum):
     DOCUMENT = "document"           # A physical document that must be submitted
@@ -171,10 +185,42 @@ class RequirementGraph:
         self.edges: dict[str, Edge] = {}
         self._adjacency: dict[str, list[str]] = {}  # node_id -> [edge_ids]
         self._reverse_adjacency: dict[str, list[str]] = {}  # node_id -> [incoming edge_ids]
+        # Title index, kept in step with self.nodes by add_node/remove_node/merge_duplicate_nodes
+        self._titles: dict[str, list[str]] = {}  # normalized title -> [node_ids] in insertion order
+        self._title_words: dict[str, set[str]] = {}  # title word -> node_ids
+        self._node_words: dict[str, frozenset[str]] = {}  # node_id -> title words
+        self._sequence: dict[str, int] = {}  # node_id -> insertion number, for stable ordering
+        self._next_sequence = 0
+
+    def _index_title(self, node: Node):
+        words = title_tokens(node.title)
+        self._titles.setdefault(' '.join(words), []).append(node.id)
+        self._node_words[node.id] = frozenset(words)
+        for word in self._node_words[node.id]:
+            self._title_words.setdefault(word, set()).add(node.id)
+        self._sequence[node.id] = self._next_sequence
+        self._next_sequence += 1
+
+    def _unindex_title(self, node: Node):
+        key = normalize_title(node.title)
+        ids = self._titles.get(key, [])
+        if node.id in ids:
+            ids.remove(node.id)
+            if not ids:
+                del self._titles[key]
+        for word in self._node_words.pop(node.id, ()):
+            ids = self._title_words[word]
+            ids.discard(node.id)
+            if not ids:
+                del self._title_words[word]
+        self._sequence.pop(node.id, None)
 
     def add_node(self, node: Node) -> Node:
         """Add a node to the graph."""
+        if node.id in self.nodes:
+            self._unindex_title(self.nodes[node.id])
         self.nodes[node.id] = node
+        self._index_title(node)
         if node.id not in self._adjacency:
             self._adjacency[node.id] = []
         if node.id not in self._reverse_adjacency:
@@ -231,6 +277,28 @@ class RequirementGraph:
         )
         return self.add_edge(edge)
 
+    def remove_node(self, node_id: str) -> bool:
+        """Remove a node together with all edges attached to it."""
+        if node_id not in self.nodes:
+            return False
+
+        edge_ids = set(self._adjacency.pop(node_id, [])) | set(self._reverse_adjacency.pop(node_id, []))
+        for edge_id in edge_ids:
+            edge = self.edges.pop(edge_id, None)
+            if edge is None:
+                continue
+            if edge.target_id in self._reverse_adjacency:
+                self._reverse_adjacency[edge.target_id] = [
+                    eid for eid in self._reverse_adjacency[edge.target_id] if eid != edge_id
+                ]
+            if edge.source_id in self._adjacency:
+                self._adjacency[edge.source_id] = [
+                    eid for eid in self._adjacency[edge.source_id] if eid != edge_id
+                ]
+
+        self._unindex_title(self.nodes.pop(node_id))
+        return True
+
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID."""
         return self.nodes.get(node_id)
@@ -285,6 +353,55 @@ class RequirementGraph:
             if query_lower in n.title.lower() or query_lower in n.description.lower()
         ]
 
+    def find_by_title(self, title: str) -> Optional[Node]:
+        """The first node added with this title, ignoring case, punctuation and spacing."""
+        ids = self._titles.get(normalize_title(title))
+        return self.nodes[ids[0]] if ids else None
+
+    def find_titles_containing(self, title: str) -> list[Node]:
+        """Nodes whose title contains every word of ``title``, in insertion order."""
+        words = set(title_tokens(title))
+        if not words:
+            return []
+        # Intersect starting from the rarest word, so common words cost little
+        postings = sorted((self._title_words.get(word, set()) for word in words), key=len)
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            ids &= posting
+            if not ids:
+                return []
+        return [self.nodes[i] for i in sorted(ids, key=self._sequence.__getitem__)]
+
+    def find_similar_titles(self, title: str, threshold: float = 0.5) -> list[tuple[float, Node]]:
+        """
+        Nodes whose title words overlap those of ``title`` by at least
+        ``threshold`` (Jaccard similarity).
+
+        Candidates come from the title word index: a title reaching the
+        threshold must contain one of the query's len - ceil(threshold * len) + 1
+        rarest words, so only those words' nodes are scored.
+
+        Returns:
+            (similarity, node) pairs, most similar first, ties in insertion order
+        """
+        words = set(title_tokens(title))
+        if not words or threshold <= 0:
+            return []
+        prefix = len(words) - math.ceil(threshold * len(words) - 1e-9) + 1
+        rarest = sorted(words, key=lambda word: len(self._title_words.get(word, ())))[:prefix]
+        candidates = set()
+        for word in rarest:
+            candidates.update(self._title_words.get(word, ()))
+
+        matches = []
+        for node_id in candidates:
+            node_words = self._node_words[node_id]
+            similarity = len(words & node_words) / len(words | node_words)
+            if similarity >= threshold:
+                matches.append((similarity, node_id))
+        matches.sort(key=lambda m: (-m[0], self._sequence[m[1]]))
+        return [(similarity, self.nodes[node_id]) for similarity, node_id in matches]
+
     def update_status(self, node_id: str, status: CompletionStatus) -> Optional[Node]:
         """Update the status of a node and propagate changes."""
         node = self.get_node(node_id)
@@ -414,38 +531,56 @@ class RequirementGraph:
         Keeps node_1, transfers all edges from node_2 to node_1.
         """
         node1 = self.get_node(node_id_1)
-        node2 = self.get_node(node_id_2)
-
-        if not node1 or not node2:
+        if not node1 or not self.get_node(node_id_2):
             return None
 
-        # Transfer incoming edges
-        for edge in self.get_incoming_edges(node_id_2):
-            edge.target_id = node_id_1
-            if node_id_1 not in self._reverse_adjacency:
-                self._reverse_adjacency[node_id_1] = []
-            self._reverse_adjacency[node_id_1].append(edge.id)
-
-        # Transfer outgoing edges
-        for edge in self.get_outgoing_edges(node_id_2):
-            edge.source_id = node_id_1
-            if node_id_1 not in self._adjacency:
-                self._adjacency[node_id_1] = []
-            self._adjacency[node_id_1].append(edge.id)
-
-        # Merge metadata
-        node1.tags = list(set(node1.tags + node2.tags))
-        node1.metadata.update(node2.metadata)
-        if node2.source_text and not node1.source_text:
-            node1.source_text = node2.source_text
-
-        # Remove node2
-        del self.nodes[node_id_2]
-        del self._adjacency[node_id_2]
-        del self._reverse_adjacency[node_id_2]
-
+        self.merge_nodes({node_id_2: node_id_1})
         return node1
 
+    def merge_nodes(self, merges: dict[str, str]) -> int:
+        """
+        Merge many pairs of duplicate nodes in one pass.
+
+        Args:
+            merges: Node ID to remove -> node ID to keep. The kept node takes
+                over the removed node's edges, tags and metadata; chains
+                (a -> b, b -> c) end at the last node kept.
+
+        Returns:
+            Number of nodes merged away
+        """
+        targets = {}
+        for remove_id, keep_id in merges.items():
+            seen = {remove_id}
+            while keep_id in merges and keep_id not in seen:
+                seen.add(keep_id)
+                keep_id = merges[keep_id]
+            if keep_id in seen or remove_id not in self.nodes or keep_id not in self.nodes:
+                continue  # Cycle or unknown node
+            targets[remove_id] = keep_id
+
+        for remove_id, keep_id in targets.items():
+            keep = self.nodes[keep_id]
+            node = self.nodes[remove_id]
+
+            # Transfer incoming and outgoing edges
+            for edge_id in self._reverse_adjacency.pop(remove_id, []):
+                self.edges[edge_id].target_id = keep_id
+                self._reverse_adjacency.setdefault(keep_id, []).append(edge_id)
+            for edge_id in self._adjacency.pop(remove_id, []):
+                self.edges[edge_id].source_id = keep_id
+                self._adjacency.setdefault(keep_id, []).append(edge_id)
+
+            # Merge metadata
+            keep.tags = list(set(keep.tags + node.tags))
+            keep.metadata.update(node.metadata)
+            if node.source_text and not keep.source_text:
+                keep.source_text = node.source_text
+
+            self._unindex_title(self.nodes.pop(remove_id))
+
+        return len(targets)
+
     def to_dict(self) -> dict:
         """Serialize the graph to a dictionary."""
         return {
@@ -0,0 +1,241 @@
+"""
+HTML Text Extraction
+
+Single-pass HTML to text conversion for tender pages exported from
+e-Vergabe portals. The document is fed to an incremental tokenizer in
+chunks; script and style content is dropped and block elements become line
+breaks, so the LLM sees the page's structure instead of one long line.
+
+The tokenizer never backtracks: every scan stops at the next '<' or '>', so
+malformed markup (unclosed scripts, stray brackets) costs linear time.
+Only comments and skipped elements are handled token by token; the markup
+between them is converted with a few regex substitutions per chunk, so
+Python-level work is per line rather than per tag.
+"""
+
+import re
+from html import unescape
+from typing import Iterable
+
+# Elements whose content is never text
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg'}
+
+# Elements that start and end a line
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'caption', 'dd', 'div',
+    'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'legend', 'li', 'main', 'nav', 'ol',
+    'option', 'p', 'pre', 'section', 'table', 'thead', 'tbody', 'tfoot', 'title',
+    'tr', 'ul',
+}
+
+# Table cells are separated by tabs, like spreadsheet rows
+CELL_TAGS = {'td', 'th'}
+
+CELL_SEPARATOR = '\t'
+
+
+def _alternation(names: Iterable[str]) -> str:
+    """
+    A regex group matching any of names, factored by common prefixes: re tries
+    a flat alternation branch by branch at every '<', which dominated parsing.
+    """
+    groups: dict[str, list[str]] = {}
+    for name in names:
+        groups.setdefault(name[0], []).append(name[1:])
+    branches = []
+    for first, rests in sorted(groups.items()):
+        longer = [rest for rest in rests if rest]
+        if longer:
+            branches.append(first + _alternation(longer) + ('?' if '' in rests else ''))
+        else:
+            branches.append(first)
+    return '(?:' + '|'.join(branches) + ')'
+
+
+_NAME_END = r'(?![A-Za-z0-9:-])'
+
+# Control characters stand in for line breaks (block tags), cell starts (until
+# entities are decoded) and removed comments / skipped elements, across which
+# no tag or entity may form. They are removed from the input.
+_LINE_MARK = '\x01'
+_CELL_MARK = '\x02'
+_GAP_MARK = '\x03'
+_MARKS = re.compile('[\x01-\x03]')
+
+# A comment opener or the start tag of a SKIP_TAGS element, the only tokens
+# handled one by one; searched in a lowercased copy of the buffer. Tag patterns
+# never cross '<', so a stray '<' is left as text.
+_SPECIAL = re.compile(r'<(?:!--|(' + _alternation(SKIP_TAGS) + r')' + _NAME_END + r'[^<>]*>)')
+_SPECIAL_ANY_CASE = re.compile(_SPECIAL.pattern, re.IGNORECASE | re.ASCII)
+
+# Everything else is converted in bulk with these (IGNORECASE, ASCII only like
+# tag names, is used only when a name has capitals: it makes matching slower)
+_BLOCK_TAG = re.compile(r'</?' + _alternation(BLOCK_TAGS) + _NAME_END + r'[^<>\x01-\x03]*>')
+_BLOCK_TAG_ANY_CASE = re.compile(_BLOCK_TAG.pattern, re.IGNORECASE | re.ASCII)
+_UPPERCASE_TAG = re.compile(r'</?[A-Za-z0-9:-]*[A-Z]')
+_CELL_START = re.compile(r'<' + _alternation(CELL_TAGS) + _NAME_END + r'[^<>\x01-\x03]*>', re.IGNORECASE | re.ASCII)
+_INLINE_TAG = re.compile(r'<(?:/?[A-Za-z]|[!?])[^<>\x01-\x03]*>')
+# A row whose first cell follows other text (the cell then gets no separator)
+_TEXT_BEFORE_CELL = re.compile('(\x01[^\x01\x02]*[^\\s\x01\x02][^\x01\x02]*)\x02')
+
+# Whitespace (as in str.split()) other than the space and the cell separator
+_OTHER_WHITESPACE = re.compile(r'[^\S\t ]')
+
+# Closing tags of SKIP_TAGS may be split across chunks; keep this many chars
+_CLOSE_TAG_RESERVE = 16
+
+
+def _collapse_spaces(text: str) -> str:
+    """Collapse whitespace to single spaces, dropping it around cell separators."""
+    text = _OTHER_WHITESPACE.sub(' ', text)
+    while '  ' in text:
+        text = text.replace('  ', ' ')
+    return text.replace(' ' + CELL_SEPARATOR, CELL_SEPARATOR).replace(CELL_SEPARATOR + ' ', CELL_SEPARATOR)
+
+
+class HTMLTextExtractor:
+    """
+    Incremental HTML tokenizer that collects visible text line by line.
+
+    Call feed() with successive chunks, then close(); the text is available
+    from text(). Whitespace inside a line is collapsed, empty lines are
+    dropped and table cells are joined with tabs. Only an incomplete trailing
+    tag is carried over between chunks.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._lines: list[str] = []
+        self._line: list[str] = []    # Fragments of the current line
+        self._skip_end = None         # Pattern closing the current SKIP_TAGS element
+        self._row_has_cell = False
+
+    def feed(self, data: str):
+        if _MARKS.search(data):
+            data = _MARKS.sub('', data)
+        self._buffer += data
+        self._parse(final=False)
+
+    def close(self):
+        self._parse(final=True)
+        self._end_line()
+
+    def text(self) -> str:
+        return '\n'.join(self._lines)
+
+    def _parse(self, final: bool):
+        buf = self._buffer
+        n = len(buf)
+        pos = 0
+        scan, special = buf.lower(), _SPECIAL
+        if len(scan) != n:  # Lowercasing changed offsets (dotted capital I), search the original
+            scan, special = buf, _SPECIAL_ANY_CASE
+        parts = []  # Markup outside comments and skipped elements
+
+        while pos < n:
+            if self._skip_end is not None:
+                m = self._skip_end.search(buf, pos)
+                if m is None:
+                    pos = n if final else max(pos, n - _CLOSE_TAG_RESERVE)
+                    break
+                pos = m.end()
+                self._skip_end = None
+                continue
+
+            m = special.search(scan, pos)
+            if m is None:
+                end = n if final else self._safe_end(buf, pos)
+                parts.append(buf[pos:end])
+                pos = end
+                break
+
+            parts.append(buf[pos:m.start()])
+            parts.append(_GAP_MARK)
+            if m.group(1):
+                pos = m.end()
+                if buf[pos - 2] != '/':
+                    self._skip_end = re.compile(rf'</{m.group(1)}\s*>', re.IGNORECASE)
+            else:
+                end = buf.find('-->', m.start() + 4)
+                if end < 0:
+                    pos = n if final else m.start()
+                    break
+                pos = end + 3
+
+        self._buffer = buf[pos:]
+        self._add_markup(''.join(parts))
+
+    @staticmethod
+    def _safe_end(buf: str, pos: int) -> int:
+        """
+        End of the text that can be emitted before more data arrives: a tag
+        or an entity cut off by the chunk boundary is held back.
+        """
+        end = len(buf)
+        lt = buf.rfind('<', pos)
+        if lt >= 0 and '>' not in buf[lt:]:
+            end = lt
+        amp = buf.rfind('&', max(pos, end - 32), end)
+        if amp >= 0 and ';' not in buf[amp:end]:
+            end = amp
+            lt = buf.rfind('<', pos, end)
+            if lt >= 0 and '>' not in buf[lt:end]:
+                end = lt  # The entity is inside a tag
+        return end
+
+    def _add_markup(self, markup: str):
+        """Convert markup without comments or skipped elements and add its lines."""
+        if '<' in markup:
+            block = _BLOCK_TAG_ANY_CASE if _UPPERCASE_TAG.search(markup) else _BLOCK_TAG
+            markup = _INLINE_TAG.sub('', _CELL_START.sub(_CELL_MARK, block.sub(_LINE_MARK, markup)))
+        if _GAP_MARK in markup:
+            markup = markup.replace(_GAP_MARK, '')
+        if '&' in markup:
+            markup = unescape(markup)
+        markup = markup.replace(CELL_SEPARATOR, ' ')
+
+        line_end = markup.find(_LINE_MARK)
+        if line_end < 0:
+            line_end = len(markup)
+            row_has_cell = self._row_has_cell or _CELL_MARK in markup
+        else:
+            row_has_cell = _CELL_MARK in markup[markup.rfind(_LINE_MARK) + 1:]
+
+        if _CELL_MARK in markup:
+            # The first cell of a row gets no separator. Only where text
+            # precedes it does that differ from a separator stripped with the
+            # line start, and the current line may hold earlier text.
+            if not self._row_has_cell:
+                first = markup.find(_CELL_MARK, 0, line_end)
+                if first >= 0:
+                    markup = markup[:first] + markup[first + 1:]
+            markup = _TEXT_BEFORE_CELL.sub(r'\1', markup)
+            markup = markup.replace(_CELL_MARK, CELL_SEPARATOR)
+
+        lines = _collapse_spaces(markup).split(_LINE_MARK)
+        if lines[0]:
+            self._line.append(lines[0])
+        if len(lines) > 1:
+            self._end_line()
+            self._lines.extend(filter(None, [line.strip() for line in lines[1:-1]]))
+            if lines[-1]:
+                self._line.append(lines[-1])
+        self._row_has_cell = row_has_cell
+
+    def _end_line(self):
+        if self._line:
+            line = _collapse_spaces(''.join(self._line)).strip()
+            if line:
+                self._lines.append(line)
+            self._line = []
+        self._row_has_cell = False
+
+
+def html_to_text(chunks: Iterable[str]) -> str:
+    """Convert HTML, given as an iterable of string chunks, to plain text."""
+    extractor = HTMLTextExtractor()
+    for chunk in chunks:
+        extractor.feed(chunk)
+    extractor.close()
+    return extractor.text()
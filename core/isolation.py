@@ -0,0 +1,199 @@
+"""
+Parse Isolation
+
+Runs document parsers in separate worker processes with a wall-clock
+timeout and a resident memory cap. A malformed PDF that makes pypdf spin or
+balloon then only costs its own worker, which is killed and replaced, and
+the document comes back as a read error instead of stalling or crashing the
+batch (or the Flask thread running it).
+"""
+
+import os
+import time
+import threading
+import multiprocessing
+from dataclasses import dataclass
+from typing import Optional
+
+from .logging_config import get_logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = get_logger("isolation")
+
+POLL_INTERVAL = 0.05  # Seconds between timeout / memory checks
+MEMORY_EXIT_CODE = 75  # Worker exit status after hitting its address space limit
+
+
+@dataclass
+class IsolationLimits:
+    """Limits for a single document parse in an isolated worker."""
+    timeout: float = 120.0      # Wall-clock seconds per document
+    max_rss_mb: int = 2048      # Resident memory of the worker process
+
+
+class ParseIsolationError(Exception):
+    """Raised when an isolated parse is killed or its worker dies."""
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _limit_memory(max_bytes: int):
+    """
+    Cap the worker's address space, so allocations beyond the limit fail
+    (MemoryError) even between the parent's RSS polls.
+    """
+    if resource is None:
+        return
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            max_bytes = min(max_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, hard))
+    except (ValueError, OSError) as e:  # Not supported on e.g. macOS
+        logger.debug(f"Could not set parser memory limit: {e}")
+
+
+def _worker_main(conn, options: dict, max_bytes: int):
+    """Worker process loop: read documents sent over the pipe until told to stop."""
+    from .document_reader import DocumentReader
+
+    _limit_memory(max_bytes)
+
+    reader = DocumentReader(**options)
+    while True:
+        try:
+            request = conn.recv()
+            if request is None:
+                break
+            path, data = request
+            result = reader.read(path) if data is None else reader.read_bytes(data, path)
+            conn.send(result)
+        except EOFError:
+            break
+        except MemoryError:
+            os._exit(MEMORY_EXIT_CODE)
+
+
+class _Worker:
+    """A parser process and the parent's end of its pipe."""
+
+    def __init__(self, context, options: dict, max_bytes: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, options, max_bytes), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class IsolatedParserPool:
+    """
+    Hands documents to worker processes, one document per worker at a time.
+
+    Workers are started on demand (so concurrent callers each get their own)
+    and reused across documents. A worker that exceeds the limits or dies is
+    discarded and ParseIsolationError is raised for that document.
+
+    The memory cap is enforced in the worker with RLIMIT_AS where available;
+    the parent also polls the worker's RSS (Linux /proc) as a fallback.
+    """
+
+    def __init__(self, options: dict, limits: IsolationLimits):
+        self.options = options
+        self.limits = limits
+        # Forking a process that runs Flask or logging threads can deadlock
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._rss_warned = False
+
+    def read(self, path: str, data: Optional[bytes] = None):
+        """
+        Parse a file (or in-memory data) in a worker.
+
+        Returns:
+            The worker's DocumentContent
+
+        Raises:
+            ParseIsolationError: If the parse timed out, exceeded the memory
+                cap or crashed its worker
+        """
+        with self._lock:
+            worker = self._idle.pop() if self._idle else None
+        if worker is None or not worker.process.is_alive():
+            worker = _Worker(self._context, self.options, self.limits.max_rss_mb * 1024 * 1024)
+
+        try:
+            result = self._run(worker, path, data)
+        except ParseIsolationError:
+            worker.kill()
+            raise
+
+        with self._lock:
+            self._idle.append(worker)
+        return result
+
+    def _run(self, worker: _Worker, path: str, data: Optional[bytes]):
+        max_rss = self.limits.max_rss_mb * 1024 * 1024
+        try:
+            worker.conn.send((path, data))
+        except OSError as e:
+            raise self._crash_error(worker, f"Parser process unavailable: {e}")
+
+        deadline = time.monotonic() + self.limits.timeout
+        while not worker.conn.poll(POLL_INTERVAL):
+            if not worker.process.is_alive():
+                raise self._crash_error(worker, f"Parser process crashed (exit code {worker.process.exitcode})")
+            if time.monotonic() > deadline:
+                raise ParseIsolationError(f"Parsing timed out after {self.limits.timeout:g}s")
+            rss = _rss_bytes(worker.process.pid)
+            if rss is None and not self._rss_warned:
+                self._rss_warned = True
+                logger.warning("Cannot read parser memory usage; relying on the address space limit only")
+            if rss is not None and rss > max_rss:
+                raise ParseIsolationError(f"Parser exceeded memory limit of {self.limits.max_rss_mb} MB")
+
+        try:
+            return worker.conn.recv()
+        except (EOFError, OSError) as e:
+            raise self._crash_error(worker, f"Parser process crashed: {e}")
+
+    def _crash_error(self, worker: _Worker, message: str) -> ParseIsolationError:
+        """The error for a worker that went away, telling memory limit exits apart."""
+        worker.process.join(timeout=1)
+        if worker.process.exitcode == MEMORY_EXIT_CODE:
+            message = f"Parser exceeded memory limit of {self.limits.max_rss_mb} MB"
+        return ParseIsolationError(message)
+
+    def close(self):
+        """Stop all idle workers."""
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.stop()
@@ -0,0 +1,116 @@
+"""
+Streaming JSON Parsing
+
+Incremental scanner for the extraction response while it is being
+generated. It tracks just enough JSON structure (nesting, strings, escapes)
+to find where each element of a top-level array closes, and returns those
+elements as soon as they are complete, so nodes can be created long before
+the whole response has arrived. Top-level string values (document_type,
+document_summary) are captured as they complete as well.
+"""
+
+import json
+import re
+from typing import Optional
+
+# Some LLMs emit invalid \u escapes; see RequirementExtractor._parse_json
+_INVALID_UNICODE_ESCAPE = re.compile(r'\\u(?![0-9a-fA-F]{4})')
+
+
+def _loads(text: str):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(_INVALID_UNICODE_ESCAPE.sub(r'\\\\u', text))
+
+
+class JSONArrayStream:
+    """
+    Feed a JSON object in fragments; get back the elements of one of its
+    top-level arrays (``array_key``) as they complete.
+
+    The scanner is linear in the response length: every character is
+    looked at once, and each element is decoded once when it closes.
+    """
+
+    def __init__(self, array_key: str = "items"):
+        self.array_key = array_key
+        self.values: dict[str, str] = {}  # Completed top-level string values
+        self.count = 0                    # Array elements completed so far
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None   # Key of the top-level value being read
+        self._expect_value = False
+        self._in_array = False            # Inside the array_key array
+        self._capture: Optional[list[str]] = None  # Text of the element or top-level string being read
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        if len(self._parts) > 1:
+            self._parts = [''.join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def feed(self, fragment: str) -> list:
+        """
+        Add a fragment of the response.
+
+        Returns:
+            The array elements completed by this fragment (possibly none)
+
+        Raises:
+            json.JSONDecodeError: If a completed element is not valid JSON
+        """
+        self._parts.append(fragment)
+        completed = []
+        capture_from = 0 if self._capture is not None else None
+
+        for i, char in enumerate(fragment):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._capture.append(fragment[capture_from:i + 1])
+                        value = _loads(''.join(self._capture))
+                        self._capture = capture_from = None
+                        if self._expect_value:
+                            self.values[self._key] = value
+                            self._expect_value = False
+                        else:
+                            self._last_string = value
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._capture, capture_from = [], i
+            elif char == ':' and self._depth == 1:
+                self._key = self._last_string
+                self._expect_value = True
+            elif char == ',' and self._depth == 1:
+                self._expect_value = False
+            elif char in '{[':
+                if self._depth == 1:
+                    self._in_array = char == '[' and self._key == self.array_key
+                    self._expect_value = False
+                elif self._depth == 2 and self._in_array:
+                    self._capture, capture_from = [], i
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 2 and self._in_array and self._capture is not None:
+                    self._capture.append(fragment[capture_from:i + 1])
+                    completed.append(_loads(''.join(self._capture)))
+                    self._capture = capture_from = None
+                    self.count += 1
+                elif self._depth == 1:
+                    self._in_array = False
+
+        if self._capture is not None:
+            self._capture.append(fragment[capture_from:])
+        return completed
@@ -0,0 +1,151 @@
+"""
+LLM Response Cache
+
+Persistent cache of LLM responses, so re-running an extraction (--full, a
+restart after a crash, the same tender in another environment) does not pay
+for identical calls again.
+
+Entries are keyed by the SHA-256 of the complete request (model, messages,
+response schema) plus a schema version, so any change to the prompt, the
+document text, the model or the schema is a miss. Entries expire after a
+TTL, and the cache is bounded in size, evicting the least recently used
+entries first. The directory can be shared between projects and processes;
+entries are written atomically.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .logging_config import get_logger
+
+logger = get_logger("llm_cache")
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+DEFAULT_TTL = 30 * 24 * 3600           # 30 days
+
+
+class LLMCache:
+    """
+    On-disk cache of LLM response texts.
+
+    Only responses that parsed successfully should be stored. Call flush()
+    after a batch to enforce the size limit and log the hit rate.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = DEFAULT_TTL
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl = ttl  # Seconds; None keeps entries until evicted for size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Initialized LLMCache at {self.cache_dir} (max {max_bytes} bytes, ttl {ttl}s)")
+
+    @staticmethod
+    def key(request: dict, version: str = "") -> str:
+        """Hash of a chat.completions.create request and a schema version."""
+        payload = json.dumps({"version": version, "request": request}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, request: dict, version: str = "") -> Optional[str]:
+        """Look up the cached response text for a request, or None on a miss."""
+        entry_path = self._entry_path(self.key(request, version))
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping corrupt LLM cache entry {entry_path.name}: {e}")
+            entry_path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        if self.ttl is not None and time.time() - entry.get("created", 0) > self.ttl:
+            logger.debug(f"LLM cache entry {entry_path.name} expired")
+            entry_path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self._count(hit=True)
+        return entry["content"]
+
+    def put(self, request: dict, content: str, version: str = ""):
+        """Store the response text for a request."""
+        entry_path = self._entry_path(self.key(request, version))
+        entry_path.parent.mkdir(exist_ok=True)
+        # Unique temp name: other threads or processes may write the same entry
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "created": time.time(),
+                "model": request.get("model"),
+                "content": content,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, entry_path)
+
+    def flush(self):
+        """Evict expired and excess entries and log the hit rate."""
+        self.evict()
+        logger.info(f"LLM cache: {self.hits} hits, {self.misses} misses")
+
+    def evict(self) -> int:
+        """Delete expired entries, then least recently used ones until the cache fits max_bytes."""
+        now = time.time()
+        entries = []
+        total = 0
+        removed = 0
+        for entry_path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue  # Removed by another process
+            # The mtime is refreshed on every hit; expiry is checked against it
+            # here only to skip reading every entry's creation time
+            if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total += stat.st_size
+
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, entry_path in entries:
+                if total <= self.max_bytes:
+                    break
+                entry_path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} LLM cache entries ({total} bytes remain)")
+        return removed
@@ -0,0 +1,191 @@
+"""
+Text Normalization
+
+Cleans extracted document text before it is sent to the LLM. PDF text in
+particular repeats the same header and footer on every page, carries page
+numbers and splits words at line-end hyphens; all of that costs tokens and
+counts against the extractor's content limit without adding information.
+"""
+
+import re
+import math
+import dataclasses
+from typing import Optional
+
+from .document_reader import DocumentContent
+from .logging_config import get_logger
+
+logger = get_logger("normalize")
+
+# Page separators written by DocumentReader._read_pdf
+PAGE_MARKER = re.compile(r'^--- Page \d+ ---$', re.MULTILINE)
+
+EDGE_LINES = 3          # Lines at the top and bottom of a page checked for headers/footers
+MIN_PAGES = 3           # Documents with fewer pages keep their headers
+REPEAT_RATIO = 0.5      # A header/footer must appear on at least this share of pages
+
+_PAGE_NUMBER = re.compile(
+    r'(?:seite|page|s\.)?\s*[-–]?\s*\d{1,4}\s*(?:(?:von|of|/)\s*\d{1,4})?\s*[-–]?',
+    re.IGNORECASE
+)
+_DIGITS = re.compile(r'\d+')
+_PAGE_WORD = re.compile(r'\b(?:seite|page|blatt)\b', re.IGNORECASE)
+
+# "Ausschrei-\nbung" -> "Ausschreibung", but keep "Hoch-\nund Tiefbau"
+_HYPHENATION = re.compile(
+    r'([A-Za-zÄÖÜäöüß])-\n[ \t]*(?!(?:und|oder|bzw|sowie|als|bis)\b)([a-zäöüß])'
+)
+_SPACES = re.compile(r'[ \u00a0]{2,}')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def _line_key(line: str) -> str:
+    """
+    Comparison key for header/footer lines: spacing is ignored, and numbers
+    too in lines that mention the page (``Stand 03/2026 - Seite 3 von 12``).
+    Other lines must repeat exactly, so body text that differs only in
+    numbers is never taken for a header.
+    """
+    key = ' '.join(line.split()).lower()
+    return _DIGITS.sub('#', key) if _PAGE_WORD.search(key) else key
+
+
+def _edge_lines(lines: list[str]) -> list[list[int]]:
+    """
+    Indexes of the first and of the last few non-empty lines of a page, each
+    list ordered from the page edge inwards.
+    """
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    return [filled[:EDGE_LINES], filled[::-1][:EDGE_LINES]]
+
+
+def _page_number(line: str) -> Optional[int]:
+    """The number in a line that consists of just a page number, else None."""
+    match = _PAGE_NUMBER.fullmatch(line.strip())
+    return int(_DIGITS.search(match.group(0)).group(0)) if match else None
+
+
+def _split_pages(text: str) -> tuple[str, list[tuple[str, list[str]]]]:
+    """Split text into the part before the first page marker and (marker, lines) pages."""
+    markers = list(PAGE_MARKER.finditer(text))
+    if not markers:
+        return text, []
+    pages = []
+    for i, marker in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        pages.append((marker.group(0), text[marker.end():end].split('\n')))
+    return text[:markers[0].start()], pages
+
+
+def remove_page_furniture(text: str) -> tuple[str, int]:
+    """
+    Drop headers, footers and page numbers from paged text.
+
+    A line at the top or bottom of a page is removed when the same line
+    (see _line_key) sits at the same position from the same page edge on at
+    least REPEAT_RATIO of the pages, or when it is the outermost line and
+    just a page number that follows the page sequence. Removal stops at the
+    first line from each edge that is neither.
+
+    Returns:
+        Tuple of (text, number of lines removed)
+    """
+    preamble, pages = _split_pages(text)
+    if len(pages) < MIN_PAGES:
+        return text, 0
+
+    edges = [_edge_lines(lines) for _, lines in pages]
+    threshold = max(2, math.ceil(len(pages) * REPEAT_RATIO))
+
+    # Headers/footers repeat at the same distance from the same page edge
+    counts: dict[tuple[int, int, str], int] = {}
+    for (_, lines), page_edges in zip(pages, edges):
+        keys = {
+            (side, position, _line_key(lines[i]))
+            for side, indexes in enumerate(page_edges)
+            for position, i in enumerate(indexes)
+        }
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+    repeated = {key for key, count in counts.items() if count >= threshold}
+
+    # Page numbers are the outermost line and follow the page sequence
+    # (a constant offset allows for unnumbered cover pages)
+    offsets: dict[int, int] = {}
+    for page, ((_, lines), page_edges) in enumerate(zip(pages, edges)):
+        numbers = {_page_number(lines[indexes[0]]) for indexes in page_edges if indexes}
+        for number in numbers - {None}:
+            offsets[number - page] = offsets.get(number - page, 0) + 1
+    offset = max(offsets, key=offsets.get, default=None)
+    if offset is not None and offsets[offset] < threshold:
+        offset = None
+
+    removed = 0
+    parts = [preamble] if preamble.strip() else []
+    for page, ((marker, lines), page_edges) in enumerate(zip(pages, edges)):
+        drop = set()
+        for side, indexes in enumerate(page_edges):
+            # Strip inwards from the edge, stopping at the first content line
+            for position, i in enumerate(indexes):
+                is_number = position == 0 and offset is not None and _page_number(lines[i]) == page + offset
+                if not is_number and (side, position, _line_key(lines[i])) not in repeated:
+                    break
+                drop.add(i)
+        removed += len(drop)
+        body = '\n'.join(line for i, line in enumerate(lines) if i not in drop)
+        parts.append(f"{marker}\n{body.strip()}")
+
+    return '\n\n'.join(parts), removed
+
+
+def normalize_text(text: str) -> tuple[str, int]:
+    """
+    Normalize extracted text for the LLM.
+
+    Removes repeated page headers/footers and page numbers, joins words
+    hyphenated across line breaks, collapses runs of spaces (tabs are kept,
+    they separate table cells) and limits blank lines to one.
+
+    Returns:
+        Tuple of (text, number of header/footer lines removed)
+    """
+    text, removed = remove_page_furniture(text)
+    text = _HYPHENATION.sub(r'\1\2', text)
+    text = '\n'.join(_SPACES.sub(' ', line).rstrip() for line in text.split('\n'))
+    text = _BLANK_LINES.sub('\n\n', text)
+    return text.strip(), removed
+
+
+def normalize_document(document: DocumentContent) -> DocumentContent:
+    """
+    Return a normalized copy of a document.
+
+    The characters saved are recorded in metadata["normalization"]. Failed
+    reads and GAEB documents (extracted from their structure) are returned
+    unchanged.
+    """
+    if not document.is_successful or "gaeb" in document.metadata:
+        return document
+
+    text, lines_removed = normalize_text(document.text)
+    stats = {
+        "chars_before": len(document.text),
+        "chars_after": len(text),
+        "chars_saved": len(document.text) - len(text),
+        "lines_removed": lines_removed,
+    }
+    logger.debug(f"Normalized {document.filename}: {stats['chars_saved']} chars saved "
+                 f"({lines_removed} header/footer lines)")
+    return dataclasses.replace(document, text=text, metadata={**document.metadata, "normalization": stats})
+
+
+def normalize_documents(documents: list[DocumentContent]) -> list[DocumentContent]:
+    """Normalize a batch of documents and log the total characters saved."""
+    normalized = [normalize_document(doc) for doc in documents]
+
+    before = sum(doc.metadata.get("normalization", {}).get("chars_before", 0) for doc in normalized)
+    saved = sum(doc.metadata.get("normalization", {}).get("chars_saved", 0) for doc in normalized)
+    if before:
+        logger.info(f"Normalization saved {saved} of {before} chars ({saved / before:.1%})")
+    return normalized
+
@@ -0,0 +1,102 @@
+"""
+Document Packing
+
+Groups small documents (one-page Formblätter, declarations) so several are
+extracted in a single LLM request, and splits the combined response back
+into one extraction per document. Each call has a fixed cost in latency and
+prompt instructions; for documents of a few hundred characters that cost
+dominates.
+"""
+
+from typing import Callable
+
+from .document_reader import DocumentContent
+from .logging_config import get_logger
+
+logger = get_logger("packing")
+
+SMALL_DOCUMENT_CHARS = 4000   # Only documents up to this length are packed
+PACK_MAX_TOKENS = 6000        # Budget for the document contents of one packed request
+PACK_MAX_DOCUMENTS = 12       # Keeps the combined response well within output limits
+CHARS_PER_TOKEN = 4           # Rough estimate for German text
+
+
+def document_id(index: int) -> str:
+    """Id of the index-th document of a pack, as used in the prompt and response."""
+    return f"D{index + 1}"
+
+
+def plan_batches(
+    documents: list[DocumentContent],
+    packable: Callable[[DocumentContent], bool],
+    max_tokens: int = PACK_MAX_TOKENS,
+    max_documents: int = PACK_MAX_DOCUMENTS
+) -> list[list[int]]:
+    """
+    Group document indexes into extraction batches.
+
+    Packable documents are collected into packs of at most max_documents
+    and max_tokens (estimated from the text length); every other document
+    is a batch of its own. Batches are ordered by their first document, so
+    the grouping is deterministic for a given input order.
+
+    Returns:
+        List of batches, each a list of indexes into ``documents``
+    """
+    batches: list[list[int]] = []
+    pack: list[int] = []
+    pack_tokens = 0
+
+    for i, document in enumerate(documents):
+        if not packable(document):
+            batches.append([i])
+            continue
+        tokens = len(document.text) // CHARS_PER_TOKEN + 1
+        if not pack or len(pack) >= max_documents or pack_tokens + tokens > max_tokens:
+            pack = []
+            pack_tokens = 0
+            batches.append(pack)
+        pack.append(i)
+        pack_tokens += tokens
+
+    packs = [batch for batch in batches if len(batch) > 1]
+    if packs:
+        packed = sum(len(batch) for batch in packs)
+        logger.info(f"Packed {packed} small documents into {len(packs)} requests")
+    return batches
+
+
+def split_packed_extraction(extraction: dict, count: int) -> list[dict]:
+    """
+    Split a packed response into one extraction per document.
+
+    Items and relationships are assigned by their document_id; entries with
+    an unknown id are dropped.
+
+    Returns:
+        ``count`` extractions in the single-document response format
+    """
+    ids = [document_id(i) for i in range(count)]
+    documents = {d.get("document_id"): d for d in extraction.get("documents", [])}
+    parts = {
+        doc_id: {
+            "document_summary": documents.get(doc_id, {}).get("document_summary", ""),
+            "document_type": documents.get(doc_id, {}).get("document_type", "other"),
+            "items": [],
+            "relationships": [],
+        }
+        for doc_id in ids
+    }
+
+    dropped = 0
+    for key in ("items", "relationships"):
+        for entry in extraction.get(key, []):
+            part = parts.get(entry.get("document_id"))
+            if part is None:
+                dropped += 1
+                continue
+            part[key].append({k: v for k, v in entry.items() if k != "document_id"})
+
+    if dropped:
+        logger.warning(f"Dropped {dropped} packed items/relationships without a valid document_id")
+    return [parts[doc_id] for doc_id in ids]
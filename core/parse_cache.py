@@ -0,0 +1,217 @@
+"""
+Parse Cache
+
+Persistent, content-addressed cache of extracted document text.
+
+Entries are keyed by the SHA-256 of the file bytes (plus extension and parser
+version), so renamed or copied files hit the same entry. A small path index
+remembers each file's size, mtime and hash, which lets unchanged files skip
+hashing as well as parsing. The cache is bounded in size and evicts the least
+recently used entries first.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from .logging_config import get_logger
+
+logger = get_logger("parse_cache")
+
+# Bump whenever a reader changes its output, so stale entries are ignored
+PARSER_VERSION = 7
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+
+
+def hash_file(path: str) -> Optional[dict]:
+    """Size, mtime and SHA-256 of a file as stored in the path index, or None if unreadable."""
+    try:
+        stat = os.stat(path)
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    except OSError:
+        return None
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest.hexdigest(),
+    }
+
+
+class ParseCache:
+    """
+    On-disk cache of DocumentReader results.
+
+    Only successful reads are cached. Call flush() after a batch to persist
+    the path index and enforce the size limit.
+    """
+
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, load_index: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / "entries"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._index_path = self.cache_dir / self.INDEX_FILENAME
+        self._index: dict[str, dict] = {}  # abs path -> {size, mtime_ns, sha256}
+        self._dirty = False
+
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        if load_index:  # Parser workers only look up entries by hash
+            self._load_index()
+        logger.debug(f"Initialized ParseCache at {self.cache_dir} (max {max_bytes} bytes)")
+
+    def _load_index(self):
+        if not self._index_path.exists():
+            return
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache index: {e}")
+            self._index = {}
+
+    def known_fingerprint(self, path: str) -> Optional[str]:
+        """The stored content hash for a file if its size and mtime are unchanged (never hashes)."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        known = self._index.get(path)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return known["sha256"]
+        return None
+
+    def remember(self, path: str, fingerprint: dict):
+        """Record a fingerprint computed elsewhere (see hash_file) in the path index."""
+        self._index[path] = fingerprint
+        self._dirty = True
+
+    def fingerprint(self, path: str) -> Optional[str]:
+        """
+        Return the content hash for a file, reusing the stored hash when the
+        file's size and mtime are unchanged.
+        """
+        known = self.known_fingerprint(path)
+        if known is not None:
+            return known
+
+        fingerprint = hash_file(path)
+        if fingerprint is None:
+            return None
+        self.remember(path, fingerprint)
+        return fingerprint["sha256"]
+
+    def record(self, hit: bool):
+        """Count a lookup made on this cache's behalf (e.g. by a parser worker)."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def _entry_path(self, content_hash: str, extension: str, variant: str = "") -> Path:
+        key = f"{content_hash}{extension}.v{PARSER_VERSION}"
+        if variant:
+            # Non-default parser options produce different text for the same bytes
+            key += "." + hashlib.sha256(variant.encode()).hexdigest()[:12]
+        return self.entries_dir / content_hash[:2] / f"{key}.json"
+
+    def get(self, path: str, extension: str, variant: str = "") -> Optional[dict]:
+        """Look up the cached parse result for a file, or None on a miss."""
+        content_hash = self.fingerprint(path)
+        if content_hash is None:
+            return None
+        entry = self.get_by_hash(content_hash, extension, variant)
+        self.record(hit=entry is not None)
+        return entry
+
+    def get_by_hash(self, content_hash: str, extension: str, variant: str = "") -> Optional[dict]:
+        """Look up the cached parse result for a content hash (not counted in hits/misses)."""
+        entry_path = self._entry_path(content_hash, extension, variant)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping corrupt parse cache entry {entry_path.name}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass  # Evicted meanwhile by another process
+        return entry
+
+    def put(
+        self,
+        path: str,
+        extension: str,
+        text: str,
+        metadata: dict,
+        extraction_method: str,
+        variant: str = ""
+    ):
+        """Store a successful parse result for a file."""
+        content_hash = self.fingerprint(path)
+        if content_hash is None:
+            return
+
+        entry_path = self._entry_path(content_hash, extension, variant)
+        entry_path.parent.mkdir(exist_ok=True)
+        tmp_path = entry_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "text": text,
+                "metadata": metadata,
+                "extraction_method": extraction_method,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, entry_path)
+
+    def flush(self):
+        """Persist the path index and evict entries beyond the size limit."""
+        if self._dirty:
+            # Forget files that no longer exist
+            self._index = {p: fp for p, fp in self._index.items() if os.path.exists(p)}
+            tmp_path = self._index_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
+
+        self.evict()
+        logger.info(f"Parse cache: {self.hits} hits, {self.misses} misses")
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for entry_path in self.entries_dir.glob("*/*.json"):
+            stat = entry_path.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        entries.sort()
+        removed = 0
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        logger.info(f"Evicted {removed} parse cache entries ({total} bytes remain)")
+        return removed
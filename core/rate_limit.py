@@ -0,0 +1,287 @@
+"""
+LLM Rate Limiting
+
+Client-side token buckets for requests/min and tokens/min, kept in a SQLite
+file so every thread and process calling the API with the same key draws
+from the same budget. Rate-limit response headers and Retry-After pause all
+callers until the provider's window resets, and each 429 halves the
+effective rate, which then recovers gradually with successful calls, so
+throughput settles just under the provider limit instead of alternating
+between bursts and 429s.
+"""
+
+import re
+import time
+import sqlite3
+import asyncio
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .logging_config import get_logger
+
+logger = get_logger("rate_limit")
+
+CHARS_PER_TOKEN = 4         # Rough token estimate for prompts
+BURST_SECONDS = 10.0        # Bucket capacity: this many seconds' worth of the rate
+MIN_FACTOR = 0.1            # Lowest share of the configured rate after repeated 429s
+RECOVERY_STEP = 0.05        # Rate share regained per successful call
+DEFAULT_RETRY_AFTER = 1.0   # Pause after a 429 without a Retry-After header
+
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@dataclass
+class RateLimits:
+    """Provider limits for one API key (None = unlimited)."""
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _parse_seconds(value: str) -> Optional[float]:
+    """
+    Seconds until a reset given as seconds, a duration ("1m30s", "250ms"),
+    a Unix timestamp in seconds or milliseconds, or an HTTP date.
+    """
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+
+    if number is not None:
+        if number > 1e12:   # Epoch milliseconds (OpenRouter X-RateLimit-Reset)
+            return max(0.0, number / 1000 - time.time())
+        if number > 1e9:    # Epoch seconds
+            return max(0.0, number - time.time())
+        return max(0.0, number)
+
+    parts = _DURATION.findall(value)
+    if parts and ''.join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """Retry-After (or retry-after-ms) from response headers, in seconds."""
+    if headers is None:
+        return None
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    return _parse_seconds(value) if value is not None else None
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter whose state lives in a SQLite file.
+
+    Call acquire() (or acquire_async()) before each request with the
+    estimated tokens, then record_usage() with the actual usage and
+    on_success() / on_rate_limited() depending on the outcome.
+    """
+
+    def __init__(self, path: str, limits: Optional[RateLimits] = None, name: str = "default"):
+        self.path = path
+        self.limits = limits or RateLimits()
+        self.name = name  # Buckets are per name, e.g. per API key
+        self._local = threading.local()
+        # Latest pause set through this limiter; with no limits configured
+        # the file is only consulted while such a pause lasts
+        self._blocked_until = 0.0
+        # The file is only opened on first use, so commands that never call
+        # the LLM never touch it
+        logger.debug(f"Initialized RateLimiter at {path} ({self.limits})")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit ("
+                "name TEXT PRIMARY KEY, requests REAL, tokens REAL, updated REAL, "
+                "blocked_until REAL, factor REAL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """A write transaction; BEGIN IMMEDIATE serializes concurrent callers."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _load(self, conn: sqlite3.Connection, now: float) -> list:
+        """Current [requests, tokens, blocked_until, factor], refilled up to now."""
+        row = conn.execute(
+            "SELECT requests, tokens, updated, blocked_until, factor FROM rate_limit WHERE name = ?",
+            (self.name,)
+        ).fetchone()
+        if row is None:
+            return [self._capacity(self.limits.requests_per_minute, 1.0),
+                    self._capacity(self.limits.tokens_per_minute, 1.0), 0.0, 1.0]
+
+        requests, tokens, updated, blocked_until, factor = row
+        elapsed = max(0.0, now - updated)
+        requests = self._refill(requests, self.limits.requests_per_minute, factor, elapsed)
+        tokens = self._refill(tokens, self.limits.tokens_per_minute, factor, elapsed)
+        return [requests, tokens, blocked_until, factor]
+
+    def _store(self, conn: sqlite3.Connection, now: float, state: list):
+        conn.execute(
+            "INSERT OR REPLACE INTO rate_limit (name, requests, tokens, updated, blocked_until, factor) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self.name, state[0], state[1], now, state[2], state[3])
+        )
+
+    @staticmethod
+    def _capacity(per_minute: Optional[float], factor: float) -> float:
+        if per_minute is None:
+            return 0.0
+        return max(1.0, per_minute * factor * BURST_SECONDS / 60)
+
+    def _refill(self, level: float, per_minute: Optional[float], factor: float, elapsed: float) -> float:
+        if per_minute is None:
+            return 0.0
+        return min(self._capacity(per_minute, factor), level + elapsed * per_minute * factor / 60)
+
+    def _wait_for(self, level: float, needed: float, per_minute: Optional[float], factor: float) -> float:
+        """Seconds until a bucket holds ``needed`` (capped at its capacity, so large requests can pass)."""
+        if per_minute is None:
+            return 0.0
+        needed = min(needed, self._capacity(per_minute, factor))
+        return max(0.0, (needed - level) / (per_minute * factor / 60))
+
+    def _unthrottled(self, now: float) -> bool:
+        """Whether no limit is configured and no pause is in effect, so nothing needs the file."""
+        return (self.limits.requests_per_minute is None
+                and self.limits.tokens_per_minute is None
+                and now >= self._blocked_until)
+
+    def try_acquire(self, tokens: int = 0) -> float:
+        """
+        Take one request and ``tokens`` tokens from the buckets if available.
+
+        Returns:
+            0 if granted, otherwise the seconds to wait before trying again
+        """
+        now = time.time()
+        if self._unthrottled(now):
+            return 0.0
+        with self._transaction() as conn:
+            state = self._load(conn, now)
+            requests, token_level, blocked_until, factor = state
+            wait = max(
+                blocked_until - now,
+                self._wait_for(requests, 1, self.limits.requests_per_minute, factor),
+                self._wait_for(token_level, tokens, self.limits.tokens_per_minute, factor),
+            )
+            if wait <= 0:
+                if self.limits.requests_per_minute is not None:
+                    state[0] -= 1
+                if self.limits.tokens_per_minute is not None:
+                    state[1] -= tokens  # May go negative for requests larger than the burst
+            self._store(conn, now, state)
+        return max(0.0, wait)
+
+    def acquire(self, tokens: int = 0):
+        """Block until a request of ``tokens`` estimated tokens may be sent."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limit: waiting {wait:.2f}s")
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int = 0):
+        """acquire() for coroutines: waits without blocking the event loop."""
+        while True:
+            if self._unthrottled(time.time()):
+                return
+            # try_acquire blocks on the SQLite write lock, so run it off the loop
+            wait = await asyncio.to_thread(self.try_acquire, tokens)
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limit: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+    def record_usage(self, estimated: int, actual: Optional[int]):
+        """Correct the token bucket by the difference between estimated and actual usage."""
+        if actual is None or self.limits.tokens_per_minute is None:
+            return
+        now = time.time()
+        with self._transaction() as conn:
+            state = self._load(conn, now)
+            state[1] -= actual - estimated
+            self._store(conn, now, state)
+
+    def on_success(self):
+        """Regain part of the rate after a successful call."""
+        now = time.time()
+        with self._transaction() as conn:
+            state = self._load(conn, now)
+            if state[3] >= 1.0:
+                return
+            state[3] = min(1.0, state[3] + RECOVERY_STEP)
+            self._store(conn, now, state)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """Pause all callers until Retry-After and halve the effective rate."""
+        now = time.time()
+        pause = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+        with self._transaction() as conn:
+            state = self._load(conn, now)
+            state[2] = max(state[2], now + pause)
+            state[3] = max(MIN_FACTOR, state[3] / 2)
+            self._store(conn, now, state)
+        self._blocked_until = max(self._blocked_until, state[2])
+        logger.warning(f"Rate limited: pausing LLM requests for {pause:.1f}s, rate reduced to {state[3]:.0%}")
+
+    def update_from_headers(self, headers):
+        """Pause until the window resets when rate-limit headers report nothing remaining."""
+        if headers is None:
+            return
+        for remaining_key, reset_key in (
+            ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+            ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+            ("x-ratelimit-remaining", "x-ratelimit-reset"),
+        ):
+            remaining = headers.get(remaining_key)
+            reset = headers.get(reset_key)
+            if remaining is None or reset is None:
+                continue
+            try:
+                exhausted = float(remaining) <= 0
+            except ValueError:
+                continue
+            seconds = _parse_seconds(reset)
+            if exhausted and seconds:
+                now = time.time()
+                with self._transaction() as conn:
+                    state = self._load(conn, now)
+                    state[2] = max(state[2], now + seconds)
+                    self._store(conn, now, state)
+                self._blocked_until = max(self._blocked_until, state[2])
+                logger.info(f"Rate limit window exhausted: pausing LLM requests for {seconds:.1f}s")
@@ -0,0 +1,195 @@
+"""
+Directory Watcher
+
+Watches a tender directory for added, modified and deleted files so new
+clarifications (Bieterfragen) and revised forms can be ingested as they
+arrive. Uses inotify through the optional watchdog package when available
+and falls back to polling otherwise.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger("watcher")
+
+# (size, mtime_ns) per file
+Snapshot = dict[str, tuple[int, int]]
+
+
+@dataclass
+class FileChanges:
+    """Files that changed between two snapshots of a directory."""
+    added: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> list[str]:
+        """Files whose current content needs to be read."""
+        return self.added + self.modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
+
+
+def _is_ignored(relative_path: str) -> bool:
+    """Hidden files and directories (incl. .tender_state) and Office lock files."""
+    parts = relative_path.replace('\\', '/').split('/')
+    return any(part.startswith('.') for part in parts) or parts[-1].startswith('~$')
+
+
+class DirectoryWatcher:
+    """
+    Reports batches of file changes in a directory tree.
+
+    Changes are debounced: after the first change is noticed, the watcher
+    waits until the directory has been quiet for ``debounce`` seconds (so a
+    ZIP being copied or a form being saved is reported once, complete) and
+    then yields a single FileChanges batch.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        debounce: float = 2.0,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+        ignore: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Args:
+            directory: Directory to watch (recursively)
+            debounce: Quiet period in seconds before a batch is reported
+            poll_interval: Seconds between scans when polling
+            use_inotify: Use watchdog's native observer if installed
+            ignore: Predicate on paths relative to directory; defaults to
+                skipping hidden files and Office lock files
+        """
+        self.directory = Path(directory).resolve()
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.ignore = ignore or _is_ignored
+        self._stop = threading.Event()
+        self._event = threading.Event()  # Set by the native observer on any relevant event
+
+    def stop(self):
+        """Stop a running watch() loop."""
+        self._stop.set()
+        self._event.set()
+
+    def snapshot(self) -> Snapshot:
+        """Size and mtime of every watched file."""
+        snapshot = {}
+        for root, dirs, files in os.walk(self.directory):
+            relative_root = os.path.relpath(root, self.directory)
+            dirs[:] = [d for d in dirs if not self.ignore(os.path.normpath(os.path.join(relative_root, d)))]
+            for name in files:
+                if self.ignore(os.path.normpath(os.path.join(relative_root, name))):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # Deleted while scanning
+                snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    @staticmethod
+    def diff(old: Snapshot, new: Snapshot) -> FileChanges:
+        """Compare two snapshots."""
+        changes = FileChanges()
+        for path, signature in new.items():
+            if path not in old:
+                changes.added.append(path)
+            elif old[path] != signature:
+                changes.modified.append(path)
+        changes.deleted = [path for path in old if path not in new]
+        return changes
+
+    def _start_observer(self):
+        """Start watchdog's native observer, or return None to poll instead."""
+        if not self.use_inotify:
+            return None
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            logger.info("watchdog not installed, polling for changes")
+            return None
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Moves carry both ends: editors that save via a temp file
+                # and rename only touch the watched name in dest_path
+                for path in (event.src_path, getattr(event, "dest_path", None)):
+                    if not path:
+                        continue
+                    relative = os.path.relpath(path, watcher.directory)
+                    if not watcher.ignore(relative):
+                        watcher._event.set()
+                        return
+
+        observer = Observer()
+        observer.schedule(Handler(), str(self.directory), recursive=True)
+        observer.start()
+        logger.info(f"Watching {self.directory} with {type(observer).__name__}")
+        return observer
+
+    def _settle(self) -> Snapshot:
+        """Wait until no file has changed for one debounce period."""
+        current = self.snapshot()
+        while not self._stop.wait(self.debounce):
+            latest = self.snapshot()
+            if latest == current:
+                break
+            current = latest
+        return current
+
+    def watch(self) -> Iterator[FileChanges]:
+        """
+        Yield a FileChanges batch for every burst of changes until stop() is
+        called. Files present when watching starts are not reported.
+        """
+        self._stop.clear()
+        observer = self._start_observer()
+        if observer is None:
+            logger.info(f"Polling {self.directory} every {self.poll_interval}s")
+
+        last = self.snapshot()
+        try:
+            while not self._stop.is_set():
+                if observer is not None:
+                    if not self._event.wait(self.poll_interval):
+                        continue
+                    self._event.clear()
+                else:
+                    if self._stop.wait(self.poll_interval) or self.snapshot() == last:
+                        continue
+
+                start_time = time.perf_counter()
+                current = self._settle()
+                if self._stop.is_set():
+                    break
+                self._event.clear()
+
+                changes = self.diff(last, current)
+                last = current
+                if changes:
+                    logger.info(
+                        f"Detected {len(changes.added)} added, {len(changes.modified)} modified, "
+                        f"{len(changes.deleted)} deleted files (settled in {time.perf_counter() - start_time:.1f}s)"
+                    )
+                    yield changes
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
@@ -6,6 +6,7 @@ Main application that processes tender documents and manages requirements.
 
 import os
 import sys
+import time
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -14,11 +15,22 @@ from typing import Optional
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from ai.llm import openai_client
+from ai.llm import (
+    openai_client, create_async_openai_client, create_rate_limiter,
+    LLM_CONCURRENCY, LLM_STREAM, LLM_CACHE_DIR, LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE
+)
 from core.logging_config import setup_logging, get_logger
 from core.graph import RequirementGraph, CompletionStatus
-from core.document_reader import DocumentReader, read_all_documents
+from core.document_reader import DocumentReader
+from core.parse_cache import ParseCache
+from core.llm_cache import LLMCache
+from core.isolation import IsolationLimits
 from core.extractor import RequirementExtractor, IncrementalExtractor
+from core.extraction_engine import AsyncExtractionEngine
+from core.dedup import deduplicate_documents
+from core.normalize import normalize_documents
+from core.archive_reader import is_archive
+from core.watcher import DirectoryWatcher, FileChanges
 from core.todo import TodoGenerator
 
 logger = get_logger("manager")
@@ -34,9 +46,27 @@ class TenderProject:
     - A to-do list derived from the graph
     """
 
-    def __init__(self, tender_directory: str, project_name: Optional[str] = None):
+    def __init__(
+        self,
+        tender_directory: str,
+        project_name: Optional[str] = None,
+        workers: Optional[int] = 1,
+        use_cache: bool = True,
+        reader_options: Optional[dict] = None,
+        normalize: bool = True,
+        concurrency: int = LLM_CONCURRENCY,
+        chunked: bool = True,
+        use_llm_cache: bool = True,
+        pack: bool = True,
+        requests_per_minute: Optional[float] = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: Optional[float] = LLM_TOKENS_PER_MINUTE,
+        stream: bool = LLM_STREAM
+    ):
         self.tender_directory = Path(tender_directory).resolve()
         self.project_name = project_name or self.tender_directory.name
+        self.workers = workers  # Parser processes for document reading (None = all cores)
+        self.normalize = normalize  # Strip headers/footers etc. before LLM extraction
+        self.concurrency = concurrency  # Concurrent LLM requests during extraction
 
         logger.info(f"Initializing TenderProject: {self.project_name}")
         logger.debug(f"Tender directory: {self.tender_directory}")
@@ -51,9 +81,25 @@ class TenderProject:
 
         # Initialize components
         logger.debug("Initializing components...")
-        self.reader = DocumentReader()
-        self.extractor = RequirementExtractor(openai_client)
+        self.parse_cache = ParseCache(str(self.state_dir / "parse_cache")) if use_cache else None
+        self.reader = DocumentReader(cache=self.parse_cache, **(reader_options or {}))
+        self.llm_cache = LLMCache(LLM_CACHE_DIR or str(self.state_dir / "llm_cache")) if use_llm_cache else None
+        self.rate_limiter = create_rate_limiter(requests_per_minute, tokens_per_minute)
+        self.extractor = RequirementExtractor(
+            openai_client,
+            chunked=chunked,
+            cache=self.llm_cache,
+            pack=pack,
+            rate_limiter=self.rate_limiter,
+            stream=stream,
+            node_callback=self._log_node,
+            root=str(self.tender_directory)
+        )
         self.incremental = IncrementalExtractor(self.extractor)
+        self.engine = AsyncExtractionEngine(
+            self.extractor, create_async_openai_client, concurrency=concurrency,
+            item_callback=self._log_item
+        ) if concurrency > 1 else None
 
         # Load or create graph
         if self.graph_path.exists():
@@ -64,6 +110,14 @@ class TenderProject:
             logger.info("Creating new requirement graph")
             self.graph = RequirementGraph()
 
+    def _log_node(self, node):
+        """Report a node as soon as extraction adds it to the graph."""
+        logger.info(f"  + {node.type.value}: {node.title}")
+
+    def _log_item(self, document_name: str, item: dict):
+        """Report an item streamed by the concurrent engine (added to the graph later)."""
+        logger.info(f"  + {document_name}: {item.get('item_type', 'requirement')}: {item.get('title', '')}")
+
     def extract_archives(self) -> list[str]:
         """Extract any ZIP archives in the tender directory."""
         logger.info("Checking for ZIP archives to extract...")
@@ -80,12 +134,13 @@ class TenderProject:
         """Scan all documents in the tender directory."""
         logger.info(f"Scanning documents in {self.tender_directory}")
 
-        # First extract any archives
-        self.extract_archives()
-
-        # Read all documents
+        # Read all documents; ZIP archives are read in memory, not extracted
         logger.debug("Reading all documents...")
-        documents = read_all_documents(str(self.tender_directory), extract_archives=True)
+        documents = self.reader.read_directory(
+            str(self.tender_directory),
+            workers=self.workers,
+            archives=True
+        )
 
         successful = [d for d in documents if d.is_successful]
         failed = [d for d in documents if not d.is_successful]
@@ -126,6 +181,11 @@ class TenderProject:
         documents = [d for d in documents if d.is_successful]
         logger.debug(f"Filtered to {len(documents)} successful documents (from {all_count})")
 
+        # Extract each group of identical documents only once
+        documents = deduplicate_documents(documents)
+        if self.normalize:
+            documents = normalize_documents(documents)
+
         if not documents:
             logger.warning("No documents to process")
             return []
@@ -137,10 +197,10 @@ class TenderProject:
 
         if incremental:
             logger.debug("Using incremental extraction")
-            results = self.incremental.process_new_or_changed(documents, self.graph)
+            results = self.incremental.process_new_or_changed(documents, self.graph, engine=self.engine)
         else:
             logger.debug("Using full extraction")
-            self.graph, results = self.extractor.process_directory(
+            self.graph, results = (self.engine or self.extractor).process_directory(
                 documents,
                 self.graph,
                 progress_callback=progress
@@ -148,6 +208,8 @@ class TenderProject:
 
         # Save the graph
         self.save()
+        if self.llm_cache is not None:
+            self.llm_cache.flush()
 
         # Summary
         nodes_created = sum(len(r.nodes_created) for r in results)
@@ -162,6 +224,145 @@ class TenderProject:
 
         return results
 
+    def apply_changes(self, changes: FileChanges) -> list:
+        """
+        Update the graph in place for changed files.
+
+        Nodes from deleted files are removed; added and modified files are
+        re-read and re-extracted, replacing their previous nodes. Nodes from
+        archive members are handled per archive, and nodes shared with an
+        identical copy are kept for that copy (see _release_aliases).
+
+        Returns:
+            List of ExtractionResult objects
+        """
+        self._release_aliases(set(changes.deleted) | set(changes.changed))
+        for path in changes.deleted:
+            removed = self._remove_document(path)
+            logger.info(f"Removed {Path(path).name} ({removed} nodes)")
+
+        paths = [p for p in changes.changed if self.reader.should_read(p, archives=True)]
+        documents = self.reader.read_many([p for p in paths if not is_archive(p)], workers=self.workers)
+        for archive_path in filter(is_archive, paths):
+            members = self.reader.read_archive(archive_path, workers=self.workers)
+            # Drop nodes of members that are no longer in the archive
+            member_paths = {doc.path for doc in members}
+            for document_path in self._archive_member_paths(archive_path) - member_paths:
+                self.incremental.remove_document(document_path, self.graph)
+            documents.extend(members)
+
+        for doc in documents:
+            if not doc.is_successful:
+                logger.warning(f"Failed to read {doc.filename}: {doc.error}")
+        documents = deduplicate_documents([d for d in documents if d.is_successful])
+        if self.normalize:
+            documents = normalize_documents(documents)
+
+        results = []
+        if documents:
+            logger.info(f"Re-extracting {len(documents)} changed documents...")
+            results = self.incremental.process_new_or_changed(
+                documents, self.graph, replace_existing=True, engine=self.engine
+            )
+        if results or changes.deleted:
+            self.save()
+        if results and self.llm_cache is not None:
+            self.llm_cache.flush()
+        return results
+
+    def _archive_member_paths(self, archive_path: str) -> set[str]:
+        """Source paths of graph nodes that came from members of an archive."""
+        prefix = archive_path + "/"
+        return {
+            n.source_document for n in self.graph.nodes.values()
+            if n.source_document and n.source_document.startswith(prefix)
+        }
+
+    def _release_aliases(self, paths: set[str]):
+        """
+        Detach deleted or modified files from the duplicate copies they stand for.
+
+        Identical copies are extracted once and listed in the nodes'
+        source_aliases. If the extracted copy goes away, its nodes are handed
+        to a surviving alias instead of being removed; a file that is itself an
+        alias is dropped from its original's source_aliases, so it can be
+        re-extracted on its own.
+        """
+        def affected(path: str) -> bool:
+            return path in paths or any(path.startswith(p + "/") for p in paths)
+
+        moved = {}  # old source path -> alias that took over its nodes
+        for node in self.graph.nodes.values():
+            aliases = node.metadata.get("source_aliases")
+            if not aliases:
+                continue
+            kept = [a for a in aliases if not affected(a)]
+            if node.source_document and affected(node.source_document):
+                surviving = [a for a in kept if self._path_exists(a)]
+                if surviving:
+                    moved[node.source_document] = surviving[0]
+                    node.source_document = surviving[0]
+                    kept.remove(surviving[0])
+            if kept:
+                node.metadata["source_aliases"] = kept
+            else:
+                del node.metadata["source_aliases"]
+
+        for old_path, alias in moved.items():
+            content_hash = self.incremental.document_hashes.pop(old_path, None)
+            if content_hash is not None:
+                self.incremental.document_hashes[alias] = content_hash
+            logger.info(f"Kept nodes of {Path(old_path).name} for identical copy {Path(alias).name}")
+
+    def _path_exists(self, path: str) -> bool:
+        """Whether a document path still exists (archive members: their archive)."""
+        if os.path.exists(path):
+            return True
+        parent = Path(path).parent
+        while parent != parent.parent:
+            if is_archive(str(parent)):
+                return parent.is_file()
+            parent = parent.parent
+        return False
+
+    def _remove_document(self, path: str) -> int:
+        """Remove all nodes extracted from a file (or from an archive's members)."""
+        removed = self.incremental.remove_document(path, self.graph)
+        if is_archive(path):
+            for document_path in self._archive_member_paths(path):
+                removed += self.incremental.remove_document(document_path, self.graph)
+        return removed
+
+    def watch(self, debounce: float = 2.0, poll_interval: float = 1.0, use_inotify: bool = True):
+        """
+        Watch the tender directory and keep the graph up to date until
+        interrupted with Ctrl+C.
+
+        Only files that change while watching are re-read and re-extracted;
+        run process_documents() first to analyze the existing documents.
+        """
+        watcher = DirectoryWatcher(
+            str(self.tender_directory),
+            debounce=debounce,
+            poll_interval=poll_interval,
+            use_inotify=use_inotify
+        )
+        print(f"Watching {self.tender_directory} for changes (Ctrl+C to stop)...")
+
+        try:
+            for changes in watcher.watch():
+                start_time = time.perf_counter()
+                results = self.apply_changes(changes)
+                nodes_created = sum(len(r.nodes_created) for r in results)
+                print(
+                    f"[{datetime.now():%H:%M:%S}] {len(changes.changed)} changed, "
+                    f"{len(changes.deleted)} deleted -> {nodes_created} nodes extracted "
+                    f"in {time.perf_counter() - start_time:.1f}s"
+                )
+        except KeyboardInterrupt:
+            watcher.stop()
+            print("Stopped watching.")
+
     def save(self):
         """Save the current state."""
         logger.debug(f"Saving graph to {self.graph_path}")
@@ -284,6 +485,7 @@ def main():
 Examples:
   %(prog)s path/to/tender --scan        Scan and list all documents
   %(prog)s path/to/tender --process     Process documents with AI
+  %(prog)s path/to/tender --watch       Re-extract documents as they change
   %(prog)s path/to/tender --todo        Show to-do list
   %(prog)s path/to/tender --critical    Show critical items only
   %(prog)s path/to/tender --export      Export to-do as markdown
@@ -299,6 +501,42 @@ Examples:
     parser.add_argument("--export", action="store_true", help="Export to-do as markdown")
     parser.add_argument("--complete", type=str, help="Mark an item as complete")
     parser.add_argument("--summary", action="store_true", help="Show project summary")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parallel document parser processes (0 = one per CPU core)")
+    parser.add_argument("--concurrency", type=int, default=LLM_CONCURRENCY,
+                        help="Concurrent LLM requests during extraction (1 = one document at a time)")
+    parser.add_argument("--rpm", type=float, default=LLM_REQUESTS_PER_MINUTE,
+                        help="LLM requests per minute allowed for the API key (shared by all processes)")
+    parser.add_argument("--tpm", type=float, default=LLM_TOKENS_PER_MINUTE,
+                        help="LLM tokens per minute allowed for the API key (shared by all processes)")
+    parser.add_argument("--truncate", action="store_true",
+                        help="Truncate long documents for the LLM instead of extracting them in chunks")
+    parser.add_argument("--no-pack", action="store_true",
+                        help="Send every small document in its own LLM request")
+    parser.add_argument("--no-stream", action="store_true",
+                        help="Wait for complete LLM responses instead of streaming extracted items")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse all documents instead of using the parse cache")
+    parser.add_argument("--no-llm-cache", action="store_true",
+                        help="Call the LLM even for requests answered before")
+    parser.add_argument("--xlsx-max-rows", type=int,
+                        help="Read at most this many rows per spreadsheet sheet")
+    parser.add_argument("--xlsx-sheets", nargs="+", metavar="PATTERN",
+                        help="Only read spreadsheet sheets matching these names/glob patterns")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Parse each document in a subprocess with a timeout and memory cap")
+    parser.add_argument("--parse-timeout", type=float, default=120.0,
+                        help="Seconds allowed per document with --isolate")
+    parser.add_argument("--max-parse-memory", type=int, default=2048, metavar="MB",
+                        help="Memory allowed per parser process with --isolate")
+    parser.add_argument("--no-normalize", action="store_true",
+                        help="Send document text to the LLM without removing headers, footers and hyphenation")
+    parser.add_argument("--watch", action="store_true",
+                        help="Watch the directory and re-extract files as they change")
+    parser.add_argument("--debounce", type=float, default=2.0,
+                        help="Seconds without changes before --watch processes a batch")
+    parser.add_argument("--poll", action="store_true",
+                        help="Poll for changes in --watch mode instead of using inotify")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
@@ -321,7 +559,27 @@ Examples:
     logger.info(f"Starting Tender Manager (log_level={log_level})")
     logger.debug(f"Arguments: {args}")
 
-    project = TenderProject(args.directory)
+    project = TenderProject(
+        args.directory,
+        workers=args.workers or None,
+        use_cache=not args.no_cache,
+        reader_options={
+            "xlsx_max_rows": args.xlsx_max_rows,
+            "xlsx_sheets": args.xlsx_sheets,
+            "isolation": IsolationLimits(
+                timeout=args.parse_timeout,
+                max_rss_mb=args.max_parse_memory
+            ) if args.isolate else None,
+        },
+        normalize=not args.no_normalize,
+        concurrency=args.concurrency,
+        chunked=not args.truncate,
+        use_llm_cache=not args.no_llm_cache,
+        pack=not args.no_pack,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        stream=LLM_STREAM and not args.no_stream
+    )
 
     if args.scan:
         project.scan_documents()
@@ -329,6 +587,11 @@ Examples:
     elif args.process:
         project.process_documents(incremental=not args.full)
         project.print_summary()
+        if args.watch:
+            project.watch(debounce=args.debounce, use_inotify=not args.poll)
+
+    elif args.watch:
+        project.watch(debounce=args.debounce, use_inotify=not args.poll)
 
     elif args.complete:
         project.mark_complete(args.complete)
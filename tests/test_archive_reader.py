@@ -0,0 +1,59 @@
+"""Tests for in-memory archive reading."""
+
+import io
+import zipfile
+
+from core.archive_reader import ArchiveMemberError, iter_archive_members
+from core.document_reader import DocumentReader
+
+
+def _mark_encrypted(data: bytes, name: str) -> bytes:
+    """Set the encryption flag on a member, as a password-protected ZIP would."""
+    name_bytes = name.encode()
+    out = bytearray(data)
+    # Local file header: flag bits at offset 6, file name at offset 30
+    local = out.find(b"PK\x03\x04")
+    while local != -1:
+        if out[local + 30:local + 30 + len(name_bytes)] == name_bytes:
+            out[local + 6] |= 0x01
+        local = out.find(b"PK\x03\x04", local + 4)
+    # Central directory header: flag bits at offset 8, file name at offset 46
+    central = out.find(b"PK\x01\x02")
+    while central != -1:
+        if out[central + 46:central + 46 + len(name_bytes)] == name_bytes:
+            out[central + 8] |= 0x01
+        central = out.find(b"PK\x01\x02", central + 4)
+    return bytes(out)
+
+
+def _archive_with_encrypted_member() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("offen.txt", "Leistungsverzeichnis")
+        z.writestr("geheim.txt", "Kalkulation")
+        z.writestr("anhang.txt", "Baubeschreibung")
+    return _mark_encrypted(buffer.getvalue(), "geheim.txt")
+
+
+def test_iter_archive_members_yields_error_for_encrypted_member():
+    members = dict(iter_archive_members(io.BytesIO(_archive_with_encrypted_member()), "bundle.zip"))
+
+    assert members["bundle.zip/offen.txt"] == b"Leistungsverzeichnis"
+    assert members["bundle.zip/anhang.txt"] == b"Baubeschreibung"
+    assert isinstance(members["bundle.zip/geheim.txt"], ArchiveMemberError)
+
+
+def test_read_archive_reports_encrypted_member_and_keeps_the_rest(tmp_path):
+    archive = tmp_path / "bundle.zip"
+    archive.write_bytes(_archive_with_encrypted_member())
+
+    documents = DocumentReader().read_archive(str(archive))
+    by_name = {doc.filename: doc for doc in documents}
+
+    assert set(by_name) == {"offen.txt", "geheim.txt", "anhang.txt"}
+    assert by_name["offen.txt"].error is None
+    assert by_name["offen.txt"].text == "Leistungsverzeichnis"
+    assert by_name["anhang.txt"].text == "Baubeschreibung"
+    assert by_name["geheim.txt"].error.startswith("Could not decompress archive member")
+    assert by_name["geheim.txt"].path == f"{archive}/geheim.txt"
+    assert by_name["geheim.txt"].metadata["archive"] == str(archive)